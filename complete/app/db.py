@@ -1,15 +1,58 @@
+import asyncio
+import os
+import re
 from pathlib import Path
+from urllib.parse import urlencode
 
-from tortoise import Tortoise
+from tortoise import Tortoise, connections
+from tortoise.utils import get_schema_sql
 
 BASE_DIR = Path(__file__).resolve().parent
 DB_PATH = BASE_DIR / "data" / "health.db"
-DB_URL = f"sqlite://{DB_PATH}"
+DB_URL = os.getenv("HEALTH_DB_URL", f"sqlite://{DB_PATH}")
 
+# HEALTH_DB_PROFILE로 고르고, HEALTH_SQLITE_<PRAGMA> 환경 변수로 항목별로 덮어씁니다.
+SQLITE_PROFILES = {
+    # SQLite 기본값: 롤백 저널, 커밋마다 fsync
+    "default": {"journal_mode": "DELETE", "synchronous": "FULL"},
+    # WAL에서는 synchronous=NORMAL이어도 커밋 순서와 무결성이 유지됩니다.
+    "tuned": {
+        "journal_mode": "WAL",
+        "synchronous": "NORMAL",
+        "busy_timeout": "5000",
+        "cache_size": "-65536",
+        "mmap_size": "268435456",
+        "temp_store": "MEMORY",
+    },
+}
+SQLITE_PRAGMAS = ("journal_mode", "synchronous", "busy_timeout", "cache_size", "mmap_size", "temp_store")
 
-async def init_db() -> None:
+INDEX_SQL_RE = re.compile(r'CREATE INDEX IF NOT EXISTS "(?P<name>[^"]+)"[^;]*;')
+
+
+def sqlite_pragmas() -> dict[str, str]:
+    profile = os.getenv("HEALTH_DB_PROFILE", "tuned")
+    if profile not in SQLITE_PROFILES:
+        raise ValueError(f"unknown HEALTH_DB_PROFILE {profile!r}; use one of {list(SQLITE_PROFILES)}")
+    pragmas = dict(SQLITE_PROFILES[profile])
+    for name in SQLITE_PRAGMAS:
+        value = os.getenv(f"HEALTH_SQLITE_{name.upper()}")
+        if value:
+            pragmas[name] = value
+    return pragmas
+
+
+def db_url() -> str:
+    """DB_URL에 SQLite PRAGMA 설정을 쿼리 문자열로 붙입니다 (Tortoise가 연결 시 적용)."""
+    if not DB_URL.startswith("sqlite://"):
+        return DB_URL
+    separator = "&" if "?" in DB_URL else "?"
+    return f"{DB_URL}{separator}{urlencode(sqlite_pragmas())}"
+
+
+async def init_db(generate_schemas: bool = True) -> None:
     await Tortoise.init(
-        db_url=DB_URL,
+        db_url=db_url(),
         modules={
             "models": [
                 "app.models.user",
@@ -20,8 +63,48 @@ async def init_db() -> None:
             ]
         },
     )
-    await Tortoise.generate_schemas()
+    if generate_schemas:
+        await Tortoise.generate_schemas()
+    from app.services.data_versions import install_version_tracking
+
+    await install_version_tracking()
 
 
 async def close_db() -> None:
     await Tortoise.close_connections()
+
+
+async def ensure_indexes() -> list[str]:
+    """모델 Meta.indexes에 선언된 인덱스 중 기존 DB에 없는 것을 만듭니다.
+
+    generate_schemas와 같은 SQL(같은 인덱스 이름)을 쓰므로 새 DB와 기존 DB의
+    인덱스가 일치합니다. 새로 만든 인덱스 이름 목록을 돌려줍니다.
+    """
+    conn = connections.get("default")
+    rows = await conn.execute_query_dict(
+        "SELECT name FROM sqlite_master WHERE type = 'index'"
+    )
+    existing = {row["name"] for row in rows}
+    created = []
+    for match in INDEX_SQL_RE.finditer(get_schema_sql(conn, safe=True)):
+        if match["name"] in existing:
+            continue
+        await conn.execute_script(match[0])
+        created.append(match["name"])
+    if created:
+        await conn.execute_script("ANALYZE;")
+    return created
+
+
+async def _migrate() -> None:
+    await init_db(generate_schemas=False)
+    try:
+        created = await ensure_indexes()
+    finally:
+        await close_db()
+    print("created: " + ", ".join(created) if created else "indexes up to date")
+
+
+if __name__ == "__main__":
+    # 기존 health.db에 인덱스 적용: python -m app.db
+    asyncio.run(_migrate())
@@ -1,21 +1,46 @@
+import os
 from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
 from fastapi.staticfiles import StaticFiles
 
 from app.db import close_db, init_db
-from app.routers import api, pages
+from app.routers import api, metrics, pages
+from app.services.metrics import MetricsMiddleware, install_query_hooks
+from app.services.query_budget import QueryBudgetMiddleware, query_enabled
+from app.services.report_pool import shutdown_report_pool, start_report_pool
+from app.services.templates import warm_templates
+from app.services.users import invalidate_default_user
+from app.services.write_queue import start_write_queue, stop_write_queue
+
+
+METRICS_ENABLED = os.getenv("HEALTH_METRICS", "1") != "0"
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
+    if METRICS_ENABLED or query_enabled():
+        install_query_hooks()
     await init_db()
+    invalidate_default_user()
+    warm_templates()
+    start_report_pool()
+    start_write_queue()
     yield
+    # 큐에 남은 입력을 모두 커밋한 뒤에 DB를 닫습니다.
+    await stop_write_queue()
+    shutdown_report_pool()
     await close_db()
 
 
 app = FastAPI(title="개인 건강관리", lifespan=lifespan)
+# add_middleware는 바깥쪽에 감싸므로, 쿼리 수 확인이 지표 미들웨어의 QueryStats를 같이 씁니다.
+if query_enabled():
+    app.add_middleware(QueryBudgetMiddleware)
+if METRICS_ENABLED:
+    app.add_middleware(MetricsMiddleware)
 app.mount("/static", StaticFiles(directory="app/static"), name="static")
 
 app.include_router(pages.router)
+app.include_router(metrics.router)
 app.include_router(api.router, prefix="/api", tags=["api"])
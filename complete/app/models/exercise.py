@@ -9,5 +9,8 @@ class ExerciseLog(models.Model):
     calories_burned = fields.IntField(null=True)
     logged_at = fields.DatetimeField(auto_now_add=True)
 
+    class Meta:
+        indexes = (("user", "logged_at"), ("logged_at",))
+
     def __str__(self) -> str:
         return f"{self.activity}({self.duration_min}m)"
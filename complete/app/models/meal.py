@@ -9,5 +9,8 @@ class MealLog(models.Model):
     note = fields.CharField(max_length=200, null=True)
     eaten_at = fields.DatetimeField(auto_now_add=True)
 
+    class Meta:
+        indexes = (("user", "eaten_at"), ("eaten_at",))
+
     def __str__(self) -> str:
         return f"{self.meal_type} - {self.calories}kcal"
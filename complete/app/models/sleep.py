@@ -9,5 +9,8 @@ class SleepLog(models.Model):
     end_time = fields.DatetimeField()
     quality = fields.IntField(null=True)
 
+    class Meta:
+        indexes = (("user", "sleep_date"), ("sleep_date",))
+
     def __str__(self) -> str:
         return f"{self.sleep_date} - q{self.quality}"
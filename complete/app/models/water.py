@@ -7,5 +7,8 @@ class WaterLog(models.Model):
     amount_ml = fields.IntField()
     logged_at = fields.DatetimeField(auto_now_add=True)
 
+    class Meta:
+        indexes = (("user", "logged_at"), ("logged_at",))
+
     def __str__(self) -> str:
         return f"{self.user_id} - {self.amount_ml}ml"
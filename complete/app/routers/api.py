@@ -1,44 +1,204 @@
-from fastapi import APIRouter
+from datetime import date, timedelta
+from typing import Literal
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel
+from pydantic_core import to_json
 
 from app.models.exercise import ExerciseLog
 from app.models.meal import MealLog
 from app.models.sleep import SleepLog
 from app.models.water import WaterLog
 from app.schemas import (
+    BatchMutationResult,
+    BatchSelect,
+    BulkResult,
+    ExerciseBatchUpdate,
     ExerciseCreate,
     ExerciseOut,
+    ExerciseUpdate,
+    MealBatchUpdate,
     MealCreate,
     MealOut,
+    MealUpdate,
+    SleepBatchUpdate,
     SleepCreate,
     SleepOut,
+    SleepUpdate,
+    TimeSeriesOut,
+    WaterBatchUpdate,
     WaterCreate,
     WaterOut,
+    WaterUpdate,
+)
+from app.services.bulk import bulk_insert, read_bulk_body
+from app.services.data_versions import data_version, etag_headers, make_etag, not_modified
+from app.services.downsample import downsample_points
+from app.services.export import export_csv, export_ndjson
+from app.services.log_kinds import LOG_KINDS
+from app.services.mutations import (
+    MAX_BATCH_IDS,
+    delete_log,
+    delete_logs,
+    nullable_fields,
+    update_log,
+    update_logs,
+)
+from app.services.pagination import PageParams, apply_page, split_page
+from app.services.query_budget import query_budget
+from app.services.report_data import (
+    METRICS,
+    Granularity,
+    ReportWindow,
+    bucket_count,
+    date_range,
+    report_series,
 )
+from app.services.write_queue import create_log
 
 router = APIRouter()
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+MAX_TIMESERIES_BUCKETS = 20_000
+
+
+def set_next_cursor(response: Response, next_cursor: str | None) -> None:
+    if next_cursor:
+        response.headers[NEXT_CURSOR_HEADER] = next_cursor
+
+
+async def list_page(kind: str, page: PageParams, request: Request | None = None) -> Response:
+    """목록 API 공통 빠른 경로.
+
+    모델 인스턴스를 만들지 않고 .values()로 응답 스키마의 컬럼만 dict로 읽어 한 번에
+    JSON으로 인코딩합니다. Response를 직접 돌려주므로 FastAPI의 response_model 재검증도
+    건너뜁니다. response_model은 문서(OpenAPI)용으로 그대로 둡니다.
+
+    ETag는 데이터 버전과 페이지 조건(limit, cursor, 기간)으로 만들고, 클라이언트의
+    If-None-Match와 같으면 버전 조회 한 번만으로 304를 돌려줍니다.
+    버전은 쿼리 전에 읽으므로, 그 사이 쓰기가 있어도 다음 요청에서 새로 받습니다.
+    """
+    spec = LOG_KINDS[kind]
+    etag = make_etag(
+        await data_version(spec.model, page.user_id), page.limit, page.cursor or "", page.from_ or "", page.to or ""
+    )
+    if request is not None and (cached := not_modified(request, etag)):
+        return cached
+    rows = await apply_page(spec.model.all(), spec.ts_field, page).values(*spec.columns)
+    rows, next_cursor = split_page(rows, spec.ts_field, page.limit)
+    response = Response(to_json(rows), media_type="application/json", headers=etag_headers(etag))
+    set_next_cursor(response, next_cursor)
+    return response
+
+
+async def handle_bulk(
+    request: Request, response: Response, kind: str, schema: type[BaseModel]
+) -> BulkResult:
+    result = await bulk_insert(LOG_KINDS[kind], schema, await read_bulk_body(request))
+    if result.failed and not result.inserted:
+        response.status_code = 422
+    return result
+
+
+def update_fields(kind: str, payload: BaseModel) -> dict:
+    """보낸 필드만 골라냅니다. 비었거나 NOT NULL 필드를 null로 바꾸려 하면 400/422."""
+    fields = payload.model_dump(exclude_unset=True)
+    if not fields:
+        raise HTTPException(status_code=400, detail="수정할 필드가 없습니다.")
+    nullable = nullable_fields(LOG_KINDS[kind])
+    not_null = sorted(name for name, value in fields.items() if value is None and name not in nullable)
+    if not_null:
+        raise HTTPException(status_code=422, detail=f"null로 바꿀 수 없는 필드입니다: {', '.join(not_null)}")
+    return fields
+
+
+def batch_selection(payload: BatchSelect) -> dict:
+    if payload.ids and len(payload.ids) > MAX_BATCH_IDS:
+        raise HTTPException(status_code=413, detail=f"ids는 한 번에 {MAX_BATCH_IDS}개까지입니다.")
+    if not payload.ids and payload.from_ is None and payload.to is None:
+        raise HTTPException(status_code=400, detail="ids나 기간(from/to) 중 하나는 있어야 합니다.")
+    return {"ids": payload.ids, "from_": payload.from_, "to": payload.to}
+
+
+async def handle_update(kind: str, log_id: int, user_id: int, payload: BaseModel) -> Response:
+    """보낸 필드만 UPDATE 한 문장으로 고칩니다. 바뀐 행이 없으면(없는 id, 다른 사용자) 404."""
+    if not await update_log(LOG_KINDS[kind], log_id, user_id, **update_fields(kind, payload)):
+        raise HTTPException(status_code=404, detail="기록을 찾을 수 없습니다.")
+    return Response(status_code=204)
+
+
+async def handle_delete(kind: str, log_id: int, user_id: int) -> Response:
+    if not await delete_log(LOG_KINDS[kind], log_id, user_id):
+        raise HTTPException(status_code=404, detail="기록을 찾을 수 없습니다.")
+    return Response(status_code=204)
+
+
+async def handle_batch_update(kind: str, payload: BatchSelect) -> BatchMutationResult:
+    """고른 기록을 changes대로 UPDATE 한 문장으로 고칩니다. 해당 기록이 없으면 affected=0."""
+    fields = update_fields(kind, payload.changes)
+    affected = await update_logs(LOG_KINDS[kind], payload.user_id, fields, **batch_selection(payload))
+    return BatchMutationResult(affected=affected)
+
+
+async def handle_batch_delete(kind: str, payload: BatchSelect) -> BatchMutationResult:
+    affected = await delete_logs(LOG_KINDS[kind], payload.user_id, **batch_selection(payload))
+    return BatchMutationResult(affected=affected)
 
 
 @router.get("/water", response_model=list[WaterOut])
-async def list_water():
-    logs = await WaterLog.all().order_by("-logged_at")
-    return [WaterOut.model_validate(log) for log in logs]
+@query_budget(2)
+async def list_water(request: Request, page: PageParams = Depends()):
+    return await list_page("water", page, request)
 
 
 @router.post("/water", response_model=WaterOut)
+@query_budget(1)
 async def create_water(payload: WaterCreate):
-    log = await WaterLog.create(user_id=payload.user_id, amount_ml=payload.amount_ml)
+    log = await create_log(WaterLog, user_id=payload.user_id, amount_ml=payload.amount_ml)
     return WaterOut.model_validate(log)
 
 
+@router.post("/water/bulk", response_model=BulkResult)
+@query_budget(2)
+async def bulk_create_water(request: Request, response: Response):
+    return await handle_bulk(request, response, "water", WaterCreate)
+
+
+@router.post("/water/batch-update", response_model=BatchMutationResult)
+@query_budget(1)
+async def batch_update_water(payload: WaterBatchUpdate):
+    return await handle_batch_update("water", payload)
+
+
+@router.post("/water/batch-delete", response_model=BatchMutationResult)
+@query_budget(1)
+async def batch_delete_water(payload: BatchSelect):
+    return await handle_batch_delete("water", payload)
+
+
+@router.patch("/water/{log_id}", status_code=204)
+@query_budget(1)
+async def update_water(log_id: int, user_id: int, payload: WaterUpdate):
+    return await handle_update("water", log_id, user_id, payload)
+
+
+@router.delete("/water/{log_id}", status_code=204)
+@query_budget(1)
+async def delete_water(log_id: int, user_id: int):
+    return await handle_delete("water", log_id, user_id)
+
+
 @router.get("/exercise", response_model=list[ExerciseOut])
-async def list_exercise():
-    logs = await ExerciseLog.all().order_by("-logged_at")
-    return [ExerciseOut.model_validate(log) for log in logs]
+@query_budget(2)
+async def list_exercise(request: Request, page: PageParams = Depends()):
+    return await list_page("exercise", page, request)
 
 
 @router.post("/exercise", response_model=ExerciseOut)
+@query_budget(1)
 async def create_exercise(payload: ExerciseCreate):
-    log = await ExerciseLog.create(
+    log = await create_log(
+        ExerciseLog,
         user_id=payload.user_id,
         activity=payload.activity,
         duration_min=payload.duration_min,
@@ -47,15 +207,47 @@ async def create_exercise(payload: ExerciseCreate):
     return ExerciseOut.model_validate(log)
 
 
+@router.post("/exercise/bulk", response_model=BulkResult)
+@query_budget(2)
+async def bulk_create_exercise(request: Request, response: Response):
+    return await handle_bulk(request, response, "exercise", ExerciseCreate)
+
+
+@router.post("/exercise/batch-update", response_model=BatchMutationResult)
+@query_budget(1)
+async def batch_update_exercise(payload: ExerciseBatchUpdate):
+    return await handle_batch_update("exercise", payload)
+
+
+@router.post("/exercise/batch-delete", response_model=BatchMutationResult)
+@query_budget(1)
+async def batch_delete_exercise(payload: BatchSelect):
+    return await handle_batch_delete("exercise", payload)
+
+
+@router.patch("/exercise/{log_id}", status_code=204)
+@query_budget(1)
+async def update_exercise(log_id: int, user_id: int, payload: ExerciseUpdate):
+    return await handle_update("exercise", log_id, user_id, payload)
+
+
+@router.delete("/exercise/{log_id}", status_code=204)
+@query_budget(1)
+async def delete_exercise(log_id: int, user_id: int):
+    return await handle_delete("exercise", log_id, user_id)
+
+
 @router.get("/sleep", response_model=list[SleepOut])
-async def list_sleep():
-    logs = await SleepLog.all().order_by("-sleep_date")
-    return [SleepOut.model_validate(log) for log in logs]
+@query_budget(2)
+async def list_sleep(request: Request, page: PageParams = Depends()):
+    return await list_page("sleep", page, request)
 
 
 @router.post("/sleep", response_model=SleepOut)
+@query_budget(1)
 async def create_sleep(payload: SleepCreate):
-    log = await SleepLog.create(
+    log = await create_log(
+        SleepLog,
         user_id=payload.user_id,
         sleep_date=payload.sleep_date,
         start_time=payload.start_time,
@@ -65,18 +257,137 @@ async def create_sleep(payload: SleepCreate):
     return SleepOut.model_validate(log)
 
 
+@router.post("/sleep/bulk", response_model=BulkResult)
+@query_budget(2)
+async def bulk_create_sleep(request: Request, response: Response):
+    return await handle_bulk(request, response, "sleep", SleepCreate)
+
+
+@router.post("/sleep/batch-update", response_model=BatchMutationResult)
+@query_budget(1)
+async def batch_update_sleep(payload: SleepBatchUpdate):
+    return await handle_batch_update("sleep", payload)
+
+
+@router.post("/sleep/batch-delete", response_model=BatchMutationResult)
+@query_budget(1)
+async def batch_delete_sleep(payload: BatchSelect):
+    return await handle_batch_delete("sleep", payload)
+
+
+@router.patch("/sleep/{log_id}", status_code=204)
+@query_budget(1)
+async def update_sleep(log_id: int, user_id: int, payload: SleepUpdate):
+    return await handle_update("sleep", log_id, user_id, payload)
+
+
+@router.delete("/sleep/{log_id}", status_code=204)
+@query_budget(1)
+async def delete_sleep(log_id: int, user_id: int):
+    return await handle_delete("sleep", log_id, user_id)
+
+
 @router.get("/meal", response_model=list[MealOut])
-async def list_meal():
-    logs = await MealLog.all().order_by("-eaten_at")
-    return [MealOut.model_validate(log) for log in logs]
+@query_budget(2)
+async def list_meal(request: Request, page: PageParams = Depends()):
+    return await list_page("meal", page, request)
 
 
 @router.post("/meal", response_model=MealOut)
+@query_budget(1)
 async def create_meal(payload: MealCreate):
-    log = await MealLog.create(
+    log = await create_log(
+        MealLog,
         user_id=payload.user_id,
         meal_type=payload.meal_type,
         calories=payload.calories,
         note=payload.note,
     )
     return MealOut.model_validate(log)
+
+
+@router.post("/meal/bulk", response_model=BulkResult)
+@query_budget(2)
+async def bulk_create_meal(request: Request, response: Response):
+    return await handle_bulk(request, response, "meal", MealCreate)
+
+
+@router.post("/meal/batch-update", response_model=BatchMutationResult)
+@query_budget(1)
+async def batch_update_meal(payload: MealBatchUpdate):
+    return await handle_batch_update("meal", payload)
+
+
+@router.post("/meal/batch-delete", response_model=BatchMutationResult)
+@query_budget(1)
+async def batch_delete_meal(payload: BatchSelect):
+    return await handle_batch_delete("meal", payload)
+
+
+@router.patch("/meal/{log_id}", status_code=204)
+@query_budget(1)
+async def update_meal(log_id: int, user_id: int, payload: MealUpdate):
+    return await handle_update("meal", log_id, user_id, payload)
+
+
+@router.delete("/meal/{log_id}", status_code=204)
+@query_budget(1)
+async def delete_meal(log_id: int, user_id: int):
+    return await handle_delete("meal", log_id, user_id)
+
+
+@router.get("/export")
+@query_budget(None)
+async def export_logs(
+    user_id: int,
+    kind: Literal["all", "water", "exercise", "sleep", "meal"] = "all",
+    format: Literal["ndjson", "csv"] = "ndjson",
+):
+    kinds = list(LOG_KINDS) if kind == "all" else [kind]
+    if format == "csv":
+        body, media_type = export_csv(kinds, user_id), "text/csv; charset=utf-8"
+    else:
+        body, media_type = export_ndjson(kinds, user_id), "application/x-ndjson"
+    filename = f"health-{user_id}-{kind}.{format}"
+    return StreamingResponse(
+        body,
+        media_type=media_type,
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
+
+
+@router.get("/timeseries/{metric}", response_model=TimeSeriesOut)
+@query_budget(2)
+async def timeseries(
+    request: Request,
+    response: Response,
+    metric: Literal["water", "exercise", "meal", "sleep"],
+    user_id: int,
+    from_: date | None = Query(None, alias="from"),
+    to: date | None = None,
+    granularity: Granularity = "day",
+    max_points: int = Query(500, ge=3, le=5000),
+):
+    start, end = date_range(from_, to)
+    if start >= end:
+        raise HTTPException(status_code=400, detail="from은 to보다 늦을 수 없습니다.")
+    buckets = bucket_count(start, end, granularity)
+    if buckets > MAX_TIMESERIES_BUCKETS:
+        raise HTTPException(status_code=400, detail="기간이 너무 깁니다. 더 굵은 granularity를 쓰세요.")
+    model = METRICS[metric].model
+    etag = make_etag("timeseries", await data_version(model, user_id), start, end, granularity, max_points)
+    if cached := not_modified(request, etag):
+        return cached
+    window = ReportWindow(start, end, granularity, 1)
+    points = downsample_points(await report_series(metric, user_id, window), max_points)
+    response.headers.update(etag_headers(etag))
+    return TimeSeriesOut(
+        metric=metric,
+        unit=METRICS[metric].unit,
+        granularity=granularity,
+        start=start,
+        end=end - timedelta(days=1),
+        buckets=buckets,
+        x=[day for day, _ in points],
+        y=[value for _, value in points],
+    )
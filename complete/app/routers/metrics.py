@@ -0,0 +1,13 @@
+from fastapi import APIRouter
+from fastapi.responses import PlainTextResponse
+
+from app.services.metrics import render_metrics
+from app.services.query_budget import query_budget
+
+router = APIRouter()
+
+
+@router.get("/metrics", include_in_schema=False)
+@query_budget(0)
+async def metrics():
+    return PlainTextResponse(render_metrics(), media_type="text/plain; version=0.0.4; charset=utf-8")
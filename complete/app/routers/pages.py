@@ -1,141 +1,251 @@
-from datetime import date, datetime
+import time
+from datetime import date, datetime, timedelta
 from pathlib import Path
+from typing import Literal
 
-from fastapi import APIRouter, Form, Request
-from fastapi.responses import RedirectResponse
-from fastapi.templating import Jinja2Templates
-import matplotlib
-import pandas as pd
-
-matplotlib.use("Agg")
-import matplotlib.pyplot as plt
+from fastapi import APIRouter, Form, HTTPException, Query, Request
+from fastapi.responses import FileResponse, RedirectResponse, Response
 
 from app.models.exercise import ExerciseLog
 from app.models.meal import MealLog
 from app.models.sleep import SleepLog
 from app.models.water import WaterLog
-from app.services.users import get_or_create_default_user
+from app.services.chart_cache import CHART_FILENAME_RE, chart_path, get_or_render, is_cached
+from app.services.charts import build_water_report
+from app.services.dashboard import get_dashboard_context
+from app.services.data_versions import data_version, etag_headers, log_stats, make_etag, not_modified, user_stats
+from app.services.log_kinds import LOG_KINDS
+from app.services.log_pages import MAX_PAGE_SIZE, PAGE_SIZE, read_page
+from app.services.metrics import CHART_RENDER, CHART_RENDER_FAILURES
+from app.services.mutations import MAX_BATCH_IDS, delete_log, delete_logs, update_log, update_logs
+from app.services.query_budget import query_budget
+from app.services.report_data import report_series, report_window, water_report_stats
+from app.services.report_pool import ReportBusyError, ReportTimeoutError, run_report_job
+from app.services.templates import TEMPLATE_BUILD, templates
+from app.services.users import DEFAULT_USER_QUERIES, get_or_create_default_user
+from app.services.write_queue import create_log, enqueue_log
 
 router = APIRouter()
-templates = Jinja2Templates(directory="app/templates")
-
-def build_water_report(logs: list[WaterLog], output_path: Path) -> None:
-    output_path.parent.mkdir(parents=True, exist_ok=True)
-
-    if not logs:
-        plt.figure(figsize=(7, 3.5))
-        plt.text(0.5, 0.5, "데이터 없음", ha="center", va="center", fontsize=12)
-        plt.axis("off")
-        plt.tight_layout()
-        plt.savefig(output_path, dpi=140)
-        plt.close()
-        return
-
-    rows = [{"date": log.logged_at.date(), "amount_ml": log.amount_ml} for log in logs]
-    df = pd.DataFrame(rows)
-    daily = df.groupby("date", as_index=False)["amount_ml"].sum()
-
-    plt.figure(figsize=(7, 3.5))
-    plt.bar(daily["date"].astype(str), daily["amount_ml"], color="#6e7bff")
-    plt.title("일별 수분 섭취량")
-    plt.ylabel("ml")
-    plt.xticks(rotation=45, ha="right")
-    plt.tight_layout()
-    plt.savefig(output_path, dpi=140)
-    plt.close()
 
 
-@router.get("/")
-async def dashboard(request: Request):
-    user = await get_or_create_default_user()
-    water_logs = await WaterLog.filter(user=user).order_by("-logged_at").limit(5)
-    exercise_logs = await ExerciseLog.filter(user=user).order_by("-logged_at").limit(5)
-    sleep_logs = await SleepLog.filter(user=user).order_by("-sleep_date").limit(5)
-    meal_logs = await MealLog.filter(user=user).order_by("-eaten_at").limit(5)
+def page_etag(*parts: object) -> str:
+    # HTML은 데이터가 그대로여도 템플릿이 바뀌면 달라지므로 템플릿 빌드 해시를 함께 넣습니다.
+    return make_etag(TEMPLATE_BUILD, *parts)
+
+
+def wants_fragment(request: Request) -> bool:
+    """폼 요청이 리다이렉트 대신 바뀐 기록 한 줄(조각)을 원하는지 (htmx와 같은 HX-Request 헤더)."""
+    return request.headers.get("hx-request") == "true"
 
-    total_water = sum([log.amount_ml for log in await WaterLog.filter(user=user)])
-    total_exercise = sum([log.duration_min for log in await ExerciseLog.filter(user=user)])
 
+def row_fragment(request: Request, kind: str, log) -> Response:
+    """기록 한 줄(_<kind>_row.html)만 렌더링합니다. 수정할 기록이 없었으면(None) 빈 404."""
+    if log is None:
+        return Response(status_code=404)
+    return templates.TemplateResponse(f"_{kind}_row.html", {"request": request, "log": log})
+
+
+def deleted_response(request: Request, url: str) -> Response:
+    """삭제 뒤 응답: 조각 요청이면 빈 조각, 아니면 목록으로 리다이렉트."""
+    if wants_fragment(request):
+        # 빈 조각: 화면에서 그 줄을 지웁니다. (이미 없던 기록이어도 결과는 같습니다.)
+        return Response(status_code=200)
+    return RedirectResponse(url=url, status_code=303)
+
+
+async def render_list_page(request: Request, kind: str, limit: int, cursor: str | None) -> Response:
+    """목록 페이지: 최신순 한 페이지(cursor부터 limit건)와 총 건수."""
+    user = await get_or_create_default_user()
+    stats = await log_stats(LOG_KINDS[kind].model, user.id)
+    etag = page_etag(f"{kind}-page", stats.version, limit, cursor or "")
+    if cached := not_modified(request, etag):
+        return cached
+    logs, next_cursor = await read_page(kind, user.id, limit, cursor)
     return templates.TemplateResponse(
-        "dashboard.html",
+        f"{kind}.html",
         {
             "request": request,
             "user": user,
-            "water_logs": water_logs,
-            "exercise_logs": exercise_logs,
-            "sleep_logs": sleep_logs,
-            "meal_logs": meal_logs,
-            "total_water": total_water,
-            "total_exercise": total_exercise,
+            "kind": kind,
+            "logs": logs,
+            "total": f"{stats.count:,}",
+            "limit": limit,
+            "cursor": cursor,
+            "next_cursor": next_cursor,
         },
+        headers=etag_headers(etag),
     )
 
 
-@router.get("/water")
-async def water_page(request: Request):
+async def render_rows(request: Request, kind: str, limit: int, cursor: str) -> Response:
+    """"더 보기" 조각: 다음 페이지의 기록 줄들과, 더 있으면 그다음 "더 보기" 줄."""
     user = await get_or_create_default_user()
-    logs = await WaterLog.filter(user=user).order_by("-logged_at")
+    etag = page_etag(f"{kind}-rows", await data_version(LOG_KINDS[kind].model, user.id), limit, cursor)
+    if cached := not_modified(request, etag):
+        return cached
+    logs, next_cursor = await read_page(kind, user.id, limit, cursor)
     return templates.TemplateResponse(
-        "water.html", {"request": request, "user": user, "logs": logs}
+        "_log_rows.html",
+        {"request": request, "kind": kind, "logs": logs, "limit": limit, "next_cursor": next_cursor},
+        headers=etag_headers(etag),
     )
 
 
+def form_date(value: str) -> date | None:
+    if not value:
+        return None
+    try:
+        return date.fromisoformat(value)
+    except ValueError:
+        raise HTTPException(status_code=422, detail=f"날짜 형식이 아닙니다: {value}") from None
+
+
+def form_selection(ids: list[int], from_: str, to: str) -> dict | None:
+    """목록 페이지 배치 폼에서 체크한 id와 기간(날짜). 아무것도 고르지 않았으면 None."""
+    if len(ids) > MAX_BATCH_IDS:
+        raise HTTPException(status_code=413, detail=f"한 번에 {MAX_BATCH_IDS}개까지 고를 수 있습니다.")
+    if not ids and not from_ and not to:
+        return None
+    return {"ids": ids, "from_": form_date(from_), "to": form_date(to)}
+
+
+def form_int(value: str) -> int | None:
+    # 빈 칸이면 None. (int | None = Form(None)은 빈 문자열을 422로 거절합니다.)
+    if not value:
+        return None
+    try:
+        return int(value)
+    except ValueError:
+        raise HTTPException(status_code=422, detail=f"숫자가 아닙니다: {value}") from None
+
+
+def changed_fields(**fields) -> dict:
+    # 배치 수정 폼에서 비워 둔 칸은 그대로 둡니다.
+    return {name: value for name, value in fields.items() if value not in (None, "")}
+
+
+@router.get("/")
+@query_budget(5 + DEFAULT_USER_QUERIES)
+async def dashboard(request: Request):
+    user = await get_or_create_default_user()
+    stats = await user_stats(user.id)
+    etag = page_etag("dashboard", *(entry.version for entry in stats.values()))
+    if cached := not_modified(request, etag):
+        return cached
+    context = await get_dashboard_context(user, stats)
+
+    return templates.TemplateResponse(
+        "dashboard.html", {"request": request, "user": user, **context}, headers=etag_headers(etag)
+    )
+
+
+@router.get("/water")
+@query_budget(3 + DEFAULT_USER_QUERIES)
+async def water_page(
+    request: Request, limit: int = Query(PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE), cursor: str | None = None
+):
+    return await render_list_page(request, "water", limit, cursor)
+
+
+@router.get("/water/rows")
+@query_budget(2 + DEFAULT_USER_QUERIES)
+async def water_rows(request: Request, cursor: str, limit: int = Query(PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE)):
+    return await render_rows(request, "water", limit, cursor)
+
+
 @router.post("/water")
-async def add_water(amount_ml: int = Form(...)):
+@query_budget(1 + DEFAULT_USER_QUERIES)
+async def add_water(request: Request, amount_ml: int = Form(...)):
     user = await get_or_create_default_user()
-    await WaterLog.create(user=user, amount_ml=amount_ml)
+    if wants_fragment(request):
+        log = await create_log(WaterLog, user=user, amount_ml=amount_ml)
+        return row_fragment(request, "water", log)
+    await enqueue_log(WaterLog, user=user, amount_ml=amount_ml)
     return RedirectResponse(url="/water", status_code=303)
 
 
 @router.post("/water/{log_id}/edit")
+@query_budget(1 + DEFAULT_USER_QUERIES)
 async def edit_water(
-    log_id: int, amount_ml: int = Form(...), logged_at: str = Form(...)
+    request: Request, log_id: int, amount_ml: int = Form(...), logged_at: str = Form(...)
 ):
     user = await get_or_create_default_user()
-    log = await WaterLog.get_or_none(id=log_id, user=user)
-    if log:
-        log.amount_ml = amount_ml
-        log.logged_at = datetime.fromisoformat(logged_at)
-        await log.save(update_fields=["amount_ml", "logged_at"])
+    fields = {"amount_ml": amount_ml, "logged_at": datetime.fromisoformat(logged_at)}
+    updated = await update_log(LOG_KINDS["water"], log_id, user.id, **fields)
+    if wants_fragment(request):
+        # 폼이 모든 필드를 보내므로 다시 읽지 않고 보낸 값으로 줄을 그립니다.
+        return row_fragment(request, "water", WaterLog(id=log_id, user_id=user.id, **fields) if updated else None)
+    return RedirectResponse(url="/water", status_code=303)
+
+
+@router.post("/water/batch-edit")
+@query_budget(1 + DEFAULT_USER_QUERIES)
+async def batch_edit_water(
+    ids: list[int] = Form([]),
+    from_: str = Form("", alias="from"),
+    to: str = Form(""),
+    amount_ml: str = Form(""),
+):
+    selection = form_selection(ids, from_, to)
+    fields = changed_fields(amount_ml=form_int(amount_ml))
+    if selection and fields:
+        user = await get_or_create_default_user()
+        await update_logs(LOG_KINDS["water"], user.id, fields, **selection)
+    return RedirectResponse(url="/water", status_code=303)
+
+
+@router.post("/water/batch-delete")
+@query_budget(1 + DEFAULT_USER_QUERIES)
+async def batch_delete_water(ids: list[int] = Form([]), from_: str = Form("", alias="from"), to: str = Form("")):
+    if selection := form_selection(ids, from_, to):
+        user = await get_or_create_default_user()
+        await delete_logs(LOG_KINDS["water"], user.id, **selection)
     return RedirectResponse(url="/water", status_code=303)
 
 
 @router.post("/water/{log_id}/delete")
-async def delete_water(log_id: int):
+@query_budget(1 + DEFAULT_USER_QUERIES)
+async def delete_water(request: Request, log_id: int):
     user = await get_or_create_default_user()
-    log = await WaterLog.get_or_none(id=log_id, user=user)
-    if log:
-        await log.delete()
-    return RedirectResponse(url="/water", status_code=303)
+    await delete_log(LOG_KINDS["water"], log_id, user.id)
+    return deleted_response(request, "/water")
 
 
 @router.get("/exercise")
-async def exercise_page(request: Request):
-    user = await get_or_create_default_user()
-    logs = await ExerciseLog.filter(user=user).order_by("-logged_at")
-    return templates.TemplateResponse(
-        "exercise.html", {"request": request, "user": user, "logs": logs}
-    )
+@query_budget(3 + DEFAULT_USER_QUERIES)
+async def exercise_page(
+    request: Request, limit: int = Query(PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE), cursor: str | None = None
+):
+    return await render_list_page(request, "exercise", limit, cursor)
+
+
+@router.get("/exercise/rows")
+@query_budget(2 + DEFAULT_USER_QUERIES)
+async def exercise_rows(request: Request, cursor: str, limit: int = Query(PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE)):
+    return await render_rows(request, "exercise", limit, cursor)
 
 
 @router.post("/exercise")
+@query_budget(1 + DEFAULT_USER_QUERIES)
 async def add_exercise(
+    request: Request,
     activity: str = Form(...),
     duration_min: int = Form(...),
     calories_burned: int | None = Form(None),
 ):
     user = await get_or_create_default_user()
-    await ExerciseLog.create(
-        user=user,
-        activity=activity,
-        duration_min=duration_min,
-        calories_burned=calories_burned,
-    )
+    fields = {"activity": activity, "duration_min": duration_min, "calories_burned": calories_burned}
+    if wants_fragment(request):
+        log = await create_log(ExerciseLog, user=user, **fields)
+        return row_fragment(request, "exercise", log)
+    await enqueue_log(ExerciseLog, user=user, **fields)
     return RedirectResponse(url="/exercise", status_code=303)
 
 
 @router.post("/exercise/{log_id}/edit")
+@query_budget(1 + DEFAULT_USER_QUERIES)
 async def edit_exercise(
+    request: Request,
     log_id: int,
     activity: str = Form(...),
     duration_min: int = Form(...),
@@ -143,56 +253,98 @@ async def edit_exercise(
     logged_at: str = Form(...),
 ):
     user = await get_or_create_default_user()
-    log = await ExerciseLog.get_or_none(id=log_id, user=user)
-    if log:
-        log.activity = activity
-        log.duration_min = duration_min
-        log.calories_burned = calories_burned
-        log.logged_at = datetime.fromisoformat(logged_at)
-        await log.save(
-            update_fields=["activity", "duration_min", "calories_burned", "logged_at"]
+    fields = {
+        "activity": activity,
+        "duration_min": duration_min,
+        "calories_burned": calories_burned,
+        "logged_at": datetime.fromisoformat(logged_at),
+    }
+    updated = await update_log(LOG_KINDS["exercise"], log_id, user.id, **fields)
+    if wants_fragment(request):
+        return row_fragment(
+            request, "exercise", ExerciseLog(id=log_id, user_id=user.id, **fields) if updated else None
         )
     return RedirectResponse(url="/exercise", status_code=303)
 
 
+@router.post("/exercise/batch-edit")
+@query_budget(1 + DEFAULT_USER_QUERIES)
+async def batch_edit_exercise(
+    ids: list[int] = Form([]),
+    from_: str = Form("", alias="from"),
+    to: str = Form(""),
+    activity: str = Form(""),
+    duration_min: str = Form(""),
+    calories_burned: str = Form(""),
+):
+    selection = form_selection(ids, from_, to)
+    fields = changed_fields(
+        activity=activity, duration_min=form_int(duration_min), calories_burned=form_int(calories_burned)
+    )
+    if selection and fields:
+        user = await get_or_create_default_user()
+        await update_logs(LOG_KINDS["exercise"], user.id, fields, **selection)
+    return RedirectResponse(url="/exercise", status_code=303)
+
+
+@router.post("/exercise/batch-delete")
+@query_budget(1 + DEFAULT_USER_QUERIES)
+async def batch_delete_exercise(ids: list[int] = Form([]), from_: str = Form("", alias="from"), to: str = Form("")):
+    if selection := form_selection(ids, from_, to):
+        user = await get_or_create_default_user()
+        await delete_logs(LOG_KINDS["exercise"], user.id, **selection)
+    return RedirectResponse(url="/exercise", status_code=303)
+
+
 @router.post("/exercise/{log_id}/delete")
-async def delete_exercise(log_id: int):
+@query_budget(1 + DEFAULT_USER_QUERIES)
+async def delete_exercise(request: Request, log_id: int):
     user = await get_or_create_default_user()
-    log = await ExerciseLog.get_or_none(id=log_id, user=user)
-    if log:
-        await log.delete()
-    return RedirectResponse(url="/exercise", status_code=303)
+    await delete_log(LOG_KINDS["exercise"], log_id, user.id)
+    return deleted_response(request, "/exercise")
 
 
 @router.get("/sleep")
-async def sleep_page(request: Request):
-    user = await get_or_create_default_user()
-    logs = await SleepLog.filter(user=user).order_by("-sleep_date")
-    return templates.TemplateResponse(
-        "sleep.html", {"request": request, "user": user, "logs": logs}
-    )
+@query_budget(3 + DEFAULT_USER_QUERIES)
+async def sleep_page(
+    request: Request, limit: int = Query(PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE), cursor: str | None = None
+):
+    return await render_list_page(request, "sleep", limit, cursor)
+
+
+@router.get("/sleep/rows")
+@query_budget(2 + DEFAULT_USER_QUERIES)
+async def sleep_rows(request: Request, cursor: str, limit: int = Query(PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE)):
+    return await render_rows(request, "sleep", limit, cursor)
 
 
 @router.post("/sleep")
+@query_budget(1 + DEFAULT_USER_QUERIES)
 async def add_sleep(
+    request: Request,
     sleep_date: str = Form(...),
     start_time: str = Form(...),
     end_time: str = Form(...),
     quality: int | None = Form(None),
 ):
     user = await get_or_create_default_user()
-    await SleepLog.create(
-        user=user,
-        sleep_date=date.fromisoformat(sleep_date),
-        start_time=datetime.fromisoformat(start_time),
-        end_time=datetime.fromisoformat(end_time),
-        quality=quality,
-    )
+    fields = {
+        "sleep_date": date.fromisoformat(sleep_date),
+        "start_time": datetime.fromisoformat(start_time),
+        "end_time": datetime.fromisoformat(end_time),
+        "quality": quality,
+    }
+    if wants_fragment(request):
+        log = await create_log(SleepLog, user=user, **fields)
+        return row_fragment(request, "sleep", log)
+    await enqueue_log(SleepLog, user=user, **fields)
     return RedirectResponse(url="/sleep", status_code=303)
 
 
 @router.post("/sleep/{log_id}/edit")
+@query_budget(1 + DEFAULT_USER_QUERIES)
 async def edit_sleep(
+    request: Request,
     log_id: int,
     sleep_date: str = Form(...),
     start_time: str = Form(...),
@@ -200,47 +352,85 @@ async def edit_sleep(
     quality: int | None = Form(None),
 ):
     user = await get_or_create_default_user()
-    log = await SleepLog.get_or_none(id=log_id, user=user)
-    if log:
-        log.sleep_date = date.fromisoformat(sleep_date)
-        log.start_time = datetime.fromisoformat(start_time)
-        log.end_time = datetime.fromisoformat(end_time)
-        log.quality = quality
-        await log.save(update_fields=["sleep_date", "start_time", "end_time", "quality"])
+    fields = {
+        "sleep_date": date.fromisoformat(sleep_date),
+        "start_time": datetime.fromisoformat(start_time),
+        "end_time": datetime.fromisoformat(end_time),
+        "quality": quality,
+    }
+    updated = await update_log(LOG_KINDS["sleep"], log_id, user.id, **fields)
+    if wants_fragment(request):
+        return row_fragment(request, "sleep", SleepLog(id=log_id, user_id=user.id, **fields) if updated else None)
+    return RedirectResponse(url="/sleep", status_code=303)
+
+
+@router.post("/sleep/batch-edit")
+@query_budget(1 + DEFAULT_USER_QUERIES)
+async def batch_edit_sleep(
+    ids: list[int] = Form([]),
+    from_: str = Form("", alias="from"),
+    to: str = Form(""),
+    quality: str = Form(""),
+):
+    selection = form_selection(ids, from_, to)
+    fields = changed_fields(quality=form_int(quality))
+    if selection and fields:
+        user = await get_or_create_default_user()
+        await update_logs(LOG_KINDS["sleep"], user.id, fields, **selection)
+    return RedirectResponse(url="/sleep", status_code=303)
+
+
+@router.post("/sleep/batch-delete")
+@query_budget(1 + DEFAULT_USER_QUERIES)
+async def batch_delete_sleep(ids: list[int] = Form([]), from_: str = Form("", alias="from"), to: str = Form("")):
+    if selection := form_selection(ids, from_, to):
+        user = await get_or_create_default_user()
+        await delete_logs(LOG_KINDS["sleep"], user.id, **selection)
     return RedirectResponse(url="/sleep", status_code=303)
 
 
 @router.post("/sleep/{log_id}/delete")
-async def delete_sleep(log_id: int):
+@query_budget(1 + DEFAULT_USER_QUERIES)
+async def delete_sleep(request: Request, log_id: int):
     user = await get_or_create_default_user()
-    log = await SleepLog.get_or_none(id=log_id, user=user)
-    if log:
-        await log.delete()
-    return RedirectResponse(url="/sleep", status_code=303)
+    await delete_log(LOG_KINDS["sleep"], log_id, user.id)
+    return deleted_response(request, "/sleep")
 
 
 @router.get("/meal")
-async def meal_page(request: Request):
-    user = await get_or_create_default_user()
-    logs = await MealLog.filter(user=user).order_by("-eaten_at")
-    return templates.TemplateResponse(
-        "meal.html", {"request": request, "user": user, "logs": logs}
-    )
+@query_budget(3 + DEFAULT_USER_QUERIES)
+async def meal_page(
+    request: Request, limit: int = Query(PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE), cursor: str | None = None
+):
+    return await render_list_page(request, "meal", limit, cursor)
+
+
+@router.get("/meal/rows")
+@query_budget(2 + DEFAULT_USER_QUERIES)
+async def meal_rows(request: Request, cursor: str, limit: int = Query(PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE)):
+    return await render_rows(request, "meal", limit, cursor)
 
 
 @router.post("/meal")
+@query_budget(1 + DEFAULT_USER_QUERIES)
 async def add_meal(
+    request: Request,
     meal_type: str = Form(...),
     calories: int | None = Form(None),
     note: str | None = Form(None),
 ):
     user = await get_or_create_default_user()
-    await MealLog.create(user=user, meal_type=meal_type, calories=calories, note=note)
+    if wants_fragment(request):
+        log = await create_log(MealLog, user=user, meal_type=meal_type, calories=calories, note=note)
+        return row_fragment(request, "meal", log)
+    await enqueue_log(MealLog, user=user, meal_type=meal_type, calories=calories, note=note)
     return RedirectResponse(url="/meal", status_code=303)
 
 
 @router.post("/meal/{log_id}/edit")
+@query_budget(1 + DEFAULT_USER_QUERIES)
 async def edit_meal(
+    request: Request,
     log_id: int,
     meal_type: str = Form(...),
     calories: int | None = Form(None),
@@ -248,33 +438,103 @@ async def edit_meal(
     eaten_at: str = Form(...),
 ):
     user = await get_or_create_default_user()
-    log = await MealLog.get_or_none(id=log_id, user=user)
-    if log:
-        log.meal_type = meal_type
-        log.calories = calories
-        log.note = note
-        log.eaten_at = datetime.fromisoformat(eaten_at)
-        await log.save(update_fields=["meal_type", "calories", "note", "eaten_at"])
+    fields = {
+        "meal_type": meal_type,
+        "calories": calories,
+        "note": note,
+        "eaten_at": datetime.fromisoformat(eaten_at),
+    }
+    updated = await update_log(LOG_KINDS["meal"], log_id, user.id, **fields)
+    if wants_fragment(request):
+        return row_fragment(request, "meal", MealLog(id=log_id, user_id=user.id, **fields) if updated else None)
+    return RedirectResponse(url="/meal", status_code=303)
+
+
+@router.post("/meal/batch-edit")
+@query_budget(1 + DEFAULT_USER_QUERIES)
+async def batch_edit_meal(
+    ids: list[int] = Form([]),
+    from_: str = Form("", alias="from"),
+    to: str = Form(""),
+    meal_type: str = Form(""),
+    calories: str = Form(""),
+    note: str = Form(""),
+):
+    selection = form_selection(ids, from_, to)
+    fields = changed_fields(meal_type=meal_type, calories=form_int(calories), note=note)
+    if selection and fields:
+        user = await get_or_create_default_user()
+        await update_logs(LOG_KINDS["meal"], user.id, fields, **selection)
+    return RedirectResponse(url="/meal", status_code=303)
+
+
+@router.post("/meal/batch-delete")
+@query_budget(1 + DEFAULT_USER_QUERIES)
+async def batch_delete_meal(ids: list[int] = Form([]), from_: str = Form("", alias="from"), to: str = Form("")):
+    if selection := form_selection(ids, from_, to):
+        user = await get_or_create_default_user()
+        await delete_logs(LOG_KINDS["meal"], user.id, **selection)
     return RedirectResponse(url="/meal", status_code=303)
 
 
 @router.post("/meal/{log_id}/delete")
-async def delete_meal(log_id: int):
+@query_budget(1 + DEFAULT_USER_QUERIES)
+async def delete_meal(request: Request, log_id: int):
     user = await get_or_create_default_user()
-    log = await MealLog.get_or_none(id=log_id, user=user)
-    if log:
-        await log.delete()
-    return RedirectResponse(url="/meal", status_code=303)
+    await delete_log(LOG_KINDS["meal"], log_id, user.id)
+    return deleted_response(request, "/meal")
+
+
+GRANULARITY_LABELS = {"day": "일별", "week": "주별", "month": "월별"}
 
 
 @router.get("/report")
-async def report_page(request: Request):
+@query_budget(3 + DEFAULT_USER_QUERIES)
+async def report_page(
+    request: Request,
+    from_: date | None = Query(None, alias="from"),
+    to: date | None = None,
+    granularity: Literal["", "day", "week", "month"] = "",  # 빈 값은 자동 선택
+):
+    if from_ and to and from_ > to:
+        raise HTTPException(status_code=400, detail="from은 to보다 늦을 수 없습니다.")
     user = await get_or_create_default_user()
-    logs = await WaterLog.filter(user=user).order_by("logged_at")
-    output_path = Path("app/static/img/water_report.png")
-    build_water_report(logs, output_path)
-    total_water = sum(log.amount_ml for log in logs)
-    days = len({log.logged_at.date() for log in logs})
+    window = report_window(from_, to, granularity or None)
+    water_version = await data_version(WaterLog, user.id)
+    chart_version = f"{window.start}:{window.end}:{window.granularity}:{window.stride}:{water_version}"
+    # 기본 기간은 날짜가 바뀌면 달라지므로 확정된 기간을 ETag에 넣습니다. 페이지의 <img>가
+    # 가리키는 차트 파일이 캐시에서 지워졌으면 304 대신 페이지를 다시 만들어 차트도 다시 그립니다.
+    etag = page_etag("report", water_version, *window, granularity)
+    if is_cached(user.id, "water", chart_version) and (cached := not_modified(request, etag)):
+        return cached
+    stats = await water_report_stats(user.id, window.start, window.end)
+    label = GRANULARITY_LABELS[window.granularity]
+    if window.stride > 1:
+        label = f"{window.stride}개월 단위"
+    title = f"{label} 수분 섭취량"
+
+    async def render(path: Path) -> None:
+        points = await report_series("water", user.id, window)
+        start = time.perf_counter()
+        await run_report_job(build_water_report, points, str(path), title)
+        CHART_RENDER.observe(time.perf_counter() - start, "water")
+
+    chart_url = None
+    chart_error = None
+    status_code = 200
+    try:
+        filename = await get_or_render(user.id, "water", chart_version, render)
+        chart_url = request.url_for("report_chart", user_id=user.id, filename=filename).path
+    except ReportBusyError:
+        CHART_RENDER_FAILURES.inc("water", "busy")
+        status_code = 503
+        chart_error = "리포트 요청이 많습니다. 잠시 후 다시 시도해 주세요."
+    except ReportTimeoutError:
+        CHART_RENDER_FAILURES.inc("water", "timeout")
+        status_code = 503
+        chart_error = "차트 생성 시간이 초과되었습니다."
+    total_water = stats["total_water"]
+    days = stats["days"]
     avg_per_day = round(total_water / days, 1) if days else 0
 
     return templates.TemplateResponse(
@@ -282,9 +542,34 @@ async def report_page(request: Request):
         {
             "request": request,
             "user": user,
-            "chart_url": "/static/img/water_report.png",
+            "chart_url": chart_url,
+            "chart_error": chart_error,
             "total_water": total_water,
             "days": days,
             "avg_per_day": avg_per_day,
+            "start": window.start,
+            "last_day": window.end - timedelta(days=1),
+            "granularity": granularity,
+            "granularity_labels": GRANULARITY_LABELS,
+            "chart_title": title,
         },
+        status_code=status_code,
+        # 차트 생성에 실패한 응답은 다음 요청에서 다시 시도해야 하므로 ETag를 붙이지 않습니다.
+        headers=etag_headers(etag) if status_code == 200 else None,
+    )
+
+
+@router.get("/report/charts/{user_id}/{filename}", name="report_chart")
+@query_budget(0)
+async def report_chart(user_id: int, filename: str):
+    if not CHART_FILENAME_RE.fullmatch(filename):
+        raise HTTPException(status_code=404)
+    path = chart_path(user_id, filename)
+    if not path.is_file():
+        raise HTTPException(status_code=404)
+    # 파일 이름이 데이터 버전의 해시이므로 내용이 바뀌지 않습니다.
+    return FileResponse(
+        path,
+        media_type="image/png",
+        headers={"Cache-Control": "public, max-age=31536000, immutable"},
     )
@@ -1,6 +1,6 @@
 from datetime import date, datetime
 
-from pydantic import BaseModel, ConfigDict
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class WaterCreate(BaseModel):
@@ -8,6 +8,11 @@ class WaterCreate(BaseModel):
     amount_ml: int
 
 
+class WaterUpdate(BaseModel):
+    amount_ml: int | None = None
+    logged_at: datetime | None = None
+
+
 class WaterOut(BaseModel):
     id: int
     user_id: int
@@ -24,6 +29,13 @@ class ExerciseCreate(BaseModel):
     calories_burned: int | None = None
 
 
+class ExerciseUpdate(BaseModel):
+    activity: str | None = None
+    duration_min: int | None = None
+    calories_burned: int | None = None
+    logged_at: datetime | None = None
+
+
 class ExerciseOut(BaseModel):
     id: int
     user_id: int
@@ -43,6 +55,13 @@ class SleepCreate(BaseModel):
     quality: int | None = None
 
 
+class SleepUpdate(BaseModel):
+    sleep_date: date | None = None
+    start_time: datetime | None = None
+    end_time: datetime | None = None
+    quality: int | None = None
+
+
 class SleepOut(BaseModel):
     id: int
     user_id: int
@@ -61,6 +80,13 @@ class MealCreate(BaseModel):
     note: str | None = None
 
 
+class MealUpdate(BaseModel):
+    meal_type: str | None = None
+    calories: int | None = None
+    note: str | None = None
+    eaten_at: datetime | None = None
+
+
 class MealOut(BaseModel):
     id: int
     user_id: int
@@ -70,3 +96,53 @@ class MealOut(BaseModel):
     eaten_at: datetime
 
     model_config = ConfigDict(from_attributes=True)
+
+
+class BulkItemError(BaseModel):
+    index: int
+    errors: list[dict]
+
+
+class BulkResult(BaseModel):
+    inserted: int
+    failed: int
+    errors: list[BulkItemError]
+
+
+class BatchSelect(BaseModel):
+    # ids와 기간(from~to, 날짜 양끝 포함) 중 하나 이상. 둘 다 주면 둘 다 만족하는 기록.
+    user_id: int
+    ids: list[int] | None = None
+    from_: date | None = Field(None, alias="from")
+    to: date | None = None
+
+
+class WaterBatchUpdate(BatchSelect):
+    changes: WaterUpdate
+
+
+class ExerciseBatchUpdate(BatchSelect):
+    changes: ExerciseUpdate
+
+
+class SleepBatchUpdate(BatchSelect):
+    changes: SleepUpdate
+
+
+class MealBatchUpdate(BatchSelect):
+    changes: MealUpdate
+
+
+class BatchMutationResult(BaseModel):
+    affected: int
+
+
+class TimeSeriesOut(BaseModel):
+    metric: str
+    unit: str
+    granularity: str
+    start: date
+    end: date  # 포함
+    buckets: int  # 다운샘플링 전 버킷 수
+    x: list[date]
+    y: list[float]
@@ -0,0 +1,230 @@
+"""대용량 합성 데이터 생성기. 예: python -m app.seed --users 1000 --days 730"""
+
+import argparse
+import asyncio
+import os
+import random
+import sqlite3
+import time
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import Executor, ProcessPoolExecutor
+from datetime import date, datetime, timedelta, timezone
+from functools import partial
+
+from app import db
+from app.models.exercise import ExerciseLog
+from app.models.meal import MealLog
+from app.models.sleep import SleepLog
+from app.models.user import User
+from app.models.water import WaterLog
+
+SURNAMES = "김이박최정강조윤장임한오서신권황안송류홍"
+GIVEN_NAMES = ["민준", "서연", "도윤", "하은", "시우", "지유", "예준", "수아", "주원", "지민", "하준", "서윤"]
+# (활동, 분당 소모 kcal, 최소 시간, 최대 시간)
+ACTIVITIES = [
+    ("걷기", 4, 20, 90),
+    ("러닝", 10, 20, 60),
+    ("자전거", 8, 30, 120),
+    ("수영", 9, 30, 60),
+    ("요가", 3, 30, 75),
+    ("근력운동", 6, 30, 90),
+]
+# (식사 종류, 시작 시각(분), 시간 폭(분), 평균 kcal, 표준편차)
+MEALS = [
+    ("아침", 7 * 60, 120, 450, 120),
+    ("점심", 12 * 60, 90, 700, 150),
+    ("저녁", 18 * 60, 150, 750, 180),
+]
+SNACK = ("간식", 10 * 60, 12 * 60, 250, 100)
+NOTES = ["외식", "배달", "집밥", "샐러드", "과식함"]
+
+INSERT_SQL = {
+    WaterLog: ("user_id", "amount_ml", "logged_at"),
+    ExerciseLog: ("user_id", "activity", "duration_min", "calories_burned", "logged_at"),
+    SleepLog: ("user_id", "sleep_date", "start_time", "end_time", "quality"),
+    MealLog: ("user_id", "meal_type", "calories", "note", "eaten_at"),
+}
+
+
+class DayClock:
+    """일자 + 분(24시간을 넘어도 됨)을 저장 형식 문자열로 바꿉니다.
+
+    strftime은 느리므로 날짜 부분을 미리 만들어 두고 시:분:초만 붙입니다.
+    """
+
+    def __init__(self, start: date, days: int) -> None:
+        self.start = start
+        self.dates = [(start + timedelta(days=i)).isoformat() for i in range(days + 2)]
+
+    def ts(self, day: int, minute: int, second: int = 0) -> str:
+        day += minute // 1440
+        minute %= 1440
+        return f"{self.dates[day]} {minute // 60:02d}:{minute % 60:02d}:{second:02d}+00:00"
+
+
+def user_rows(rng: random.Random, user_id: int, clock: DayClock, days: int) -> dict[type, list[tuple]]:
+    """한 사용자의 days일치 기록을 테이블별 튜플 목록으로 만듭니다."""
+    # 사용자별 생활 습관: 같은 사용자는 기간 내내 비슷한 패턴을 보입니다.
+    drinks = rng.uniform(4, 9)
+    cup_ml = rng.choice([150, 200, 250, 300, 350])
+    exercise_prob = rng.uniform(0.15, 0.85)
+    favorites = rng.sample(ACTIVITIES, k=rng.randint(1, 3))
+    bedtime = rng.randint(22 * 60, 24 * 60 + 60)
+    sleep_hours = rng.uniform(6, 8.5)
+    breakfast_prob = rng.uniform(0.3, 0.95)
+    calorie_bias = rng.uniform(0.8, 1.2)
+
+    water, exercise, sleep, meals = [], [], [], []
+    for day in range(days):
+        weekend = (clock.start + timedelta(days=day)).weekday() >= 5
+
+        for _ in range(max(1, round(rng.gauss(drinks, 1.5)))):
+            amount = max(50, round(rng.gauss(cup_ml, 40) / 10) * 10)
+            water.append((user_id, amount, clock.ts(day, rng.randint(7 * 60, 23 * 60), rng.randint(0, 59))))
+
+        if rng.random() < exercise_prob * (1.2 if weekend else 1.0):
+            name, kcal_per_min, low, high = rng.choice(favorites)
+            duration = rng.randint(low, high)
+            calories = round(duration * kcal_per_min * rng.uniform(0.8, 1.2))
+            minute = rng.choice([rng.randint(6 * 60, 8 * 60), rng.randint(18 * 60, 21 * 60)])
+            exercise.append((user_id, name, duration, calories, clock.ts(day, minute)))
+
+        start = bedtime + round(rng.gauss(60 if weekend else 0, 30))
+        length = round(max(3.5, rng.gauss(sleep_hours + (0.7 if weekend else 0), 0.8)) * 60)
+        quality = min(5, max(1, round(length / 60 - 3 + rng.gauss(0, 0.8))))
+        sleep.append(
+            (
+                user_id,
+                clock.dates[day],  # 자정을 넘겨 잠들어도 그 밤이 시작된 날짜
+                clock.ts(day, start),
+                clock.ts(day, start + length),
+                quality,
+            )
+        )
+
+        for meal_type, begin, width, mean, sd in MEALS:
+            if meal_type == "아침" and rng.random() > breakfast_prob:
+                continue
+            calories = max(100, round(rng.gauss(mean * calorie_bias, sd)))
+            note = rng.choice(NOTES) if rng.random() < 0.15 else None
+            meals.append((user_id, meal_type, calories, note, clock.ts(day, begin + rng.randint(0, width))))
+        for _ in range(rng.choices([0, 1, 2], weights=[5, 4, 1])[0]):
+            meal_type, begin, width, mean, sd = SNACK
+            calories = max(50, round(rng.gauss(mean, sd)))
+            meals.append((user_id, meal_type, calories, None, clock.ts(day, begin + rng.randint(0, width))))
+
+    return {WaterLog: water, ExerciseLog: exercise, SleepLog: sleep, MealLog: meals}
+
+
+def make_user(
+    seed: int, clock: DayClock, days: int, base_id: int, index: int
+) -> tuple[tuple, dict[str, list[tuple]]]:
+    """index번째 사용자 행과 그 사용자의 기록을 만듭니다. (워커 프로세스에서 실행)"""
+    # 사용자마다 따로 난수열을 두어 --workers 수와 상관없이 같은 --seed면 같은 데이터가 나옵니다.
+    rng = random.Random(f"{seed}:{index}")
+    user_id = base_id + index
+    name = rng.choice(SURNAMES) + rng.choice(GIVEN_NAMES)
+    user = (user_id, name, round(rng.gauss(168, 8)), round(rng.gauss(65, 11), 1))
+    rows = user_rows(rng, user_id, clock, days)
+    return user, {model.__name__: table_rows for model, table_rows in rows.items()}
+
+
+def sqlite_path(url: str) -> str:
+    if not url.startswith("sqlite://"):
+        raise SystemExit(f"SQLite DB만 지원합니다: {url}")
+    return url.removeprefix("sqlite://").split("?", 1)[0]
+
+
+async def prepare_schema() -> None:
+    # 버전 트리거도 여기서 설치되므로 generate보다 먼저 불러야 합니다.
+    await db.init_db()
+    await db.close_db()
+
+
+def bounded_map(pool: Executor, fn: Callable, items: Iterable, window: int) -> Iterator:
+    """pool.map처럼 순서대로 결과를 내되, 결과를 기다리는 작업은 window개까지만 제출합니다."""
+    # Executor.map은 모든 작업을 한꺼번에 제출하므로, 넣기가 생성보다 느리면 끝난 결과가
+    # 메인 프로세스 메모리에 계속 쌓입니다.
+    pending = deque()
+    for item in items:
+        pending.append(pool.submit(fn, item))
+        if len(pending) >= window:
+            yield pending.popleft().result()
+    while pending:
+        yield pending.popleft().result()
+
+
+def generate(users: int, days: int, end: date, seed: int, batch: int, workers: int) -> dict[str, int]:
+    path = sqlite_path(db.DB_URL)
+    start = end - timedelta(days=days - 1)
+    clock = DayClock(start, days)
+    statements = {
+        model.__name__: f'INSERT INTO "{model._meta.db_table}" ({", ".join(columns)}) '
+        f'VALUES ({", ".join("?" * len(columns))})'
+        for model, columns in INSERT_SQL.items()
+    }
+    user_sql = (
+        f'INSERT INTO "{User._meta.db_table}" (id, name, height_cm, weight_kg, created_at) '
+        "VALUES (?, ?, ?, ?, ?)"
+    )
+    counts = {model.__name__: 0 for model in INSERT_SQL}
+    created_at = f"{start.isoformat()} 00:00:00+00:00"
+
+    conn = sqlite3.connect(path)
+    # 생성기 실행 중에만 fsync를 끕니다. 중간에 죽으면 다시 생성하면 됩니다.
+    conn.execute("PRAGMA synchronous = OFF")
+    # 타임스탬프 인덱스에는 사용자가 섞여 들어가므로 페이지 캐시를 넉넉히 둡니다.
+    conn.execute("PRAGMA cache_size = -524288")
+    base_id = conn.execute(f'SELECT COALESCE(MAX(id), 0) + 1 FROM "{User._meta.db_table}"').fetchone()[0]
+    build = partial(make_user, seed, clock, days, base_id)
+    pool = ProcessPoolExecutor(workers) if workers > 1 else None
+    results = bounded_map(pool, build, range(users), 2 * workers) if pool else map(build, range(users))
+    try:
+        conn.execute("BEGIN")
+        pending = 0
+        for index, (user, rows) in enumerate(results):
+            conn.execute(user_sql, (*user, created_at))
+            for name, table_rows in rows.items():
+                conn.executemany(statements[name], table_rows)
+                counts[name] += len(table_rows)
+                pending += len(table_rows)
+            if pending >= batch or index == users - 1:
+                conn.execute("COMMIT")
+                conn.execute("BEGIN")
+                pending = 0
+                print(f"  {index + 1:,}/{users:,} users, {sum(counts.values()):,} rows", flush=True)
+        conn.execute("COMMIT")
+        conn.execute("ANALYZE")
+    finally:
+        if pool:
+            pool.shutdown(cancel_futures=True)
+        conn.close()
+    return counts
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="합성 건강 기록 데이터를 생성합니다.")
+    parser.add_argument("--users", type=int, default=100, help="만들 사용자 수")
+    parser.add_argument("--days", type=int, default=365, help="사용자당 기록 기간(일)")
+    parser.add_argument("--end", type=date.fromisoformat, help="마지막 날짜 (기본: 오늘, UTC)")
+    parser.add_argument("--seed", type=int, default=0, help="난수 시드")
+    parser.add_argument("--batch", type=int, default=500_000, help="트랜잭션당 행 수")
+    parser.add_argument("--workers", type=int, default=min(4, os.cpu_count() or 1), help="생성 프로세스 수")
+    parser.add_argument("--db", help="SQLite 파일 경로 (기본: HEALTH_DB_URL 또는 app/data/health.db)")
+    args = parser.parse_args(argv)
+
+    if args.db:
+        db.DB_URL = f"sqlite://{args.db}"
+    end = args.end or datetime.now(timezone.utc).date()
+    asyncio.run(prepare_schema())
+    began = time.perf_counter()
+    counts = generate(args.users, args.days, end, args.seed, args.batch, args.workers)
+    elapsed = time.perf_counter() - began
+    total = sum(counts.values())
+    print(", ".join(f"{name}={count:,}" for name, count in counts.items()))
+    print(f"{total:,} rows in {elapsed:.1f}s ({total / elapsed:,.0f} rows/s) -> {sqlite_path(db.DB_URL)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+"""여러 건의 기록을 항목별로 검증해 한 트랜잭션으로 넣는 대량 입력."""
+
+from fastapi import HTTPException, Request
+from pydantic import BaseModel, ValidationError
+from pydantic_core import from_json
+from tortoise.transactions import in_transaction
+
+from app.models.user import User
+from app.schemas import BulkItemError, BulkResult
+from app.services.log_kinds import LogKind
+
+MAX_BULK_ITEMS = 1000
+MAX_BULK_BYTES = 1024 * 1024
+
+
+async def read_bulk_body(request: Request) -> list:
+    content_length = request.headers.get("content-length")
+    if content_length and not content_length.isdigit():
+        raise HTTPException(status_code=400, detail="invalid Content-Length")
+    if content_length and int(content_length) > MAX_BULK_BYTES:
+        raise HTTPException(status_code=413, detail=f"body exceeds {MAX_BULK_BYTES} bytes")
+    body = bytearray()
+    async for chunk in request.stream():
+        body += chunk
+        if len(body) > MAX_BULK_BYTES:
+            raise HTTPException(status_code=413, detail=f"body exceeds {MAX_BULK_BYTES} bytes")
+    try:
+        items = from_json(bytes(body))
+    except ValueError:
+        raise HTTPException(status_code=400, detail="invalid JSON") from None
+    if not isinstance(items, list):
+        raise HTTPException(status_code=422, detail="expected a JSON array")
+    if len(items) > MAX_BULK_ITEMS:
+        raise HTTPException(status_code=413, detail=f"at most {MAX_BULK_ITEMS} items per request")
+    return items
+
+
+async def bulk_insert(kind: LogKind, schema: type[BaseModel], items: list) -> BulkResult:
+    valid: list[tuple[int, BaseModel]] = []
+    errors: list[BulkItemError] = []
+    for index, item in enumerate(items):
+        try:
+            valid.append((index, schema.model_validate(item)))
+        except ValidationError as exc:
+            errors.append(
+                BulkItemError(index=index, errors=exc.errors(include_url=False, include_input=False))
+            )
+
+    user_ids = {payload.user_id for _, payload in valid}
+    known = set(await User.filter(id__in=user_ids).values_list("id", flat=True)) if user_ids else set()
+    rows = []
+    for index, payload in valid:
+        if payload.user_id not in known:
+            errors.append(
+                BulkItemError(
+                    index=index,
+                    errors=[{"loc": ["user_id"], "msg": "user not found", "type": "not_found"}],
+                )
+            )
+            continue
+        rows.append(kind.model(**payload.model_dump()))
+
+    if rows:
+        async with in_transaction():
+            await kind.model.bulk_create(rows)
+    errors.sort(key=lambda error: error.index)
+    return BulkResult(inserted=len(rows), failed=len(errors), errors=errors)
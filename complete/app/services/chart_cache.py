@@ -0,0 +1,81 @@
+"""사용자별 리포트 차트 파일 캐시. 용량이 한도를 넘으면 오래 쓰이지 않은 파일부터 지웁니다."""
+
+import asyncio
+import hashlib
+import os
+import re
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
+from pathlib import Path
+
+from app.db import BASE_DIR
+
+CHART_CACHE_DIR = Path(os.getenv("HEALTH_CHART_CACHE_DIR", BASE_DIR / "data" / "charts"))
+CHART_CACHE_MAX_BYTES = int(os.getenv("HEALTH_CHART_CACHE_MAX_BYTES", str(64 * 1024 * 1024)))
+
+CHART_FILENAME_RE = re.compile(r"[a-z]+-[0-9a-f]{20}\.png")
+
+_entries: OrderedDict[Path, int] | None = None
+_inflight: dict[Path, asyncio.Task] = {}
+
+
+def chart_filename(user_id: int, chart: str, version: str) -> str:
+    digest = hashlib.sha256(f"{user_id}:{chart}:{version}".encode()).hexdigest()[:20]
+    return f"{chart}-{digest}.png"
+
+
+def chart_path(user_id: int, filename: str) -> Path:
+    return CHART_CACHE_DIR / str(user_id) / filename
+
+
+def is_cached(user_id: int, chart: str, version: str) -> bool:
+    # LRU로 지워졌을 수 있으므로 파일이 실제로 있는지 봅니다.
+    return chart_path(user_id, chart_filename(user_id, chart, version)).is_file()
+
+
+def _load_entries() -> OrderedDict[Path, int]:
+    global _entries
+    if _entries is None:
+        files = sorted(CHART_CACHE_DIR.glob("*/*.png"), key=lambda path: path.stat().st_mtime)
+        _entries = OrderedDict((path, path.stat().st_size) for path in files)
+    return _entries
+
+
+def _evict(entries: OrderedDict[Path, int]) -> None:
+    total = sum(entries.values())
+    while total > CHART_CACHE_MAX_BYTES and len(entries) > 1:
+        path, size = entries.popitem(last=False)
+        path.unlink(missing_ok=True)
+        total -= size
+
+
+async def get_or_render(
+    user_id: int,
+    chart: str,
+    version: str,
+    render: Callable[[Path], Awaitable[None]],
+) -> str:
+    """캐시된 차트 파일 이름을 돌려주고, 없으면 render(path)로 만듭니다.
+
+    같은 키에 대한 동시 요청은 하나의 렌더링 작업을 함께 기다립니다.
+    """
+    entries = _load_entries()
+    filename = chart_filename(user_id, chart, version)
+    path = chart_path(user_id, filename)
+
+    if path in entries and path.exists():
+        entries.move_to_end(path)
+        return filename
+
+    task = _inflight.get(path)
+    if task is None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        task = asyncio.ensure_future(render(path))
+        _inflight[path] = task
+        task.add_done_callback(lambda _: _inflight.pop(path, None))
+    await asyncio.shield(task)
+
+    if path not in entries:
+        entries[path] = path.stat().st_size
+        _evict(entries)
+    return filename
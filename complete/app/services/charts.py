@@ -0,0 +1,49 @@
+"""리포트 차트 렌더링. 리포트 워커 프로세스 안에서 실행됩니다."""
+
+import math
+import os
+from datetime import date
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from matplotlib.figure import Figure
+
+
+def _save(fig: "Figure", output_path: Path) -> None:
+    # 다른 워커가 같은 파일을 읽는 중이어도 깨진 이미지가 보이지 않도록 교체 방식으로 저장합니다.
+    tmp_path = output_path.with_name(f".{output_path.name}.{os.getpid()}.tmp")
+    fig.savefig(tmp_path, dpi=140, format="png")
+    os.replace(tmp_path, output_path)
+
+
+MAX_TICK_LABELS = 12
+
+
+def build_water_report(
+    points: list[tuple[date, float]], output_path: str, title: str = "일별 수분 섭취량"
+) -> None:
+    from matplotlib.figure import Figure
+
+    output_path = Path(output_path)
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    fig = Figure(figsize=(7, 3.5), layout="tight")
+    ax = fig.subplots()
+
+    if not any(value for _, value in points):
+        ax.text(0.5, 0.5, "데이터 없음", ha="center", va="center", fontsize=12)
+        ax.axis("off")
+        _save(fig, output_path)
+        return
+
+    positions = range(len(points))
+    ax.bar(positions, [value for _, value in points], color="#6e7bff")
+    # 점이 많아도 축 글자가 겹치지 않도록 눈금 이름은 일정 간격으로만 표시합니다.
+    step = math.ceil(len(points) / MAX_TICK_LABELS)
+    ax.set_xticks(positions[::step], [day.isoformat() for day, _ in points[::step]])
+    ax.set_title(title)
+    ax.set_ylabel("ml")
+    ax.tick_params(axis="x", labelrotation=45)
+    for label in ax.get_xticklabels():
+        label.set_horizontalalignment("right")
+    _save(fig, output_path)
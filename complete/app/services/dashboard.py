@@ -0,0 +1,103 @@
+"""대시보드 데이터와 섹션 조각(fragment) 캐시.
+
+조각은 그 종류의 데이터 버전이 바뀔 때만 다시 렌더링합니다.
+"""
+
+import asyncio
+import os
+from collections import OrderedDict
+from typing import NamedTuple
+
+from markupsafe import Markup
+from tortoise.models import Model
+
+from app.models.exercise import ExerciseLog
+from app.models.meal import MealLog
+from app.models.sleep import SleepLog
+from app.models.user import User
+from app.models.water import WaterLog
+from app.services.data_versions import LogStats, user_stats
+from app.services.templates import templates
+
+RECENT_LIMIT = 5
+# 사용자마다 섹션 4개씩이므로 기본값은 최근 사용자 약 2,500명분입니다.
+DASHBOARD_CACHE_MAX_ENTRIES = int(os.getenv("HEALTH_DASHBOARD_CACHE_MAX_ENTRIES", "10000"))
+
+
+class Section(NamedTuple):
+    model: type[Model]
+    order_by: str
+    # 상단 카드에 보여 줄 합계의 컨텍스트 이름 (합계 식은 data_versions.ROW_TOTALS)
+    total_key: str
+
+
+SECTIONS: dict[str, Section] = {
+    "water": Section(WaterLog, "-logged_at", "total_water"),
+    "exercise": Section(ExerciseLog, "-logged_at", "total_exercise"),
+    "sleep": Section(SleepLog, "-sleep_date", "total_sleep_hours"),
+    "meal": Section(MealLog, "-eaten_at", "total_calories"),
+}
+
+
+class Fragment(NamedTuple):
+    version: str
+    html: Markup
+
+
+# (사용자 id, 섹션) -> 마지막으로 렌더링한 조각. 버전이 다르면 다시 만들고,
+# DASHBOARD_CACHE_MAX_ENTRIES를 넘으면 가장 오래 쓰이지 않은 것부터 버립니다.
+_fragments: OrderedDict[tuple[int, str], Fragment] = OrderedDict()
+
+
+def clear_dashboard_cache() -> None:
+    # 버전에 DB의 epoch가 들어 있어 DB를 바꿔도 예전 조각이 맞지 않으므로, 메모리를 비울 때만 씁니다.
+    _fragments.clear()
+
+
+def get_summary(stats: dict[type[Model], LogStats]) -> dict:
+    summary = {}
+    for kind, section in SECTIONS.items():
+        summary[f"{kind}_count"] = stats[section.model].count
+        summary[section.total_key] = stats[section.model].total
+    # 수면 시간은 julianday 차이를 더하고 빼 온 값이라 소수점 아래를 정리합니다.
+    summary["total_sleep_hours"] = round(summary["total_sleep_hours"], 1)
+    return summary
+
+
+async def get_recent_logs(user: User, kinds: list[str], limit: int = RECENT_LIMIT) -> dict:
+    logs = await asyncio.gather(
+        *(
+            SECTIONS[kind].model.filter(user=user).order_by(SECTIONS[kind].order_by).limit(limit)
+            for kind in kinds
+        )
+    )
+    return {f"{kind}_logs": rows for kind, rows in zip(kinds, logs)}
+
+
+async def get_dashboard_context(user: User, stats: dict[type[Model], LogStats] | None = None) -> dict:
+    """섹션별 합계와 렌더링된 섹션 HTML(sections)을 돌려줍니다.
+
+    합계는 stats(user_stats(user.id)의 결과, 없으면 여기서 읽음)에서 바로 가져오고,
+    버전이 바뀐 섹션만 최근 기록 쿼리로 다시 렌더링합니다.
+    처음(모두 비었을 때)은 섹션별 4개 쿼리, 섹션 하나가 바뀌면 1개, 모두 그대로면 0개입니다.
+    """
+    if stats is None:
+        stats = await user_stats(user.id)
+    sections = {}
+    for kind, section in SECTIONS.items():
+        fragment = _fragments.get((user.id, kind))
+        if fragment is not None and fragment.version == stats[section.model].version:
+            _fragments.move_to_end((user.id, kind))
+            sections[kind] = fragment.html
+    stale = [kind for kind in SECTIONS if kind not in sections]
+    if stale:
+        recent = await get_recent_logs(user, stale)
+        for kind in stale:
+            html = Markup(templates.get_template(f"_dashboard_{kind}.html").render(recent))
+            _fragments[user.id, kind] = Fragment(stats[SECTIONS[kind].model].version, html)
+            _fragments.move_to_end((user.id, kind))
+            sections[kind] = html
+        while len(_fragments) > DASHBOARD_CACHE_MAX_ENTRIES:
+            _fragments.popitem(last=False)
+
+    return {**get_summary(stats), "sections": {kind: sections[kind] for kind in SECTIONS}}
@@ -0,0 +1,190 @@
+"""기록 테이블별/사용자별 데이터 버전, 건수/합계와 ETag.
+
+값은 기록을 쓸 때마다 트리거가 고쳐 두는 log_stats 표에 있습니다.
+"""
+
+import secrets
+from typing import NamedTuple
+
+from fastapi import Request, Response
+from tortoise import connections
+from tortoise.models import Model
+
+from app.models.exercise import ExerciseLog
+from app.models.meal import MealLog
+from app.models.sleep import SleepLog
+from app.models.water import WaterLog
+
+# 기록 테이블 -> 합계(total)에 더할 행 하나의 값. {row}는 NEW/OLD나 테이블 이름입니다.
+ROW_TOTALS: dict[type[Model], str] = {
+    WaterLog: "{row}.amount_ml",
+    ExerciseLog: "{row}.duration_min",
+    SleepLog: "(julianday({row}.end_time) - julianday({row}.start_time)) * 24",
+    MealLog: "COALESCE({row}.calories, 0)",
+}
+TRACKED_MODELS: tuple[type[Model], ...] = tuple(ROW_TOTALS)
+
+# 트리거 이름에 세대를 넣어 둡니다. 표나 트리거 정의를 바꾸면 세대를 올리고, 시작할 때
+# 현재 세대 트리거가 없으면 예전 것을 지우고 기록 테이블에서 다시 계산해 만듭니다.
+GENERATION = 3
+_TRIGGER_PREFIX = "log_stats_v"
+# 사용자 id는 1부터이므로 0번 행에 테이블 전체의 버전/건수/합계를 둡니다.
+ALL_USERS = 0
+# epoch는 표를 만들 때 정해서 버전 문자열에 넣으므로, DB를 새로 만든 뒤
+# 예전 ETag가 우연히 맞는 일이 없습니다.
+_STATS_TABLE_SQL = """
+CREATE TABLE log_stats (
+    user_id INT NOT NULL,
+    tbl TEXT NOT NULL,
+    version INT NOT NULL,
+    row_count INT NOT NULL,
+    total NUMERIC NOT NULL,
+    PRIMARY KEY (user_id, tbl)
+) WITHOUT ROWID;
+CREATE TABLE log_stats_epoch (epoch TEXT NOT NULL);
+"""
+
+# log_stats_epoch는 한 줄뿐이라, 행이 없는 사용자도 epoch 한 줄(나머지는 NULL)은 돌아옵니다.
+LOG_STATS_SQL = (
+    "SELECT epoch, version, row_count, total FROM log_stats_epoch "
+    "LEFT JOIN log_stats ON log_stats.user_id = ? AND log_stats.tbl = ?"
+)
+USER_STATS_SQL = (
+    "SELECT epoch, tbl, version, row_count, total FROM log_stats_epoch "
+    "LEFT JOIN log_stats ON log_stats.user_id = ?"
+)
+
+
+class LogStats(NamedTuple):
+    version: str
+    count: int
+    total: int | float
+
+
+def _trigger_names(table: str) -> list[str]:
+    return [f"{_TRIGGER_PREFIX}{GENERATION}_{table}_{op}" for op in ("insert", "update", "move", "delete")]
+
+
+def _bump_sql(table: str, user_id: str, count: int, total: str) -> str:
+    # (user_id, table) 행의 버전을 올리고 건수/합계에 count/total을 더합니다.
+    return (
+        f"INSERT INTO log_stats (user_id, tbl, version, row_count, total) "
+        f"VALUES ({user_id}, '{table}', 1, {count}, {total}) "
+        "ON CONFLICT (user_id, tbl) DO UPDATE SET version = version + 1, "
+        "row_count = row_count + excluded.row_count, total = total + excluded.total;"
+    )
+
+
+def _triggers_sql(model: type[Model]) -> str:
+    table = model._meta.db_table
+    new, old = ROW_TOTALS[model].format(row="NEW"), ROW_TOTALS[model].format(row="OLD")
+    changed = f"({new}) - ({old})"
+    insert, update, move, delete = _trigger_names(table)
+    # 사용자 행과 함께 테이블 전체(ALL_USERS) 행도 같은 만큼 고칩니다.
+    return f"""
+CREATE TRIGGER "{insert}" AFTER INSERT ON "{table}" BEGIN
+{_bump_sql(table, "NEW.user_id", 1, new)}
+{_bump_sql(table, str(ALL_USERS), 1, new)}
+END;
+CREATE TRIGGER "{update}" AFTER UPDATE ON "{table}" WHEN OLD.user_id = NEW.user_id BEGIN
+{_bump_sql(table, "NEW.user_id", 0, changed)}
+{_bump_sql(table, str(ALL_USERS), 0, changed)}
+END;
+CREATE TRIGGER "{move}" AFTER UPDATE ON "{table}" WHEN OLD.user_id != NEW.user_id BEGIN
+{_bump_sql(table, "OLD.user_id", -1, f"-({old})")}
+{_bump_sql(table, "NEW.user_id", 1, new)}
+{_bump_sql(table, str(ALL_USERS), 0, changed)}
+END;
+CREATE TRIGGER "{delete}" AFTER DELETE ON "{table}" BEGIN
+{_bump_sql(table, "OLD.user_id", -1, f"-({old})")}
+{_bump_sql(table, str(ALL_USERS), -1, f"-({old})")}
+END;
+"""
+
+
+def _backfill_sql(model: type[Model]) -> str:
+    table = model._meta.db_table
+    total = ROW_TOTALS[model].format(row=f'"{table}"')
+    return (
+        f"INSERT INTO log_stats (user_id, tbl, version, row_count, total) "
+        f"SELECT user_id, '{table}', 1, COUNT(*), SUM({total}) FROM \"{table}\" GROUP BY user_id;\n"
+        f"INSERT INTO log_stats (user_id, tbl, version, row_count, total) "
+        f"SELECT {ALL_USERS}, '{table}', 1, COUNT(*), COALESCE(SUM({total}), 0) FROM \"{table}\";"
+    )
+
+
+async def install_version_tracking() -> bool:
+    """현재 세대의 추적 표/트리거가 없으면 만들고 True를 돌려줍니다. (init_db에서 부름)
+
+    여러 워커가 동시에 시작해도 BEGIN IMMEDIATE로 한 번에 하나씩만 다시 만들고,
+    다시 만들어도 기록 테이블에서 계산하므로 결과는 같습니다.
+    """
+    conn = connections.get("default")
+    tables = [model._meta.db_table for model in TRACKED_MODELS]
+    rows = await conn.execute_query_dict("SELECT name FROM sqlite_master WHERE type = 'trigger'")
+    existing = {row["name"] for row in rows}
+    if all(name in existing for table in tables for name in _trigger_names(table)):
+        return False
+    stale = sorted(name for name in existing if name.startswith(_TRIGGER_PREFIX))
+    script = [
+        "BEGIN IMMEDIATE;",
+        *(f'DROP TRIGGER IF EXISTS "{name}";' for name in stale),
+        "DROP TABLE IF EXISTS log_stats;",
+        "DROP TABLE IF EXISTS log_stats_epoch;",
+        _STATS_TABLE_SQL,
+        *map(_triggers_sql, TRACKED_MODELS),
+        *map(_backfill_sql, TRACKED_MODELS),
+        f"INSERT INTO log_stats_epoch (epoch) VALUES ('{secrets.token_hex(4)}');",
+        "COMMIT;",
+    ]
+    await conn.execute_script("\n".join(script))
+    return True
+
+
+async def log_stats(model: type[Model], user_id: int | None = None) -> LogStats:
+    """user_id 사용자(None이면 테이블 전체)의 model 기록 버전/건수/합계 (기본 키 조회 한 번)."""
+    _, rows = await connections.get("default").execute_query(
+        LOG_STATS_SQL, [ALL_USERS if user_id is None else user_id, model._meta.db_table]
+    )
+    epoch, version, count, total = rows[0]
+    scope = "" if user_id is None else f".u{user_id}"
+    return LogStats(f"{epoch}.{model.__name__}{scope}.{version or 0}", count or 0, total or 0)
+
+
+async def data_version(model: type[Model], user_id: int | None = None) -> str:
+    """user_id가 있으면 그 사용자 기록의 버전, 없으면 테이블 전체 버전."""
+    return (await log_stats(model, user_id)).version
+
+
+async def user_stats(user_id: int) -> dict[type[Model], LogStats]:
+    """user_id 사용자의 모든 기록 종류의 버전/건수/합계를 한 번의 쿼리로 읽습니다."""
+    _, rows = await connections.get("default").execute_query(USER_STATS_SQL, [user_id])
+    epoch = rows[0][0]
+    by_table = {table: (version, count, total) for _, table, version, count, total in rows}
+    stats = {}
+    for model in TRACKED_MODELS:
+        version, count, total = by_table.get(model._meta.db_table, (0, 0, 0))
+        stats[model] = LogStats(f"{epoch}.{model.__name__}.u{user_id}.{version}", count, total)
+    return stats
+
+
+def make_etag(*parts: object) -> str:
+    # parts를 이어 붙일 뿐입니다. 데이터 버전(epoch 포함)과 응답을 바꾸는 조건을 모두 넘기고,
+    # HTML 응답은 pages.page_etag로 템플릿 빌드 해시도 넣습니다.
+    return '"' + "-".join(map(str, parts)) + '"'
+
+
+def not_modified(request: Request, etag: str) -> Response | None:
+    """If-None-Match가 etag와 맞으면 304 응답을, 아니면 None을 돌려줍니다."""
+    header = request.headers.get("if-none-match")
+    if not header:
+        return None
+    candidates = {tag.strip().removeprefix("W/") for tag in header.split(",")}
+    if etag in candidates or "*" in candidates:
+        return Response(status_code=304, headers=etag_headers(etag))
+    return None
+
+
+def etag_headers(etag: str) -> dict[str, str]:
+    # no-cache: 브라우저가 저장은 하되 쓸 때마다 ETag로 다시 확인하게 합니다.
+    return {"ETag": etag, "Cache-Control": "no-cache"}
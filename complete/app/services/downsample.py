@@ -0,0 +1,50 @@
+"""시계열 다운샘플링 (LTTB: 구간마다 삼각형 넓이가 가장 큰 점을 남깁니다)."""
+
+from datetime import date
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import numpy as np
+
+
+def lttb_indices(x: "np.ndarray", y: "np.ndarray", n_out: int) -> "np.ndarray":
+    """x 오름차순인 (x, y)에서 남길 점의 인덱스 n_out개를 돌려줍니다."""
+    import numpy as np
+
+    if n_out < 3:
+        raise ValueError("n_out은 3 이상이어야 합니다.")
+    n = len(x)
+    if n_out >= n:
+        return np.arange(n)
+
+    # 첫/마지막 점을 뺀 n-2개 점을 n_out-2개 구간으로 나눈 경계
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.intp)
+    sums_x = np.add.reduceat(x[1 : n - 1], edges[:-1] - 1)
+    sums_y = np.add.reduceat(y[1 : n - 1], edges[:-1] - 1)
+    counts = np.diff(edges)
+    # 다음 구간 평균점. 마지막 구간의 "다음"은 마지막 점입니다.
+    next_x = np.append(sums_x[1:] / counts[1:], x[-1])
+    next_y = np.append(sums_y[1:] / counts[1:], y[-1])
+
+    selected = np.empty(n_out, dtype=np.intp)
+    selected[0], selected[-1] = 0, n - 1
+    prev = 0
+    for i in range(n_out - 2):
+        lo, hi = edges[i], edges[i + 1]
+        ax, ay = x[prev], y[prev]
+        # 세 점으로 만든 삼각형 넓이의 2배 (부호만 떼면 비교에 충분)
+        area = np.abs((ax - next_x[i]) * (y[lo:hi] - ay) - (ax - x[lo:hi]) * (next_y[i] - ay))
+        prev = lo + int(np.argmax(area))
+        selected[i + 1] = prev
+    return selected
+
+
+def downsample_points(points: list[tuple[date, float]], max_points: int) -> list[tuple[date, float]]:
+    """날짜순 (날짜, 값) 목록을 LTTB로 max_points개 이하로 줄입니다."""
+    if len(points) <= max_points:
+        return points
+    import numpy as np
+
+    x = np.fromiter((day.toordinal() for day, _ in points), dtype=np.float64, count=len(points))
+    y = np.fromiter((value for _, value in points), dtype=np.float64, count=len(points))
+    return [points[i] for i in lttb_indices(x, y, max_points)]
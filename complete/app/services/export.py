@@ -0,0 +1,62 @@
+"""사용자 기록 전체를 NDJSON/CSV로 청크씩 스트리밍 내보내기."""
+
+import csv
+import io
+from collections.abc import AsyncIterator
+
+from pydantic_core import to_json
+from tortoise.expressions import Q
+
+from app.services.log_kinds import LOG_KINDS, LogKind
+
+EXPORT_CHUNK_SIZE = 2000
+
+
+async def iter_chunks(kind: LogKind, user_id: int) -> AsyncIterator[list[dict]]:
+    """한 사용자의 기록을 오래된 순서로 청크 단위로 읽습니다."""
+    ts_field = kind.ts_field
+    last = None
+    while True:
+        queryset = kind.model.filter(user_id=user_id)
+        if last is not None:
+            last_ts, last_id = last
+            queryset = queryset.filter(**{f"{ts_field}__gte": last_ts}).filter(
+                ~Q(**{ts_field: last_ts, "id__lte": last_id})
+            )
+        rows = await queryset.order_by(ts_field, "id").limit(EXPORT_CHUNK_SIZE).values(
+            *kind.columns
+        )
+        if rows:
+            yield rows
+        if len(rows) < EXPORT_CHUNK_SIZE:
+            return
+        last = rows[-1][ts_field], rows[-1]["id"]
+
+
+async def export_ndjson(kinds: list[str], user_id: int) -> AsyncIterator[bytes]:
+    for name in kinds:
+        async for rows in iter_chunks(LOG_KINDS[name], user_id):
+            yield b"".join(to_json({"type": name, **row}) + b"\n" for row in rows)
+
+
+def csv_columns(kinds: list[str]) -> list[str]:
+    columns = ["type"]
+    for name in kinds:
+        columns += [c for c in LOG_KINDS[name].columns if c not in columns]
+    return columns
+
+
+async def export_csv(kinds: list[str], user_id: int) -> AsyncIterator[bytes]:
+    columns = csv_columns(kinds)
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, fieldnames=columns, extrasaction="ignore")
+    writer.writeheader()
+    for name in kinds:
+        async for rows in iter_chunks(LOG_KINDS[name], user_id):
+            for row in rows:
+                writer.writerow({"type": name, **row})
+            yield buffer.getvalue().encode()
+            buffer.seek(0)
+            buffer.truncate()
+    if buffer.tell():
+        yield buffer.getvalue().encode()
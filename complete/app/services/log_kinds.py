@@ -0,0 +1,28 @@
+from typing import NamedTuple
+
+from pydantic import BaseModel
+from tortoise.models import Model
+
+from app.models.exercise import ExerciseLog
+from app.models.meal import MealLog
+from app.models.sleep import SleepLog
+from app.models.water import WaterLog
+from app.schemas import ExerciseOut, MealOut, SleepOut, WaterOut
+
+
+class LogKind(NamedTuple):
+    model: type[Model]
+    ts_field: str
+    out_schema: type[BaseModel]
+
+    @property
+    def columns(self) -> list[str]:
+        return list(self.out_schema.model_fields)
+
+
+LOG_KINDS = {
+    "water": LogKind(WaterLog, "logged_at", WaterOut),
+    "exercise": LogKind(ExerciseLog, "logged_at", ExerciseOut),
+    "sleep": LogKind(SleepLog, "sleep_date", SleepOut),
+    "meal": LogKind(MealLog, "eaten_at", MealOut),
+}
@@ -0,0 +1,15 @@
+"""HTML 목록 페이지의 페이지 읽기. 총 건수는 세지 않고 log_stats에서 읽습니다."""
+
+from app.services.log_kinds import LOG_KINDS
+from app.services.pagination import PageParams, apply_page, split_page
+
+PAGE_SIZE = 50
+MAX_PAGE_SIZE = 200
+
+
+async def read_page(kind: str, user_id: int, limit: int, cursor: str | None) -> tuple[list, str | None]:
+    """최신순 한 페이지(모델 인스턴스)와 다음 페이지 커서(마지막이면 None)."""
+    spec = LOG_KINDS[kind]
+    page = PageParams(limit=limit, cursor=cursor, user_id=user_id, from_=None, to=None)
+    rows = await apply_page(spec.model.all(), spec.ts_field, page)
+    return split_page(rows, spec.ts_field, limit)
@@ -0,0 +1,260 @@
+"""Prometheus 텍스트 형식 지표 (HTTP 요청, DB 쿼리, 차트 렌더링)."""
+
+import time
+from bisect import bisect_left
+from contextvars import ContextVar, Token
+
+from starlette.routing import Match
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+QUERY_BUCKETS = (0.0001, 0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0)
+COUNT_BUCKETS = (0, 1, 2, 3, 5, 8, 13, 21, 50)
+# id가 들어간 경로가 많아도 메모리가 무한정 늘지 않도록 가득 차면 비웁니다.
+ROUTE_CACHE_SIZE = 4096
+
+_metrics: list["_Metric"] = []
+
+
+def _escape(value: object) -> str:
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_labels(names: tuple[str, ...], values: tuple, extra: str = "") -> str:
+    parts = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        parts.append(extra)
+    return "{" + ",".join(parts) + "}" if parts else ""
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class _Metric:
+    kind = ""
+
+    def __init__(self, name: str, documentation: str, labels: tuple[str, ...] = ()) -> None:
+        self.name = name
+        self.documentation = documentation
+        self.label_names = labels
+        _metrics.append(self)
+
+    def header(self) -> list[str]:
+        return [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.kind}"]
+
+
+class Counter(_Metric):
+    kind = "counter"
+
+    def __init__(self, name: str, documentation: str, labels: tuple[str, ...] = ()) -> None:
+        super().__init__(name, documentation, labels)
+        self.values: dict[tuple, float] = {}
+
+    def inc(self, *labels, amount: float = 1) -> None:
+        self.values[labels] = self.values.get(labels, 0) + amount
+
+    def render(self) -> list[str]:
+        return self.header() + [
+            f"{self.name}{_format_labels(self.label_names, labels)} {_format_value(value)}"
+            for labels, value in self.values.items()
+        ]
+
+
+class Gauge(Counter):
+    kind = "gauge"
+
+    def dec(self, *labels, amount: float = 1) -> None:
+        self.values[labels] = self.values.get(labels, 0) - amount
+
+
+class Histogram(_Metric):
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labels: tuple[str, ...] = (),
+        buckets: tuple[float, ...] = DEFAULT_BUCKETS,
+    ) -> None:
+        super().__init__(name, documentation, labels)
+        self.buckets = buckets
+        # 라벨 값 -> [버킷별 개수..., +Inf 개수, 합계]
+        self.values: dict[tuple, list[float]] = {}
+
+    def observe(self, value: float, *labels) -> None:
+        counts = self.values.get(labels)
+        if counts is None:
+            counts = self.values[labels] = [0] * (len(self.buckets) + 1) + [0.0]
+        # 누적은 출력할 때 계산하고, 여기서는 해당 버킷 하나만 올립니다.
+        counts[bisect_left(self.buckets, value)] += 1
+        counts[-1] += value
+
+    def render(self) -> list[str]:
+        lines = self.header()
+        for labels, counts in self.values.items():
+            cumulative = 0
+            for bound, count in zip((*self.buckets, float("inf")), counts):
+                cumulative += count
+                le = f'le="{_format_value(bound)}"'
+                lines.append(f"{self.name}_bucket{_format_labels(self.label_names, labels, le)} {cumulative}")
+            lines.append(f"{self.name}_sum{_format_labels(self.label_names, labels)} {counts[-1]!r}")
+            lines.append(f"{self.name}_count{_format_labels(self.label_names, labels)} {cumulative}")
+        return lines
+
+
+def render_metrics() -> str:
+    return "\n".join(line for metric in _metrics for line in metric.render()) + "\n"
+
+
+HTTP_REQUESTS = Counter("http_requests_total", "HTTP 요청 수", ("method", "route", "status"))
+HTTP_DURATION = Histogram("http_request_duration_seconds", "HTTP 요청 처리 시간", ("method", "route"))
+HTTP_IN_PROGRESS = Gauge("http_requests_in_progress", "처리 중인 HTTP 요청 수", ("method", "route"))
+REQUEST_QUERIES = Histogram(
+    "http_request_db_queries", "요청 하나가 실행한 DB 쿼리 수", ("method", "route"), COUNT_BUCKETS
+)
+REQUEST_DB_SECONDS = Histogram(
+    "http_request_db_seconds", "요청 하나가 DB 쿼리에 쓴 시간", ("method", "route"), QUERY_BUCKETS
+)
+DB_QUERY_DURATION = Histogram("db_query_duration_seconds", "DB 쿼리 하나의 실행 시간", (), QUERY_BUCKETS)
+CHART_RENDER = Histogram("chart_render_seconds", "리포트 차트 렌더링 시간", ("chart",))
+CHART_RENDER_FAILURES = Counter("chart_render_failures_total", "리포트 차트 렌더링 실패 수", ("chart", "reason"))
+
+
+class QueryStats:
+    """한 요청 안에서 실행된 쿼리 수와 총 시간."""
+
+    __slots__ = ("count", "seconds", "statements")
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.seconds = 0.0
+        # SQL 문장별 실행 횟수. N+1 탐지(query_budget)가 켜져 있을 때만 dict로 바꿔 모읍니다.
+        self.statements: dict[str, int] | None = None
+
+
+_query_stats: ContextVar[QueryStats | None] = ContextVar("query_stats", default=None)
+_hooks_installed = False
+
+
+def current_query_stats() -> QueryStats | None:
+    return _query_stats.get()
+
+
+def enter_query_stats() -> tuple[QueryStats, Token | None]:
+    """현재 요청의 QueryStats를 돌려줍니다.
+
+    바깥 미들웨어가 이미 모으고 있으면 그것을 같이 쓰고(토큰 None), 없으면 새로 만듭니다.
+    """
+    stats = _query_stats.get()
+    if stats is not None:
+        return stats, None
+    stats = QueryStats()
+    return stats, _query_stats.set(stats)
+
+
+def exit_query_stats(token: Token | None) -> None:
+    if token is not None:
+        _query_stats.reset(token)
+
+
+def _timed(method):
+    async def wrapper(self, query, *args, **kwargs):
+        start = time.perf_counter()
+        try:
+            return await method(self, query, *args, **kwargs)
+        finally:
+            elapsed = time.perf_counter() - start
+            DB_QUERY_DURATION.observe(elapsed)
+            stats = _query_stats.get()
+            if stats is not None:
+                stats.count += 1
+                stats.seconds += elapsed
+                if stats.statements is not None:
+                    stats.statements[query] = stats.statements.get(query, 0) + 1
+
+    wrapper.__wrapped__ = method
+    return wrapper
+
+
+def install_query_hooks() -> None:
+    """Tortoise SQLite 클라이언트의 execute_* 메서드를 감싸 쿼리 수와 시간을 잽니다.
+
+    트랜잭션 래퍼는 클라이언트를 상속하고 execute_many만 따로 구현하므로 그것도 감쌉니다.
+    """
+    global _hooks_installed
+    if _hooks_installed:
+        return
+    from tortoise.backends.sqlite.client import SqliteClient, SqliteTransactionWrapper
+
+    for cls, names in (
+        (SqliteClient, ("execute_insert", "execute_many", "execute_query", "execute_query_dict", "execute_script")),
+        (SqliteTransactionWrapper, ("execute_many",)),
+    ):
+        for name in names:
+            setattr(cls, name, _timed(cls.__dict__[name]))
+    _hooks_installed = True
+
+
+class MetricsMiddleware:
+    """요청마다 라우트 템플릿별 지표를 기록하는 순수 ASGI 미들웨어."""
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+        self.routes = None
+        # (메서드, 경로) -> 라우트 템플릿. 라우트 목록을 매번 훑는 비용(수십 us)을 아낍니다.
+        self.templates: dict[tuple[str, str], str] = {}
+
+    def route_template(self, scope: Scope) -> str:
+        key = (scope["method"], scope["path"])
+        template = self.templates.get(key)
+        if template is not None:
+            return template
+        if self.routes is None:
+            self.routes = scope["app"].router.routes
+        partial = None
+        for route in self.routes:
+            match, _ = route.matches(scope)
+            if match is Match.FULL:
+                template = route.path
+                break
+            if match is Match.PARTIAL and partial is None:
+                partial = route.path
+        else:
+            # 존재하지 않는 경로는 하나로 묶어서 라벨 수가 늘어나지 않게 합니다.
+            template = partial or "<unmatched>"
+        if len(self.templates) >= ROUTE_CACHE_SIZE:
+            self.templates.clear()
+        self.templates[key] = template
+        return template
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        method = scope["method"]
+        route = self.route_template(scope)
+        status = 500
+
+        async def send_wrapper(message) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        stats, token = enter_query_stats()
+        HTTP_IN_PROGRESS.inc(method, route)
+        start = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            HTTP_DURATION.observe(time.perf_counter() - start, method, route)
+            HTTP_IN_PROGRESS.dec(method, route)
+            HTTP_REQUESTS.inc(method, route, status)
+            REQUEST_QUERIES.observe(stats.count, method, route)
+            REQUEST_DB_SECONDS.observe(stats.seconds, method, route)
+            exit_query_stats(token)
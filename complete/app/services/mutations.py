@@ -0,0 +1,88 @@
+"""기록 수정/삭제. id와 user_id 조건을 붙인 UPDATE/DELETE 한 문장으로 처리합니다."""
+
+from datetime import date, datetime, time, timedelta, timezone
+from typing import Any
+
+from tortoise import connections
+from tortoise.fields import DatetimeField
+from tortoise.queryset import DeleteQuery, QuerySet, UpdateQuery
+
+from app.services.log_kinds import LogKind
+
+# SQLite 바인드 변수 한도(32766) 안쪽으로 잡습니다.
+MAX_BATCH_IDS = 10_000
+
+
+async def changed_rows(query: UpdateQuery | DeleteQuery) -> int:
+    """UPDATE/DELETE 쿼리를 실행하고 그 문장이 바꾼 기록 행 수(트리거가 쓴 행 제외)를 돌려줍니다."""
+    # Tortoise는 total_changes 차이로 행 수를 세어 트리거가 log_stats에 쓴 행까지 더하므로
+    # RETURNING으로 돌려받은 행으로 셉니다.
+    query.sql()  # 쿼리를 만들어 query.query에 채웁니다.
+    sql, values = query.query.get_parameterized_sql()
+    _, rows = await connections.get("default").execute_query(f"{sql} RETURNING 1", values)
+    return len(rows)
+
+
+def stored_fields(kind: LogKind, fields: dict[str, Any]) -> dict[str, Any]:
+    """쿼리셋 update에 넘길 값. 시각은 모델 저장 경로처럼 기본 시간대(UTC)로 맞춥니다."""
+    # 쿼리셋 update는 시각을 그대로 문자열로 쓰는데, 타임스탬프는 문자열로 비교하므로
+    # +09:00 같은 오프셋이 남으면 정렬과 기간 조건이 어긋납니다.
+    fields_map = kind.model._meta.fields_map
+    return {
+        name: fields_map[name].to_python_value(value) if isinstance(fields_map[name], DatetimeField) else value
+        for name, value in fields.items()
+    }
+
+
+async def update_log(kind: LogKind, log_id: int, user_id: int, **fields: Any) -> bool:
+    """user_id 사용자의 log_id 기록을 고칩니다. 그런 기록이 없으면 False."""
+    query = kind.model.filter(id=log_id, user_id=user_id).update(**stored_fields(kind, fields))
+    return bool(await changed_rows(query))
+
+
+async def delete_log(kind: LogKind, log_id: int, user_id: int) -> bool:
+    """user_id 사용자의 log_id 기록을 지웁니다. 그런 기록이 없으면 False."""
+    return bool(await changed_rows(kind.model.filter(id=log_id, user_id=user_id).delete()))
+
+
+def nullable_fields(kind: LogKind) -> set[str]:
+    return {name for name, field in kind.model._meta.fields_map.items() if field.null}
+
+
+def _day_bound(kind: LogKind, day: date) -> date | datetime:
+    # 시각 컬럼은 UTC 자정과, 날짜 컬럼(수면의 sleep_date)은 날짜 그대로 비교합니다.
+    if isinstance(kind.model._meta.fields_map[kind.ts_field], DatetimeField):
+        return datetime.combine(day, time.min, tzinfo=timezone.utc)
+    return day
+
+
+def select_logs(
+    kind: LogKind, user_id: int, ids: list[int] | None = None, from_: date | None = None, to: date | None = None
+) -> QuerySet:
+    """user_id 사용자의 기록 중 ids에 있거나 기간 [from_, to](날짜, 양끝 포함) 안의 것.
+
+    둘 다 주면 두 조건을 모두 만족하는 기록입니다. 아무 조건도 없으면 전체 삭제를 막기 위해
+    ValueError를 던집니다.
+    """
+    if not ids and from_ is None and to is None:
+        raise ValueError("ids나 기간(from/to) 중 하나는 있어야 합니다.")
+    if ids and len(ids) > MAX_BATCH_IDS:
+        raise ValueError(f"ids는 한 번에 {MAX_BATCH_IDS}개까지입니다.")
+    queryset = kind.model.filter(user_id=user_id)
+    if ids:
+        queryset = queryset.filter(id__in=ids)
+    if from_ is not None:
+        queryset = queryset.filter(**{f"{kind.ts_field}__gte": _day_bound(kind, from_)})
+    if to is not None:
+        queryset = queryset.filter(**{f"{kind.ts_field}__lt": _day_bound(kind, to + timedelta(days=1))})
+    return queryset
+
+
+async def update_logs(kind: LogKind, user_id: int, fields: dict[str, Any], **selection: Any) -> int:
+    """select_logs로 고른 기록을 UPDATE 한 문장으로 고치고 바뀐 행 수를 돌려줍니다."""
+    return await changed_rows(select_logs(kind, user_id, **selection).update(**stored_fields(kind, fields)))
+
+
+async def delete_logs(kind: LogKind, user_id: int, **selection: Any) -> int:
+    """select_logs로 고른 기록을 DELETE 한 문장으로 지우고 지운 행 수를 돌려줍니다."""
+    return await changed_rows(select_logs(kind, user_id, **selection).delete())
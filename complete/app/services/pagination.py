@@ -0,0 +1,88 @@
+"""(타임스탬프, id) 기준 키셋 페이지네이션.
+
+커서는 마지막 행의 (타임스탬프, id)를 base64로 감싼 문자열입니다.
+"""
+
+import base64
+import json
+from datetime import date, datetime
+
+from fastapi import HTTPException, Query
+from tortoise import fields
+from tortoise.expressions import Q
+from tortoise.queryset import QuerySet
+
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 500
+
+
+class PageParams:
+    """목록 API 공통 쿼리 파라미터 (Depends로 주입)."""
+
+    def __init__(
+        self,
+        limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+        cursor: str | None = None,
+        user_id: int | None = None,
+        from_: datetime | None = Query(None, alias="from"),
+        to: datetime | None = None,
+    ) -> None:
+        self.limit = limit
+        self.cursor = cursor
+        self.user_id = user_id
+        self.from_ = from_
+        self.to = to
+
+
+def encode_cursor(ts: date | datetime, log_id: int) -> str:
+    raw = json.dumps([ts.isoformat(), log_id]).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, is_date: bool) -> tuple[date | datetime, int]:
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        ts, log_id = json.loads(raw)
+        parse = date.fromisoformat if is_date else datetime.fromisoformat
+        return parse(ts), int(log_id)
+    except (ValueError, TypeError):
+        raise HTTPException(status_code=400, detail="invalid cursor") from None
+
+
+def _is_date_field(queryset: QuerySet, ts_field: str) -> bool:
+    field = queryset.model._meta.fields_map[ts_field]
+    return isinstance(field, fields.DateField) and not isinstance(field, fields.DatetimeField)
+
+
+def apply_page(queryset: QuerySet, ts_field: str, page: PageParams) -> QuerySet:
+    """필터, 커서, 정렬, limit(+1)을 적용한 쿼리셋을 돌려줍니다."""
+    is_date = _is_date_field(queryset, ts_field)
+    if page.user_id is not None:
+        queryset = queryset.filter(user_id=page.user_id)
+    if page.from_ is not None:
+        start = page.from_.date() if is_date else page.from_
+        queryset = queryset.filter(**{f"{ts_field}__gte": start})
+    if page.to is not None:
+        end = page.to.date() if is_date else page.to
+        queryset = queryset.filter(**{f"{ts_field}__lt": end})
+    if page.cursor:
+        ts, log_id = decode_cursor(page.cursor, is_date)
+        # ts <= 커서 범위로 인덱스를 타고, 같은 ts에서는 id로 이어서 읽습니다.
+        queryset = queryset.filter(**{f"{ts_field}__lte": ts}).filter(
+            ~Q(**{ts_field: ts, "id__gte": log_id})
+        )
+    return queryset.order_by(f"-{ts_field}", "-id").limit(page.limit + 1)
+
+
+def split_page(rows: list, ts_field: str, limit: int) -> tuple[list, str | None]:
+    """limit+1개로 읽은 결과를 (이번 페이지, 다음 커서)로 나눕니다.
+
+    rows는 모델 인스턴스 목록이나 .values()로 읽은 dict 목록 모두 됩니다.
+    """
+    if len(rows) <= limit:
+        return rows, None
+    rows = rows[:limit]
+    last = rows[-1]
+    if isinstance(last, dict):
+        return rows, encode_cursor(last[ts_field], last["id"])
+    return rows, encode_cursor(getattr(last, ts_field), last.id)
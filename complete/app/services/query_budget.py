@@ -0,0 +1,96 @@
+"""요청별 쿼리 수 확인(@query_budget)과 N+1 탐지."""
+
+import logging
+import os
+
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from app.services.metrics import enter_query_stats, exit_query_stats
+
+# HEALTH_QUERY_DEBUG=1: 응답에 X-DB-Queries/X-DB-Time-ms 헤더를 붙입니다.
+# HEALTH_QUERY_BUDGET=warn|strict: 예산 초과나 같은 SQL 반복(N+1)을 경고 로그로 남기거나(warn)
+# QueryBudgetExceeded로 던집니다(strict, 테스트/벤치용).
+QUERY_DEBUG = os.getenv("HEALTH_QUERY_DEBUG", "0") == "1"
+QUERY_BUDGET_MODE = os.getenv("HEALTH_QUERY_BUDGET", "off")
+QUERY_REPEAT_LIMIT = int(os.getenv("HEALTH_QUERY_REPEAT_LIMIT", "5"))
+
+logger = logging.getLogger(__name__)
+
+
+class QueryBudgetExceeded(RuntimeError):
+    pass
+
+
+def query_budget(limit: int | None):
+    """핸들러가 요청 하나에 실행해도 되는 최대 쿼리 수를 선언합니다.
+
+    None은 내보내기처럼 데이터 양에 비례해 같은 쿼리를 청크마다 반복하는 핸들러로,
+    쿼리 수와 반복 검사를 모두 건너뜁니다.
+    """
+
+    def decorator(endpoint):
+        endpoint.query_budget = limit
+        return endpoint
+
+    return decorator
+
+
+def query_enabled() -> bool:
+    return QUERY_DEBUG or QUERY_BUDGET_MODE != "off"
+
+
+def budget_violations(scope: Scope, count: int, statements: dict[str, int]) -> list[str]:
+    problems = []
+    endpoint = scope.get("endpoint")
+    limit = getattr(endpoint, "query_budget", None)
+    if limit is None and hasattr(endpoint, "query_budget"):
+        return problems
+    if limit is not None and count > limit:
+        problems.append(f"쿼리 {count}개 (한도 {limit}개)")
+    for sql, times in statements.items():
+        if times >= QUERY_REPEAT_LIMIT:
+            problems.append(f"같은 쿼리 {times}번 반복 (N+1 의심): {sql[:200]}")
+    return problems
+
+
+class QueryBudgetMiddleware:
+    """쿼리 수 헤더를 붙이고, 선언된 쿼리 수를 넘은 요청을 잡아내는 ASGI 미들웨어."""
+
+    def __init__(self, app: ASGIApp, debug: bool = QUERY_DEBUG, mode: str = QUERY_BUDGET_MODE) -> None:
+        if mode not in ("off", "warn", "strict"):
+            raise ValueError(f"HEALTH_QUERY_BUDGET은 off, warn, strict 중 하나여야 합니다: {mode}")
+        self.app = app
+        self.debug = debug
+        self.mode = mode
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        stats, token = enter_query_stats()
+        if self.mode != "off":
+            stats.statements = {}
+
+        async def send_wrapper(message) -> None:
+            if self.debug and message["type"] == "http.response.start":
+                message["headers"] = [
+                    *message.get("headers", []),
+                    (b"x-db-queries", str(stats.count).encode()),
+                    (b"x-db-time-ms", f"{stats.seconds * 1000:.2f}".encode()),
+                ]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+            if self.mode != "off":
+                problems = budget_violations(scope, stats.count, stats.statements)
+                if problems:
+                    where = f"{scope['method']} {scope['path']}"
+                    if self.mode == "strict":
+                        raise QueryBudgetExceeded(f"{where}: " + "; ".join(problems))
+                    for problem in problems:
+                        logger.warning("%s: %s", where, problem)
+        finally:
+            stats.statements = None
+            exit_query_stats(token)
@@ -0,0 +1,202 @@
+"""리포트용 일/주/월 집계 쿼리."""
+
+import math
+import os
+from datetime import date, datetime, timedelta, timezone
+from typing import Literal, NamedTuple
+
+from fastapi import HTTPException
+from tortoise import connections
+from tortoise.models import Model
+
+from app.models.exercise import ExerciseLog
+from app.models.meal import MealLog
+from app.models.sleep import SleepLog
+from app.models.water import WaterLog
+
+Granularity = Literal["day", "week", "month"]
+GRANULARITIES: tuple[Granularity, ...] = ("day", "week", "month")
+
+REPORT_DEFAULT_DAYS = int(os.getenv("HEALTH_REPORT_DEFAULT_DAYS", "30"))
+REPORT_MAX_POINTS = int(os.getenv("HEALTH_REPORT_MAX_POINTS", "60"))
+# 한 번에 볼 수 있는 최대 기간. 버킷 목록과 월 단위 점 수가 이 안에서 정해집니다.
+REPORT_MAX_DAYS = int(os.getenv("HEALTH_REPORT_MAX_DAYS", str(100 * 366)))
+# 이 밖의 날짜는 거절합니다. (date.min/max 근처에서 하루/한 달을 더하고 빼다 넘치지 않게)
+REPORT_MIN_DATE = date(1900, 1, 1)
+REPORT_MAX_DATE = date(2999, 12, 31)
+
+
+class Metric(NamedTuple):
+    model: type[Model]
+    ts_field: str
+    value_sql: str
+    unit: str
+
+
+METRICS = {
+    "water": Metric(WaterLog, "logged_at", "SUM(amount_ml)", "ml"),
+    "exercise": Metric(ExerciseLog, "logged_at", "SUM(duration_min)", "분"),
+    "meal": Metric(MealLog, "eaten_at", "TOTAL(calories)", "kcal"),
+    "sleep": Metric(
+        SleepLog, "sleep_date", "TOTAL(strftime('%s', end_time) - strftime('%s', start_time)) / 3600.0", "시간"
+    ),
+}
+
+# 버킷 시작일(YYYY-MM-DD)을 만드는 식. 주는 월요일에 시작합니다.
+BUCKET_SQL = {
+    "day": "date({ts})",
+    "week": "date({ts}, 'weekday 0', '-6 days')",
+    "month": "strftime('%Y-%m-01', {ts})",
+}
+
+
+def bucket_sql(
+    metric: str,
+    user_id: int,
+    granularity: Granularity = "day",
+    start: date | None = None,
+    end: date | None = None,
+) -> tuple[str, list]:
+    spec = METRICS[metric]
+    ts = f'"{spec.ts_field}"'
+    bucket = BUCKET_SQL[granularity].format(ts=ts)
+    where = ["user_id = ?"]
+    params: list = [user_id]
+    # 시각은 'YYYY-MM-DD HH:MM:SS+00:00' 문자열로 저장되므로 날짜 문자열과 바로 비교됩니다.
+    if start is not None:
+        where.append(f"{ts} >= ?")
+        params.append(start.isoformat())
+    if end is not None:
+        where.append(f"{ts} < ?")
+        params.append(end.isoformat())
+    sql = f"""
+        SELECT {bucket} AS bucket, {spec.value_sql} AS value
+        FROM "{spec.model._meta.db_table}"
+        WHERE {" AND ".join(where)}
+        GROUP BY bucket
+        ORDER BY bucket
+    """
+    return sql, params
+
+
+class ReportWindow(NamedTuple):
+    start: date
+    end: date  # 포함하지 않는 끝 날짜
+    granularity: Granularity
+    stride: int  # 점 하나에 묶이는 버킷 수
+
+
+def bucket_start(day: date, granularity: Granularity) -> date:
+    if granularity == "week":
+        return day - timedelta(days=day.weekday())
+    if granularity == "month":
+        return day.replace(day=1)
+    return day
+
+
+def bucket_starts(start: date, end: date, granularity: Granularity) -> list[date]:
+    """[start, end) 구간에 걸치는 모든 버킷의 시작일."""
+    starts = []
+    current = bucket_start(start, granularity)
+    while current < end:
+        starts.append(current)
+        if granularity == "day":
+            current += timedelta(days=1)
+        elif granularity == "week":
+            current += timedelta(days=7)
+        else:
+            current = (current + timedelta(days=32)).replace(day=1)
+    return starts
+
+
+def bucket_count(start: date, end: date, granularity: Granularity) -> int:
+    """len(bucket_starts(start, end, granularity))를 목록을 만들지 않고 계산합니다."""
+    if end <= start:
+        return 0
+    first = bucket_start(start, granularity)
+    last = bucket_start(end - timedelta(days=1), granularity)
+    if granularity == "day":
+        return (last - first).days + 1
+    if granularity == "week":
+        return (last - first).days // 7 + 1
+    return (last.year - first.year) * 12 + last.month - first.month + 1
+
+
+def date_range(from_: date | None = None, to: date | None = None) -> tuple[date, date]:
+    """(from, to 포함)을 [start, end) 범위로 바꿉니다. 기본은 오늘까지 최근 REPORT_DEFAULT_DAYS일.
+
+    REPORT_MIN_DATE~REPORT_MAX_DATE 밖의 날짜나 REPORT_MAX_DAYS보다 긴 기간은 422입니다.
+    """
+    for value in (from_, to):
+        if value is not None and not REPORT_MIN_DATE <= value <= REPORT_MAX_DATE:
+            raise HTTPException(
+                status_code=422, detail=f"날짜는 {REPORT_MIN_DATE}~{REPORT_MAX_DATE} 사이여야 합니다."
+            )
+    end = (to or datetime.now(timezone.utc).date()) + timedelta(days=1)
+    start = from_ or end - timedelta(days=REPORT_DEFAULT_DAYS)
+    if (end - start).days > REPORT_MAX_DAYS:
+        raise HTTPException(status_code=422, detail=f"기간은 최대 {REPORT_MAX_DAYS}일입니다.")
+    return start, end
+
+
+def report_window(
+    from_: date | None = None,
+    to: date | None = None,
+    granularity: Granularity | None = None,
+) -> ReportWindow:
+    """리포트 기간과 단위를 정합니다.
+
+    기본 기간은 오늘까지 최근 REPORT_DEFAULT_DAYS일이고 to는 그날을 포함합니다.
+    단위를 고르지 않았거나 고른 단위로는 점이 REPORT_MAX_POINTS를 넘으면 더 굵은
+    단위로 바꾸고, 월 단위로도 넘치면 여러 달을 한 점으로 묶습니다.
+    """
+    start, end = date_range(from_, to)
+    level = GRANULARITIES.index(granularity or "day")
+    while level < len(GRANULARITIES) - 1 and bucket_count(start, end, GRANULARITIES[level]) > REPORT_MAX_POINTS:
+        level += 1
+    granularity = GRANULARITIES[level]
+    count = bucket_count(start, end, granularity)
+    return ReportWindow(start, end, granularity, max(1, math.ceil(count / REPORT_MAX_POINTS)))
+
+
+async def report_series(metric: str, user_id: int, window: ReportWindow) -> list[tuple[date, float]]:
+    """기간 안의 모든 버킷을 (기록이 없으면 0으로) 채운 차트용 점 목록."""
+    values = dict(await bucket_series(metric, user_id, window.granularity, window.start, window.end))
+    points = [(start, values.get(start, 0)) for start in bucket_starts(window.start, window.end, window.granularity)]
+    if window.stride == 1:
+        return points
+    return [
+        (points[i][0], sum(value for _, value in points[i : i + window.stride]))
+        for i in range(0, len(points), window.stride)
+    ]
+
+
+async def bucket_series(
+    metric: str,
+    user_id: int,
+    granularity: Granularity = "day",
+    start: date | None = None,
+    end: date | None = None,
+) -> list[tuple[date, float]]:
+    """[start, end) 범위의 (버킷 시작일, 합계) 목록을 날짜순으로 돌려줍니다."""
+    sql, params = bucket_sql(metric, user_id, granularity, start, end)
+    rows = await connections.get("default").execute_query_dict(sql, params)
+    return [(date.fromisoformat(row["bucket"]), row["value"] or 0) for row in rows]
+
+
+def water_stats_sql(user_id: int, start: date, end: date) -> tuple[str, list]:
+    """water_report_stats의 SQL과 파라미터 (bench.explain에서도 씀)."""
+    sql = f"""
+        SELECT COALESCE(SUM(amount_ml), 0) AS total_water,
+               COUNT(DISTINCT date(logged_at)) AS days
+        FROM "{WaterLog._meta.db_table}"
+        WHERE user_id = ? AND logged_at >= ? AND logged_at < ?
+        """
+    return sql, [user_id, start.isoformat(), end.isoformat()]
+
+
+async def water_report_stats(user_id: int, start: date, end: date) -> dict:
+    """[start, end) 기간의 리포트 요약값(총량, 기록한 날 수)을 한 번의 쿼리로 구합니다."""
+    conn = connections.get("default")
+    rows = await conn.execute_query_dict(*water_stats_sql(user_id, start, end))
+    return rows[0]
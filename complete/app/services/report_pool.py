@@ -0,0 +1,65 @@
+"""차트 렌더링 전용 프로세스 풀. 대기 작업 수와 시간을 제한합니다."""
+
+import asyncio
+import multiprocessing
+import os
+from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any
+
+REPORT_WORKERS = int(os.getenv("HEALTH_REPORT_WORKERS", "2"))
+REPORT_MAX_PENDING = int(os.getenv("HEALTH_REPORT_MAX_PENDING", "8"))
+REPORT_TIMEOUT = float(os.getenv("HEALTH_REPORT_TIMEOUT", "10"))
+
+_executor: ProcessPoolExecutor | None = None
+_pending = 0
+
+
+class ReportBusyError(Exception):
+    """대기 중인 렌더링 작업이 한도에 도달했습니다."""
+
+
+class ReportTimeoutError(Exception):
+    """렌더링이 제한 시간 안에 끝나지 않았습니다."""
+
+
+def start_report_pool() -> ProcessPoolExecutor:
+    global _executor
+    if _executor is None:
+        # 이벤트 루프와 DB 스레드를 가진 프로세스를 fork하지 않도록 spawn을 사용합니다.
+        _executor = ProcessPoolExecutor(
+            max_workers=REPORT_WORKERS,
+            mp_context=multiprocessing.get_context("spawn"),
+        )
+    return _executor
+
+
+def shutdown_report_pool() -> None:
+    global _executor
+    if _executor is not None:
+        _executor.shutdown(wait=True, cancel_futures=True)
+        _executor = None
+
+
+def _release(future: asyncio.Future) -> None:
+    global _pending
+    _pending -= 1
+    if not future.cancelled():
+        future.exception()  # 시간 초과 후 끝난 작업의 예외가 경고로 남지 않게 회수합니다.
+
+
+async def run_report_job(func: Callable[..., Any], *args: Any) -> Any:
+    """func(*args)를 워커 프로세스에서 실행합니다. 인자는 pickle 가능해야 합니다."""
+    global _pending
+    if _pending >= REPORT_MAX_PENDING:
+        raise ReportBusyError()
+
+    loop = asyncio.get_running_loop()
+    future = loop.run_in_executor(start_report_pool(), func, *args)
+    _pending += 1
+    # 시간 초과로 먼저 돌아가더라도 워커가 실제로 끝날 때까지는 자리를 차지한 것으로 셉니다.
+    future.add_done_callback(_release)
+    try:
+        return await asyncio.wait_for(asyncio.shield(future), REPORT_TIMEOUT)
+    except asyncio.TimeoutError:
+        raise ReportTimeoutError() from None
@@ -0,0 +1,35 @@
+"""Jinja2 템플릿 환경 (컴파일한 바이트코드는 app/data/jinja에 저장합니다)."""
+
+import hashlib
+import os
+from pathlib import Path
+
+from fastapi.templating import Jinja2Templates
+from jinja2 import FileSystemBytecodeCache
+
+from app.db import BASE_DIR
+
+TEMPLATE_DIR = BASE_DIR / "templates"
+TEMPLATE_CACHE_DIR = Path(os.getenv("HEALTH_TEMPLATE_CACHE_DIR", BASE_DIR / "data" / "jinja"))
+
+templates = Jinja2Templates(directory=TEMPLATE_DIR)
+TEMPLATE_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+templates.env.bytecode_cache = FileSystemBytecodeCache(str(TEMPLATE_CACHE_DIR))
+
+
+def _template_build() -> str:
+    digest = hashlib.sha256()
+    for path in sorted(TEMPLATE_DIR.rglob("*.html")):
+        digest.update(path.relative_to(TEMPLATE_DIR).as_posix().encode())
+        digest.update(path.read_bytes())
+    return digest.hexdigest()[:12]
+
+
+# 템플릿 파일 전체의 해시. HTML 응답의 ETag에 넣어 배포로 마크업이 바뀌면 ETag도 바뀌게 합니다.
+TEMPLATE_BUILD = _template_build()
+
+
+def warm_templates() -> None:
+    """모든 템플릿을 미리 불러와 첫 요청이 컴파일 비용을 내지 않게 합니다."""
+    for name in templates.env.list_templates(extensions=["html"]):
+        templates.env.get_template(name)
@@ -1,10 +1,44 @@
+import asyncio
+
+from tortoise.signals import post_delete, post_save
+
 from app.models.user import User
 
 DEFAULT_USER_NAME = "학생"
+# 캐시가 비어 있을 때 get_or_create_default_user가 쓰는 쿼리 수 (조회 + 생성)
+DEFAULT_USER_QUERIES = 2
+
+# 페이지 요청마다 User.first()를 다시 조회하지 않도록 프로세스 안에 보관합니다.
+_default_user: User | None = None
+_default_user_lock = asyncio.Lock()
 
 
 async def get_or_create_default_user() -> User:
-    user = await User.first()
-    if user:
-        return user
-    return await User.create(name=DEFAULT_USER_NAME, height_cm=170, weight_kg=65.0)
+    global _default_user
+    if _default_user is not None:
+        return _default_user
+    # 첫 요청들이 동시에 들어와도 기본 사용자를 한 번만 만들도록 잠급니다.
+    async with _default_user_lock:
+        if _default_user is None:
+            user = await User.first()
+            if user is None:
+                user = await User.create(name=DEFAULT_USER_NAME, height_cm=170, weight_kg=65.0)
+            _default_user = user
+    return _default_user
+
+
+def invalidate_default_user() -> None:
+    global _default_user
+    _default_user = None
+
+
+@post_save(User)
+async def _on_user_saved(sender, instance, created, using_db, update_fields) -> None:
+    if _default_user is not None and instance.id == _default_user.id:
+        invalidate_default_user()
+
+
+@post_delete(User)
+async def _on_user_deleted(sender, instance, using_db) -> None:
+    if _default_user is not None and instance.id == _default_user.id:
+        invalidate_default_user()
@@ -0,0 +1,158 @@
+"""기록 한 건 입력을 모아 한 트랜잭션으로 쓰는 write-behind 큐 (HEALTH_WRITE_BEHIND=1일 때만)."""
+
+import asyncio
+import logging
+import os
+from typing import Any, NamedTuple
+
+from tortoise.models import Model
+from tortoise.transactions import in_transaction
+
+WRITE_BEHIND = os.getenv("HEALTH_WRITE_BEHIND", "0") == "1"
+WRITE_BATCH_SIZE = int(os.getenv("HEALTH_WRITE_BATCH_SIZE", "256"))
+WRITE_MAX_DELAY = float(os.getenv("HEALTH_WRITE_MAX_DELAY_MS", "5")) / 1000
+# commit: 호출자는 자기 행이 커밋될 때까지 기다립니다.
+# enqueue: enqueue_log는 큐에 넣자마자 돌아옵니다. 커밋 전에 프로세스가 죽으면 그 행들은 사라집니다.
+WRITE_DURABILITY = os.getenv("HEALTH_WRITE_DURABILITY", "commit")
+# 큐에 쌓일 수 있는 최대 행 수. 가득 차면 새 입력이 자리가 날 때까지 기다립니다(배압).
+WRITE_MAX_PENDING = int(os.getenv("HEALTH_WRITE_MAX_PENDING", "10000"))
+
+logger = logging.getLogger(__name__)
+
+
+class PendingWrite(NamedTuple):
+    model: type[Model]
+    fields: dict[str, Any]
+    future: asyncio.Future
+
+
+_queue: asyncio.Queue | None = None
+_full: asyncio.Event | None = None
+# 쓰기 태스크가 큐를 다 비우고 끝났음. 그 뒤에 put을 마친 호출자는 남은 행을 직접 넣습니다.
+_finished: asyncio.Event | None = None
+_writer: asyncio.Task | None = None
+
+
+def start_write_queue() -> None:
+    global _queue, _full, _finished, _writer
+    if not WRITE_BEHIND or _writer is not None:
+        return
+    if WRITE_DURABILITY not in ("commit", "enqueue"):
+        raise ValueError(f"HEALTH_WRITE_DURABILITY는 commit 또는 enqueue여야 합니다: {WRITE_DURABILITY}")
+    _queue = asyncio.Queue(maxsize=WRITE_MAX_PENDING)
+    _full = asyncio.Event()
+    _finished = asyncio.Event()
+    _writer = asyncio.create_task(_run(_queue, _full, _finished))
+
+
+async def stop_write_queue() -> None:
+    """새 입력은 바로 쓰게 돌리고, 큐에 남은 행을 모두 커밋한 뒤 돌아옵니다."""
+    global _queue, _full, _finished, _writer
+    if _writer is None:
+        return
+    queue, full, writer = _queue, _full, _writer
+    _queue = _full = _finished = _writer = None
+    full.set()
+    await queue.put(None)
+    await writer
+
+
+async def _submit(model: type[Model], fields: dict[str, Any]) -> asyncio.Future | None:
+    queue, full, finished = _queue, _full, _finished
+    if queue is None:
+        return None
+    future = asyncio.get_running_loop().create_future()
+    # 큐가 가득 차서 여기서 기다리는 동안 종료가 시작될 수 있습니다.
+    await queue.put(PendingWrite(model, fields, future))
+    if finished.is_set():
+        # 쓰기 태스크가 이미 끝났으므로 이 행(과 뒤늦게 들어온 다른 행)을 직접 넣습니다.
+        # 꺼낼 때마다 기다리던 다른 호출자가 깨어나 같은 일을 합니다.
+        await _flush([item for item in _drain(queue) if item is not None])
+    elif queue.qsize() >= WRITE_BATCH_SIZE:
+        full.set()
+    return future
+
+
+async def create_log(model: type[Model], **fields: Any) -> Model:
+    """기록 한 건을 넣고 id가 채워진 인스턴스를 돌려줍니다. (API처럼 결과가 필요한 곳)"""
+    future = await _submit(model, fields)
+    if future is None:
+        return await model.create(**fields)
+    return await future
+
+
+async def enqueue_log(model: type[Model], **fields: Any) -> None:
+    """기록 한 건을 넣습니다. durability가 enqueue면 커밋을 기다리지 않습니다. (폼 입력)"""
+    future = await _submit(model, fields)
+    if future is None:
+        await model.create(**fields)
+    elif WRITE_DURABILITY == "enqueue":
+        future.add_done_callback(_log_failure)
+    else:
+        await future
+
+
+def _log_failure(future: asyncio.Future) -> None:
+    if not future.cancelled() and future.exception() is not None:
+        logger.error("write-behind 입력 실패", exc_info=future.exception())
+
+
+def _drain(queue: asyncio.Queue) -> list:
+    items = []
+    while not queue.empty():
+        items.append(queue.get_nowait())
+    return items
+
+
+async def _run(queue: asyncio.Queue, full: asyncio.Event, finished: asyncio.Event) -> None:
+    stopping = False
+    while not stopping:
+        batch: list[PendingWrite] = []
+        item = await queue.get()
+        if item is None:
+            stopping = True
+        else:
+            batch.append(item)
+            # 배치가 덜 찼으면 최대 WRITE_MAX_DELAY까지 다른 요청을 기다립니다.
+            if queue.qsize() + 1 < WRITE_BATCH_SIZE:
+                full.clear()
+                try:
+                    await asyncio.wait_for(full.wait(), WRITE_MAX_DELAY)
+                except asyncio.TimeoutError:
+                    pass
+        while len(batch) < WRITE_BATCH_SIZE and not queue.empty():
+            item = queue.get_nowait()
+            if item is None:
+                stopping = True
+                break
+            batch.append(item)
+        if batch:
+            await _flush(batch)
+    # 종료 신호 뒤에 들어온 행(가득 찬 큐에서 기다리던 호출자)까지 비웁니다.
+    # 마지막으로 비었음을 확인한 뒤 finished를 세울 때까지는 양보하지 않습니다.
+    while batch := [item for item in _drain(queue) if item is not None]:
+        await _flush(batch)
+    finished.set()
+
+
+async def _flush(batch: list[PendingWrite]) -> None:
+    objects = [item.model(**item.fields) for item in batch]
+    try:
+        async with in_transaction() as conn:
+            for obj in objects:
+                await obj.save(using_db=conn)
+    except Exception:
+        # 한 건 때문에 배치 전체가 롤백됐으므로 새 인스턴스로 한 건씩 다시 넣습니다.
+        for item in batch:
+            try:
+                obj = await item.model.create(**item.fields)
+            except Exception as exc:
+                if not item.future.done():
+                    item.future.set_exception(exc)
+            else:
+                if not item.future.done():
+                    item.future.set_result(obj)
+        return
+    for item, obj in zip(batch, objects):
+        if not item.future.done():
+            item.future.set_result(obj)
@@ -0,0 +1,45 @@
+// data-fragment가 붙은 폼을 fetch로 보내고, 서버가 돌려준 기록 한 줄(조각)만 목록에 끼웁니다.
+// - prepend: 새 기록을 data-target 목록 맨 위에 넣습니다. (추가 폼)
+// - replace: 폼이 들어 있는 줄을 응답으로 바꿉니다. 빈 응답(삭제)이면 줄이 사라집니다.
+// data-load-more 링크("더 보기")는 다음 페이지의 기록 줄들로 자기 줄을 바꿉니다.
+// 스크립트가 없거나 요청이 실패하면 평소처럼 전체 페이지를 다시 불러옵니다.
+document.addEventListener("submit", async (event) => {
+  const form = event.target;
+  const mode = form.dataset.fragment;
+  if (!mode) {
+    return;
+  }
+  event.preventDefault();
+  const response = await fetch(form.action, {
+    method: "POST",
+    body: new FormData(form),
+    headers: { "HX-Request": "true" },
+  });
+  if (!response.ok) {
+    window.location.reload();
+    return;
+  }
+  const html = await response.text();
+  if (mode === "prepend") {
+    const list = document.querySelector(form.dataset.target);
+    list.querySelector(":scope > .muted")?.remove();
+    list.insertAdjacentHTML("afterbegin", html);
+    form.reset();
+  } else {
+    form.closest(".list-row").outerHTML = html;
+  }
+});
+
+document.addEventListener("click", async (event) => {
+  const link = event.target.closest("a[data-load-more]");
+  if (!link) {
+    return;
+  }
+  event.preventDefault();
+  const response = await fetch(link.dataset.loadMore, { headers: { "HX-Request": "true" } });
+  if (!response.ok) {
+    window.location.href = link.href;
+    return;
+  }
+  link.closest(".load-more").outerHTML = await response.text();
+});
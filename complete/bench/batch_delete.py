@@ -0,0 +1,94 @@
+"""기록 10,000건 삭제/수정: 한 건씩 요청 vs 배치 요청 한 번.
+
+방법마다 새 DB를 시드하고(WaterLog SEED건) 앞쪽 TARGET건을
+- 한 건씩: DELETE /api/water/{id}를 TARGET번
+- 배치(id 목록): POST /api/water/batch-delete에 id TARGET개
+- 배치(기간): POST /api/water/batch-delete에 from/to (30분 간격 시드라 하루 48건)
+로 지운 뒤 걸린 시간과 남은 행 수를 확인합니다. 배치 수정(id 목록)도 함께 잽니다.
+
+    python -m bench.batch_delete
+"""
+
+import asyncio
+import sqlite3
+import sys
+import time
+from datetime import timedelta
+
+from bench.common import BASE_TIME, app_client, create_schema, seed_logs, temp_db_url
+
+SEED = 20_000
+TARGET = 10_000
+USER_ID = 1
+# 시드는 30분 간격(하루 48건)이므로 TARGET건을 덮는 날짜 범위
+RANGE_DAYS = TARGET // 48
+
+
+def count_rows(path, where: str = "1") -> int:
+    conn = sqlite3.connect(path)
+    count = conn.execute(f'SELECT COUNT(*) FROM "waterlog" WHERE {where}').fetchone()[0]
+    conn.close()
+    return count
+
+
+async def per_row(client) -> int:
+    for log_id in range(1, TARGET + 1):
+        response = await client.delete(f"/api/water/{log_id}", params={"user_id": USER_ID})
+        response.raise_for_status()
+    return TARGET
+
+
+async def batch_ids(client) -> int:
+    body = {"user_id": USER_ID, "ids": list(range(1, TARGET + 1))}
+    response = await client.post("/api/water/batch-delete", json=body)
+    response.raise_for_status()
+    return response.json()["affected"]
+
+
+async def batch_range(client) -> int:
+    last_day = (BASE_TIME + timedelta(days=RANGE_DAYS - 1)).date()
+    body = {"user_id": USER_ID, "from": BASE_TIME.date().isoformat(), "to": last_day.isoformat()}
+    response = await client.post("/api/water/batch-delete", json=body)
+    response.raise_for_status()
+    return response.json()["affected"]
+
+
+async def batch_update_ids(client) -> int:
+    body = {"user_id": USER_ID, "ids": list(range(1, TARGET + 1)), "changes": {"amount_ml": 1}}
+    response = await client.post("/api/water/batch-update", json=body)
+    response.raise_for_status()
+    return response.json()["affected"]
+
+
+METHODS = [
+    ("delete one by one", per_row, TARGET),
+    ("batch-delete ids", batch_ids, TARGET),
+    ("batch-delete date range", batch_range, RANGE_DAYS * 48),
+    ("batch-update ids", batch_update_ids, TARGET),
+]
+
+
+async def main() -> int:
+    failed = False
+    for name, run, expected in METHODS:
+        _, path = temp_db_url()
+        await create_schema()
+        seed_logs(path, SEED, user_id=USER_ID)
+        async with app_client() as client:
+            start = time.perf_counter()
+            affected = await run(client)
+            elapsed = time.perf_counter() - start
+        if run is batch_update_ids:
+            ok = affected == expected and count_rows(path, "amount_ml = 1") == expected
+        else:
+            ok = affected == expected and count_rows(path) == SEED - expected
+        failed |= not ok
+        print(
+            f"[{'ok' if ok else 'FAIL'}] {name:<24} {elapsed * 1000:>9.1f}ms  "
+            f"rows={affected:,}  {affected / elapsed:>10,.0f} rows/s"
+        )
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main()))
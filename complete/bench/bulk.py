@@ -0,0 +1,40 @@
+"""단건 POST /api/water와 POST /api/water/bulk의 입력 처리량을 비교합니다.
+
+    python -m bench.bulk [행 수] [배치 크기]
+"""
+
+import asyncio
+import sys
+import time
+
+from bench.common import app_client, create_schema, seed_logs, temp_db_url
+
+DEFAULT_ROWS = 5_000
+DEFAULT_BATCH = 500
+
+
+async def main(rows: int, batch: int) -> None:
+    _, path = temp_db_url()
+    await create_schema()
+    seed_logs(path, 0)
+    async with app_client() as client:
+        start = time.perf_counter()
+        for i in range(rows):
+            response = await client.post("/api/water", json={"user_id": 1, "amount_ml": 100 + i % 400})
+            response.raise_for_status()
+        single = rows / (time.perf_counter() - start)
+
+        items = [{"user_id": 1, "amount_ml": 100 + i % 400} for i in range(rows)]
+        start = time.perf_counter()
+        for offset in range(0, rows, batch):
+            response = await client.post("/api/water/bulk", json=items[offset : offset + batch])
+            response.raise_for_status()
+        bulk = rows / (time.perf_counter() - start)
+
+    print(f"single-row POST : {single:>10,.0f} rows/s")
+    print(f"bulk ({batch:>4}/req) : {bulk:>10,.0f} rows/s  ({bulk / single:.0f}x)")
+
+
+if __name__ == "__main__":
+    args = [int(arg) for arg in sys.argv[1:]]
+    asyncio.run(main(args[0] if args else DEFAULT_ROWS, args[1] if len(args) > 1 else DEFAULT_BATCH))
@@ -0,0 +1,121 @@
+"""벤치마크 공용 도구: 임시 DB 생성, 대량 시드, 인프로세스 ASGI 클라이언트."""
+
+import os
+import random
+import sqlite3
+import statistics
+import tempfile
+import time
+from contextlib import asynccontextmanager
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+BASE_TIME = datetime(2020, 1, 1, tzinfo=timezone.utc)
+TS_FORMAT = "%Y-%m-%d %H:%M:%S+00:00"
+
+
+def temp_db_url() -> tuple[str, Path]:
+    """임시 디렉터리에 DB 경로를 만들고 HEALTH_DB_URL로 지정합니다."""
+    path = Path(tempfile.mkdtemp(prefix="health-bench-")) / "health.db"
+    url = f"sqlite://{path}"
+    os.environ["HEALTH_DB_URL"] = url
+    import app.db
+
+    app.db.DB_URL = url
+    return url, path
+
+
+async def create_schema() -> None:
+    from app.db import close_db, init_db
+
+    await init_db()
+    await close_db()
+
+
+def seed_logs(db_path: Path, rows: int, user_id: int = 1, seed: int = 0) -> None:
+    """네 가지 기록 테이블에 각각 rows 건을 한 트랜잭션으로 넣습니다."""
+    rng = random.Random(seed)
+    conn = sqlite3.connect(db_path)
+    with conn:
+        conn.execute(
+            'INSERT OR IGNORE INTO "user" (id, name, height_cm, weight_kg, created_at) '
+            "VALUES (?, ?, ?, ?, ?)",
+            (user_id, "학생", 170, 65.0, BASE_TIME.strftime(TS_FORMAT)),
+        )
+        step = timedelta(minutes=30)
+        times = [(BASE_TIME + step * i) for i in range(rows)]
+        conn.executemany(
+            'INSERT INTO "waterlog" (user_id, amount_ml, logged_at) VALUES (?, ?, ?)',
+            ((user_id, rng.randint(100, 500), t.strftime(TS_FORMAT)) for t in times),
+        )
+        conn.executemany(
+            'INSERT INTO "exerciselog" (user_id, activity, duration_min, calories_burned, '
+            "logged_at) VALUES (?, ?, ?, ?, ?)",
+            (
+                (user_id, "걷기", rng.randint(10, 90), rng.randint(50, 600), t.strftime(TS_FORMAT))
+                for t in times
+            ),
+        )
+        conn.executemany(
+            'INSERT INTO "sleeplog" (user_id, sleep_date, start_time, end_time, quality) '
+            "VALUES (?, ?, ?, ?, ?)",
+            (
+                (
+                    user_id,
+                    t.date().isoformat(),
+                    t.strftime(TS_FORMAT),
+                    (t + timedelta(hours=rng.uniform(5, 9))).strftime(TS_FORMAT),
+                    rng.randint(1, 5),
+                )
+                for t in times
+            ),
+        )
+        conn.executemany(
+            'INSERT INTO "meallog" (user_id, meal_type, calories, note, eaten_at) '
+            "VALUES (?, ?, ?, ?, ?)",
+            (
+                (user_id, rng.choice(["아침", "점심", "저녁", "간식"]), rng.randint(100, 900),
+                 None, t.strftime(TS_FORMAT))
+                for t in times
+            ),
+        )
+    conn.close()
+
+
+@asynccontextmanager
+async def app_client():
+    """lifespan까지 실행한 FastAPI 앱에 네트워크 없이 붙는 httpx 클라이언트."""
+    import httpx
+
+    from app.main import app
+
+    async with app.router.lifespan_context(app):
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+            yield client
+
+
+async def time_requests(client, method: str, url: str, repeat: int, **kwargs) -> list[float]:
+    """요청을 repeat번 보내고 각 지연 시간(ms)을 돌려줍니다."""
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        response = await client.request(method, url, **kwargs)
+        samples.append((time.perf_counter() - start) * 1000)
+        response.raise_for_status()
+    return samples
+
+
+def summarize(samples: list[float]) -> dict:
+    ordered = sorted(samples)
+
+    def pct(p: float) -> float:
+        return round(ordered[min(len(ordered) - 1, int(len(ordered) * p))], 2)
+
+    return {
+        "n": len(samples),
+        "p50": pct(0.50),
+        "p95": pct(0.95),
+        "p99": pct(0.99),
+        "mean": round(statistics.fmean(samples), 2),
+    }
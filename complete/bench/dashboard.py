@@ -0,0 +1,71 @@
+"""대시보드 지연 시간이 기록 수에 따라 어떻게 변하는지 측정합니다.
+
+섹션 조각 캐시가 모두 맞을 때(hit), 수분 기록 한 건을 고쳐 수분 섹션 하나만 바뀌었을 때
+(1 stale), 캐시를 모두 비웠을 때(miss, 네 섹션을 모두 다시 읽고 렌더링)를 따로 잽니다.
+합계는 트리거가 관리하는 누적값이라 세 경우 모두 기록 수와 상관없어야 합니다.
+
+    python -m bench.dashboard               # 1k, 10k, 100k, 1M
+    python -m bench.dashboard 1000 50000
+"""
+
+import asyncio
+import sys
+import time
+
+from bench.common import app_client, create_schema, seed_logs, summarize, temp_db_url
+
+DEFAULT_SIZES = [1_000, 10_000, 100_000, 1_000_000]
+REPEAT = 30
+
+
+async def timed_dashboard(client, before) -> dict:
+    samples = []
+    for _ in range(REPEAT):
+        await before()
+        start = time.perf_counter()
+        response = await client.get("/")
+        samples.append((time.perf_counter() - start) * 1000)
+        response.raise_for_status()
+    return summarize(samples)
+
+
+async def run(size: int) -> dict:
+    from app.models.water import WaterLog
+    from app.services.dashboard import clear_dashboard_cache
+
+    _, path = temp_db_url()
+    await create_schema()
+    start = time.perf_counter()
+    seed_logs(path, size)
+    seed_sec = time.perf_counter() - start
+
+    async def nothing() -> None:
+        pass
+
+    async def touch_water() -> None:
+        # 쿼리셋 update라도 트리거가 수분 기록의 버전을 올립니다.
+        await WaterLog.filter(id=1).update(amount_ml=250)
+
+    async def clear() -> None:
+        clear_dashboard_cache()
+
+    async with app_client() as client:
+        await client.get("/")
+        return {
+            "rows_per_table": size,
+            "seed_sec": round(seed_sec, 1),
+            "hit": await timed_dashboard(client, nothing),
+            "stale": await timed_dashboard(client, touch_water),
+            "miss": await timed_dashboard(client, clear),
+        }
+
+
+async def main(sizes: list[int]) -> None:
+    print(f"{'rows/table':>12} {'hit p50':>9} {'1 stale p50':>12} {'miss p50':>9}  (ms)")
+    for size in sizes:
+        result = await run(size)
+        print(f"{size:>12,} {result['hit']['p50']:>9} {result['stale']['p50']:>12} {result['miss']['p50']:>9}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main([int(arg) for arg in sys.argv[1:]] or DEFAULT_SIZES))
@@ -0,0 +1,48 @@
+"""ETag 재검증(304)이 데이터 버전 조회 한 번으로 끝나는지, 200 응답보다 얼마나 싼지 측정합니다.
+
+    python -m bench.etag [기록 수]
+"""
+
+import asyncio
+import sys
+import time
+
+from bench.common import app_client, create_schema, seed_logs, summarize, temp_db_url, time_requests
+from bench.user_cache import trace_statements
+
+URLS = ["/", "/water", "/api/water?user_id=1", "/api/timeseries/water?user_id=1&from=2020-01-01"]
+REPEAT = 20
+
+
+async def main(rows: int) -> int:
+    _, path = temp_db_url()
+    await create_schema()
+    seed_logs(path, rows)
+    statements: list[str] = []
+    failed = False
+    async with app_client() as client:
+        await trace_statements(statements)
+        for url in URLS:
+            first = await client.get(url)
+            etag = first.headers["etag"]
+            full = summarize(await time_requests(client, "GET", url, REPEAT))
+            statements.clear()
+            samples, statuses = [], set()
+            for _ in range(REPEAT):
+                start = time.perf_counter()
+                response = await client.get(url, headers={"If-None-Match": etag})
+                samples.append((time.perf_counter() - start) * 1000)
+                statuses.add(response.status_code)
+            revalidated = summarize(samples)
+            # 304 한 번에 log_stats 버전 조회 한 문장만 허용합니다.
+            ok = statuses == {304} and len(statements) == REPEAT and all("log_stats" in sql for sql in statements)
+            failed |= not ok
+            print(
+                f"[{'ok' if ok else 'FAIL'}] {url}: 200 p50={full['p50']}ms  "
+                f"304 p50={revalidated['p50']}ms  queries per 304={len(statements) / REPEAT:g}"
+            )
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main(int(sys.argv[1]) if len(sys.argv) > 1 else 10_000)))
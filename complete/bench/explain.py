@@ -0,0 +1,129 @@
+"""페이지 쿼리가 인덱스를 타는지 EXPLAIN QUERY PLAN으로 검사합니다.
+
+인덱스 없는 테이블 전체 스캔(SCAN)이나 정렬용 임시 B-트리가 보이면 실패(종료 코드 1)합니다.
+리포트 집계의 GROUP BY/COUNT(DISTINCT)용 임시 B-트리는 인덱스 범위로 걸러진 행만 모으므로
+허용하고, 한 줄뿐인 log_stats_epoch의 스캔도 허용합니다.
+
+    python -m bench.explain
+"""
+
+import asyncio
+import sys
+from datetime import date, datetime, timezone
+
+from tortoise import connections
+
+from bench.common import create_schema, seed_logs, temp_db_url
+
+# 행이 하나뿐이라 스캔해도 되는 표
+SMALL_TABLES = {"log_stats_epoch"}
+
+
+def inline(sql: str, params: list) -> str:
+    for value in params:
+        sql = sql.replace("?", repr(value), 1)
+    return sql
+
+
+def page_queries(user_id: int) -> dict:
+    from app.models.exercise import ExerciseLog
+    from app.models.meal import MealLog
+    from app.models.sleep import SleepLog
+    from app.models.water import WaterLog
+    from app.services.data_versions import LOG_STATS_SQL, USER_STATS_SQL
+    from app.services.log_kinds import LOG_KINDS
+    from app.services.mutations import select_logs
+    from app.services.pagination import PageParams, apply_page, encode_cursor
+    from app.services.report_data import bucket_sql, water_stats_sql
+
+    cursor = encode_cursor(datetime(2020, 1, 10, tzinfo=timezone.utc), 500)
+    sleep_cursor = encode_cursor(date(2020, 1, 10), 500)
+    since = datetime(2020, 1, 5, tzinfo=timezone.utc)
+
+    def page(**kwargs) -> PageParams:
+        params = dict(limit=50, cursor=None, user_id=None, from_=None, to=None)
+        return PageParams(**{**params, **kwargs})
+
+    return {
+        "water list": WaterLog.filter(user_id=user_id).order_by("-logged_at").sql(True),
+        "exercise list": ExerciseLog.filter(user_id=user_id).order_by("-logged_at").sql(True),
+        "sleep list": SleepLog.filter(user_id=user_id).order_by("-sleep_date").sql(True),
+        "meal list": MealLog.filter(user_id=user_id).order_by("-eaten_at").sql(True),
+        "water recent": WaterLog.filter(user_id=user_id)
+        .order_by("-logged_at")
+        .limit(5)
+        .sql(True),
+        "report water days": inline(*bucket_sql("water", user_id, "day")),
+        "report meal weeks": inline(
+            *bucket_sql("meal", user_id, "week", date(2020, 1, 5), date(2020, 2, 1))
+        ),
+        "report sleep months": inline(*bucket_sql("sleep", user_id, "month")),
+        "report water stats": inline(*water_stats_sql(user_id, date(2020, 1, 1), date(2020, 2, 1))),
+        "dashboard stats": inline(USER_STATS_SQL, [user_id]),
+        "list page stats": inline(LOG_STATS_SQL, [user_id, WaterLog._meta.db_table]),
+        # 목록 페이지(log_pages.read_page)는 사용자 조건 + 커서로 읽습니다.
+        "page water first": apply_page(WaterLog.all(), "logged_at", page(user_id=user_id)).sql(True),
+        "page meal rows": apply_page(MealLog.all(), "eaten_at", page(cursor=cursor, user_id=user_id)).sql(True),
+        "batch delete ids": select_logs(LOG_KINDS["water"], user_id, ids=[1, 2, 3]).delete().sql(True),
+        "batch update range": select_logs(
+            LOG_KINDS["exercise"], user_id, from_=date(2020, 1, 5), to=date(2020, 1, 9)
+        )
+        .update(duration_min=30)
+        .sql(True),
+        "batch delete sleep range": select_logs(
+            LOG_KINDS["sleep"], user_id, ids=[1, 2], from_=date(2020, 1, 5)
+        )
+        .delete()
+        .sql(True),
+        "api water first page": apply_page(WaterLog.all(), "logged_at", page()).sql(True),
+        "api water page": apply_page(WaterLog.all(), "logged_at", page(cursor=cursor)).sql(True),
+        "api water user page": apply_page(
+            WaterLog.all(), "logged_at", page(cursor=cursor, user_id=user_id, from_=since)
+        ).sql(True),
+        "api exercise page": apply_page(
+            ExerciseLog.all(), "logged_at", page(cursor=cursor)
+        ).sql(True),
+        "api sleep user page": apply_page(
+            SleepLog.all(), "sleep_date", page(cursor=sleep_cursor, user_id=user_id)
+        ).sql(True),
+        "api meal range": apply_page(MealLog.all(), "eaten_at", page(from_=since)).sql(True),
+    }
+
+
+async def check() -> list[str]:
+    conn = connections.get("default")
+    tables = await conn.execute_query_dict("SELECT name FROM sqlite_master WHERE type = 'table'")
+    big_tables = {row["name"] for row in tables} - SMALL_TABLES
+    failures = []
+    for name, sql in page_queries(user_id=1).items():
+        plan = await conn.execute_query_dict(f"EXPLAIN QUERY PLAN {sql}")
+        steps = [row["detail"] for row in plan]
+        bad = [
+            step
+            for step in steps
+            if (step.startswith("SCAN ") and step.split()[1] in big_tables and "INDEX" not in step)
+            or ("TEMP B-TREE" in step and "GROUP BY" not in step and "DISTINCT" not in step)
+        ]
+        status = "FAIL" if bad else "ok"
+        print(f"[{status}] {name}: " + " | ".join(steps))
+        if bad:
+            failures.append(name)
+    return failures
+
+
+async def main() -> int:
+    from app.db import close_db, init_db
+
+    _, path = temp_db_url()
+    await create_schema()
+    seed_logs(path, 2_000)
+    await init_db()
+    try:
+        failures = await check()
+    finally:
+        await close_db()
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main()))
@@ -0,0 +1,91 @@
+"""/api/export로 100만 행을 내보내면서 파이썬 힙 최대 사용량을 측정합니다.
+
+httpx의 ASGITransport는 응답 본문을 모아 두므로, 여기서는 앱을 ASGI로 직접
+호출하고 받은 바이트는 세기만 하고 버립니다.
+
+    python -m bench.export [테이블당 행 수] [최대 허용 MiB]
+"""
+
+import asyncio
+import sys
+import time
+import tracemalloc
+
+from bench.common import create_schema, seed_logs, temp_db_url
+
+DEFAULT_ROWS_PER_TABLE = 250_000  # 네 테이블 합쳐 100만 행
+DEFAULT_LIMIT_MIB = 32
+
+
+async def stream_export(app, query: str) -> tuple[int, int]:
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": "/api/export",
+        "raw_path": b"/api/export",
+        "query_string": query.encode(),
+        "headers": [(b"host", b"bench")],
+        "client": ("127.0.0.1", 0),
+        "server": ("bench", 80),
+    }
+    total_bytes = 0
+    lines = 0
+    requested = False
+    finished = asyncio.Event()
+
+    async def receive():
+        nonlocal requested
+        if not requested:
+            requested = True
+            return {"type": "http.request", "body": b"", "more_body": False}
+        await finished.wait()
+        return {"type": "http.disconnect"}
+
+    async def send(message):
+        nonlocal total_bytes, lines
+        if message["type"] == "http.response.body":
+            body = message.get("body", b"")
+            total_bytes += len(body)
+            lines += body.count(b"\n")
+            if not message.get("more_body", False):
+                finished.set()
+
+    await app(scope, receive, send)
+    return total_bytes, lines
+
+
+async def main(rows_per_table: int, limit_mib: int) -> int:
+    _, path = temp_db_url()
+    await create_schema()
+    seed_logs(path, rows_per_table)
+
+    from app.main import app
+
+    failed = False
+    async with app.router.lifespan_context(app):
+        for fmt in ("ndjson", "csv"):
+            tracemalloc.start()
+            start = time.perf_counter()
+            total_bytes, lines = await stream_export(app, f"user_id=1&format={fmt}")
+            elapsed = time.perf_counter() - start
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            peak_mib = peak / 1024 / 1024
+            ok = peak_mib <= limit_mib
+            failed |= not ok
+            print(
+                f"[{'ok' if ok else 'FAIL'}] {fmt}: {lines:,} lines, "
+                f"{total_bytes / 1024 / 1024:.0f} MiB in {elapsed:.1f}s, "
+                f"peak heap {peak_mib:.1f} MiB (limit {limit_mib} MiB)"
+            )
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    args = [int(arg) for arg in sys.argv[1:]]
+    rows = args[0] if args else DEFAULT_ROWS_PER_TABLE
+    limit = args[1] if len(args) > 1 else DEFAULT_LIMIT_MIB
+    sys.exit(asyncio.run(main(rows, limit)))
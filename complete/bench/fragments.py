@@ -0,0 +1,66 @@
+"""폼 입력 한 번의 비용: 303 리다이렉트 + 목록 페이지 다시 읽기 vs 조각(기록 한 줄) 응답.
+
+브라우저는 303을 받으면 목록 페이지를 다시 GET하고, 그 페이지는 사용자의 기록을 모두
+조회/렌더링합니다. 조각 모드(HX-Request: true)는 바뀐 줄만 돌려줍니다. 기록 수별로
+추가/수정/삭제 각각의 "POST + 다시 읽기"와 "조각 POST" 지연 시간을 비교합니다.
+
+    python -m bench.fragments
+"""
+
+import asyncio
+import itertools
+import sys
+import time
+
+from bench.common import app_client, create_schema, seed_logs, summarize, temp_db_url
+
+SIZES = [1_000, 10_000]
+REPEAT = 20
+FRAGMENT_HEADERS = {"HX-Request": "true"}
+EDIT_FORM = {"amount_ml": 350, "logged_at": "2020-01-02T08:00"}
+
+
+async def post_and_reload(client, url: str, data: dict | None) -> None:
+    response = await client.post(url, data=data)
+    assert response.status_code == 303, response.status_code
+    response = await client.get(response.headers["location"])
+    response.raise_for_status()
+
+
+async def post_fragment(client, url: str, data: dict | None) -> None:
+    response = await client.post(url, data=data, headers=FRAGMENT_HEADERS)
+    response.raise_for_status()
+
+
+async def measure(client, action, url_factory, data: dict | None) -> dict:
+    samples = []
+    for _ in range(REPEAT):
+        start = time.perf_counter()
+        await action(client, url_factory(), data)
+        samples.append((time.perf_counter() - start) * 1000)
+    return summarize(samples)
+
+
+async def main() -> int:
+    for size in SIZES:
+        _, path = temp_db_url()
+        await create_schema()
+        seed_logs(path, size)
+        ids = itertools.count(1)
+        async with app_client() as client:
+            for name, url_factory, data in [
+                ("add", lambda: "/water", {"amount_ml": 300}),
+                ("edit", lambda: f"/water/{size}/edit", EDIT_FORM),
+                ("delete", lambda: f"/water/{next(ids)}/delete", None),
+            ]:
+                reload = await measure(client, post_and_reload, url_factory, data)
+                fragment = await measure(client, post_fragment, url_factory, data)
+                print(
+                    f"{size:>7,} {name:<6} redirect+reload p50={reload['p50']:>8}ms  "
+                    f"fragment p50={fragment['p50']:>6}ms  ({reload['p50'] / fragment['p50']:.0f}x)"
+                )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main()))
@@ -0,0 +1,51 @@
+"""목록 페이지 비용이 기록 수와 상관없이 일정한지 확인합니다.
+
+기록 수별로 수분 목록의 첫 페이지, 기록을 하나 추가한 직후의 첫 페이지(트리거가 고친
+총 건수를 읽음), 시드 중간 커서의 "더 보기" 조각 지연 시간을 잽니다.
+
+    python -m bench.list_pages
+"""
+
+import asyncio
+import sys
+import time
+
+from bench.common import app_client, create_schema, seed_logs, summarize, temp_db_url, time_requests
+from bench.suite import deep_cursor
+
+SIZES = [1_000, 100_000, 1_000_000]
+REPEAT = 30
+
+
+async def first_page_after_write(client) -> list[float]:
+    samples = []
+    for _ in range(REPEAT):
+        await client.post("/water", data={"amount_ml": 300})
+        start = time.perf_counter()
+        response = await client.get("/water")
+        samples.append((time.perf_counter() - start) * 1000)
+        response.raise_for_status()
+    return samples
+
+
+async def main() -> int:
+    for size in SIZES:
+        _, path = temp_db_url()
+        await create_schema()
+        seed_logs(path, size)
+        async with app_client() as client:
+            await client.get("/water")  # 기본 사용자 캐시 채우기
+            cached = summarize(await time_requests(client, "GET", "/water", REPEAT))
+            recount = summarize(await first_page_after_write(client))
+            rows = summarize(
+                await time_requests(client, "GET", f"/water/rows?cursor={deep_cursor('water')}", REPEAT)
+            )
+        print(
+            f"{size:>9,} first page p50={cached['p50']:>6}ms  after write p50={recount['p50']:>6}ms  "
+            f"load more p50={rows['p50']:>6}ms"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main()))
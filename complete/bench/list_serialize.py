@@ -0,0 +1,71 @@
+"""목록 API 직렬화 처리량(rows/s)을 예전 경로와 비교합니다.
+
+예전 경로: 모델 인스턴스 조회 -> XOut.model_validate -> FastAPI response_model 재검증
+-> JSONResponse. 지금 경로: .values() dict 조회 -> pydantic_core.to_json 한 번.
+두 경로 모두 같은 키셋 페이지 쿼리를 쓰고, 결과 JSON이 같은지도 확인합니다.
+
+    python -m bench.list_serialize [페이지 크기]
+"""
+
+import asyncio
+import json
+import sys
+import time
+
+from bench.common import create_schema, seed_logs, summarize, temp_db_url
+
+REPEAT = 50
+
+
+async def main(limit: int) -> int:
+    from fastapi.responses import JSONResponse
+    from pydantic import TypeAdapter
+
+    from app.db import close_db, init_db
+    from app.routers.api import list_page
+    from app.services.log_kinds import LOG_KINDS
+    from app.services.pagination import PageParams, apply_page, split_page
+
+    _, path = temp_db_url()
+    await create_schema()
+    seed_logs(path, 10_000)
+    await init_db(generate_schemas=False)
+    page = PageParams(limit=limit, cursor=None, user_id=None, from_=None, to=None)
+    failed = False
+    try:
+        for kind, spec in LOG_KINDS.items():
+            adapter = TypeAdapter(list[spec.out_schema])
+
+            async def before() -> bytes:
+                logs = await apply_page(spec.model.all(), spec.ts_field, page)
+                logs, _ = split_page(logs, spec.ts_field, page.limit)
+                content = [spec.out_schema.model_validate(log) for log in logs]
+                # FastAPI serialize_response: response_model로 다시 검증한 뒤 JSON으로 인코딩
+                content = adapter.dump_python(adapter.validate_python(content), mode="json")
+                return JSONResponse(content).body
+
+            async def after() -> bytes:
+                return (await list_page(kind, page)).body
+
+            same = json.loads(await before()) == json.loads(await after())
+            failed |= not same
+            results = {}
+            for name, func in (("before", before), ("after", after)):
+                samples = []
+                for _ in range(REPEAT):
+                    start = time.perf_counter()
+                    await func()
+                    samples.append((time.perf_counter() - start) * 1000)
+                results[name] = limit * 1000 / summarize(samples)["p50"]
+            print(
+                f"{kind:>9}: before {results['before']:>9,.0f} rows/s  "
+                f"after {results['after']:>9,.0f} rows/s  "
+                f"({results['after'] / results['before']:.1f}x)  same_json={same}"
+            )
+    finally:
+        await close_db()
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main(int(sys.argv[1]) if len(sys.argv) > 1 else 500)))
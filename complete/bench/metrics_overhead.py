@@ -0,0 +1,111 @@
+"""지표 수집 비용을 잽니다.
+
+1. 마이크로벤치: 아무것도 안 하는 ASGI 앱을 MetricsMiddleware로 감쌌을 때 요청당
+   추가 시간과, 쿼리 훅이 쿼리 하나에 더하는 시간.
+2. 전체 요청: HEALTH_METRICS=0/1로 별도 프로세스를 번갈아 ROUNDS번씩 띄워 같은 라우트의
+   p50의 중앙값을 비교. (프로세스 간 편차가 수백 us라 한 번씩만 재면 믿기 어렵습니다.)
+
+    python -m bench.metrics_overhead
+"""
+
+import asyncio
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+from bench.common import app_client, create_schema, seed_logs, summarize, temp_db_url
+
+CALLS = 20_000
+URLS = ["/api/water?limit=1", "/api/water?user_id=1&limit=50", "/", "/water/999999/edit"]
+REPEAT = 300
+ROUNDS = 3
+
+
+async def micro() -> None:
+    from app.main import app
+    from app.services.metrics import MetricsMiddleware, _timed
+
+    async def noop_app(scope, receive, send) -> None:
+        await send({"type": "http.response.start", "status": 200, "headers": []})
+        await send({"type": "http.response.body", "body": b""})
+
+    async def send(message) -> None:
+        pass
+
+    async def receive() -> dict:
+        return {"type": "http.request", "body": b""}
+
+    wrapped = MetricsMiddleware(noop_app)
+    for path in ("/api/water", "/meal/3/delete", "/no/such/path"):
+        method = "POST" if path.endswith("delete") else "GET"
+        scope = {"type": "http", "method": method, "path": path, "root_path": "", "app": app}
+        timings = {}
+        for name, target in (("bare", noop_app), ("metrics", wrapped)):
+            start = time.perf_counter()
+            for _ in range(CALLS):
+                await target(dict(scope), receive, send)
+            timings[name] = (time.perf_counter() - start) / CALLS * 1e6
+        # 같은 경로를 반복하므로 두 번째부터는 라우트 템플릿 캐시 적중입니다.
+        print(f"middleware {method} {path:<18}: +{timings['metrics'] - timings['bare']:.1f}us/request")
+
+    async def query(self, sql) -> None:
+        return None
+
+    timed = _timed(query)
+    timings = {}
+    for name, target in (("bare", query), ("hooked", timed)):
+        start = time.perf_counter()
+        for _ in range(CALLS):
+            await target(None, "SELECT 1")
+        timings[name] = (time.perf_counter() - start) / CALLS * 1e6
+    print(f"query hook: +{timings['hooked'] - timings['bare']:.1f}us/query")
+
+
+async def timed_gets(client, url: str, repeat: int) -> list[float]:
+    # 405 응답 경로도 재기 위해 raise_for_status 없이 잽니다.
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        await client.get(url)
+        samples.append((time.perf_counter() - start) * 1000)
+    return samples
+
+
+async def child() -> None:
+    _, path = temp_db_url()
+    await create_schema()
+    seed_logs(path, 1_000)
+    results = {}
+    async with app_client() as client:
+        for url in URLS:
+            await timed_gets(client, url, 20)
+            results[url] = summarize(await timed_gets(client, url, REPEAT))
+    print(json.dumps(results))
+
+
+def end_to_end() -> None:
+    runs = {"0": [], "1": []}
+    for _ in range(ROUNDS):
+        for flag in runs:
+            env = {**os.environ, "HEALTH_METRICS": flag}
+            output = subprocess.run(
+                [sys.executable, "-W", "ignore", "-m", "bench.metrics_overhead", "--child"],
+                env=env,
+                capture_output=True,
+                text=True,
+                check=True,
+            ).stdout
+            runs[flag].append(json.loads(output.strip().splitlines()[-1]))
+    for url in URLS:
+        off, on = (statistics.median(run[url]["p50"] for run in runs[flag]) for flag in ("0", "1"))
+        print(f"{url:<32} p50 off={off}ms on={on}ms ({on - off:+.3f}ms)")
+
+if __name__ == "__main__":
+    if "--child" in sys.argv:
+        asyncio.run(child())
+    else:
+        asyncio.run(micro())
+        end_to_end()
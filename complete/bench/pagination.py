@@ -0,0 +1,64 @@
+"""/api 목록을 커서로 끝까지 넘기며 누락·중복 없이 모든 행을 돌려주는지,
+그리고 뒤쪽 페이지도 첫 페이지와 비슷한 시간에 오는지 확인합니다.
+
+    python -m bench.pagination [행 수]
+"""
+
+import asyncio
+import sys
+import time
+
+from bench.common import app_client, create_schema, seed_logs, temp_db_url
+
+DEFAULT_ROWS = 100_000
+PAGE_SIZE = 500
+
+
+async def walk(client, url: str, ts_key: str, params: dict) -> tuple[int, list[float]]:
+    seen = set()
+    previous = None
+    timings = []
+    cursor = None
+    while True:
+        query = {**params, "limit": PAGE_SIZE, **({"cursor": cursor} if cursor else {})}
+        start = time.perf_counter()
+        response = await client.get(url, params=query)
+        timings.append((time.perf_counter() - start) * 1000)
+        response.raise_for_status()
+        for row in response.json():
+            key = (row[ts_key], row["id"])
+            assert row["id"] not in seen, f"duplicate id {row['id']}"
+            assert previous is None or key < previous, f"out of order at id {row['id']}"
+            seen.add(row["id"])
+            previous = key
+        cursor = response.headers.get("X-Next-Cursor")
+        if not cursor:
+            return len(seen), timings
+
+
+async def main(rows: int) -> int:
+    _, path = temp_db_url()
+    await create_schema()
+    seed_logs(path, rows, user_id=1)
+    seed_logs(path, rows // 10, user_id=2, seed=1)
+    failed = False
+    async with app_client() as client:
+        for url, ts_key, params, expected in [
+            ("/api/water", "logged_at", {}, rows + rows // 10),
+            ("/api/exercise", "logged_at", {"user_id": 1}, rows),
+            ("/api/sleep", "sleep_date", {"user_id": 2}, rows // 10),
+            ("/api/meal", "eaten_at", {"user_id": 1, "from": "2020-02-01"}, None),
+        ]:
+            count, timings = await walk(client, url, ts_key, params)
+            ok = expected is None or count == expected
+            failed |= not ok
+            print(
+                f"[{'ok' if ok else 'FAIL'}] {url} {params}: {count:,} rows / {len(timings)} pages, "
+                f"first {timings[0]:.1f}ms, last {timings[-1]:.1f}ms, "
+                f"max {max(timings):.1f}ms"
+            )
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main(int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_ROWS)))
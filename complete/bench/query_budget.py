@@ -0,0 +1,72 @@
+"""모든 라우트를 HEALTH_QUERY_BUDGET=strict로 실행해 선언한 쿼리 수를 지키는지 확인합니다.
+
+bench.suite의 시나리오를 그대로 각각 두 번씩(첫 요청은 기본 사용자 캐시가 빈 상태 포함)
+보내고, 라우트별 쿼리 수(X-DB-Queries)와 @query_budget 한도를 출력합니다. 한도를 넘거나
+같은 쿼리가 반복되는(N+1) 요청, 4xx/5xx 응답, @query_budget이 없는 API 라우트가 있으면
+실패(종료 코드 1)합니다. 쿼리 수 회귀를 잡는 테스트로 씁니다.
+
+    python -m bench.query_budget [기록 수]
+"""
+
+import os
+
+os.environ["HEALTH_QUERY_BUDGET"] = "strict"
+os.environ["HEALTH_QUERY_DEBUG"] = "1"
+
+import asyncio  # noqa: E402
+import re  # noqa: E402
+import sys  # noqa: E402
+import tempfile  # noqa: E402
+
+from bench.common import app_client, create_schema, seed_logs, temp_db_url  # noqa: E402
+from bench.suite import scenarios  # noqa: E402
+
+RUNS = 2
+
+
+def undeclared_routes(app) -> list[str]:
+    from fastapi.routing import APIRoute
+
+    return [
+        f"{','.join(sorted(route.methods))} {route.path}"
+        for route in app.routes
+        if isinstance(route, APIRoute) and not hasattr(route.endpoint, "query_budget")
+    ]
+
+
+async def main(rows: int) -> int:
+    from app.main import app
+    from app.services.query_budget import QueryBudgetExceeded
+
+    os.environ.setdefault("HEALTH_CHART_CACHE_DIR", tempfile.mkdtemp(prefix="health-charts-"))
+    _, path = temp_db_url()
+    await create_schema()
+    seed_logs(path, rows)
+    failed = False
+    async with app_client() as client:
+        report = await client.get("/report")
+        match = re.search(r'<img src="([^"]+)"', report.text)
+        for scenario in scenarios(match and match.group(1)):
+            counts, problem = [], None
+            for _ in range(RUNS):
+                try:
+                    response = await client.request(scenario.method, scenario.next_url(), **scenario.next_kwargs())
+                except QueryBudgetExceeded as exc:
+                    problem = str(exc)
+                    break
+                if response.status_code >= 400:
+                    problem = f"status {response.status_code}"
+                    break
+                counts.append(response.headers.get("x-db-queries", "?"))
+            failed |= problem is not None
+            print(f"[{'FAIL' if problem else 'ok'}] {scenario.name:<34} queries={','.join(counts)}", flush=True)
+            if problem:
+                print(f"       {problem}")
+    for route in undeclared_routes(app):
+        failed = True
+        print(f"[FAIL] {route}: @query_budget이 없습니다")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main(int(sys.argv[1]) if len(sys.argv) > 1 else 12_000)))
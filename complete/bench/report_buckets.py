@@ -0,0 +1,62 @@
+"""리포트 집계를 SQL GROUP BY로 할 때와 전체 행을 파이썬으로 가져올 때를 비교합니다.
+
+    python -m bench.report_buckets               # 10k, 100k, 1M
+    python -m bench.report_buckets 50000
+"""
+
+import asyncio
+import sys
+import time
+from collections import defaultdict
+
+from bench.common import create_schema, seed_logs, summarize, temp_db_url
+
+DEFAULT_SIZES = [10_000, 100_000, 1_000_000]
+REPEAT = 10
+
+
+async def timed(func) -> tuple[dict, int]:
+    samples, size = [], 0
+    for _ in range(REPEAT):
+        start = time.perf_counter()
+        size = len(await func())
+        samples.append((time.perf_counter() - start) * 1000)
+    return summarize(samples), size
+
+
+async def run(size: int) -> None:
+    from app.db import close_db, init_db
+    from app.models.water import WaterLog
+    from app.services.report_data import bucket_series
+
+    _, path = temp_db_url()
+    await create_schema()
+    seed_logs(path, size)
+    await init_db(generate_schemas=False)
+
+    async def fetch_rows() -> dict:
+        # 예전 방식: 모든 행을 가져와 파이썬에서 날짜별로 합산
+        daily = defaultdict(int)
+        rows = await WaterLog.filter(user_id=1).order_by("logged_at").values_list("logged_at", "amount_ml")
+        for logged_at, amount in rows:
+            daily[logged_at.date()] += amount
+        return daily
+
+    try:
+        cases = {"rows -> python": fetch_rows}
+        for granularity in ("day", "week", "month"):
+            cases[f"sql {granularity}"] = lambda g=granularity: bucket_series("water", 1, g)
+        for name, func in cases.items():
+            stats, buckets = await timed(func)
+            print(f"{size:>10,} {name:>15}: {buckets:>6} buckets  p50={stats['p50']:>8}ms  p95={stats['p95']:>8}ms")
+    finally:
+        await close_db()
+
+
+async def main(sizes: list[int]) -> None:
+    for size in sizes:
+        await run(size)
+
+
+if __name__ == "__main__":
+    asyncio.run(main([int(arg) for arg in sys.argv[1:]] or DEFAULT_SIZES))
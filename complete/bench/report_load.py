@@ -0,0 +1,44 @@
+"""/report를 동시에 여러 번 호출하는 동안 /api/water 지연 시간을 측정합니다.
+
+    python -m bench.report_load [동시 리포트 수]
+"""
+
+import asyncio
+import sys
+import time
+
+from bench.common import app_client, create_schema, seed_logs, summarize, temp_db_url
+
+ROWS = 5_000
+API_CALLS = 50
+
+
+async def main(concurrency: int) -> None:
+    _, path = temp_db_url()
+    await create_schema()
+    seed_logs(path, ROWS)
+    async with app_client() as client:
+        await client.get("/report")  # 워커 프로세스 기동
+
+        async def api_loop() -> list[float]:
+            samples = []
+            for _ in range(API_CALLS):
+                start = time.perf_counter()
+                await client.get("/api/water")
+                samples.append((time.perf_counter() - start) * 1000)
+            return samples
+
+        idle = summarize(await api_loop())
+        start = time.perf_counter()
+        reports = [client.get("/report") for _ in range(concurrency)]
+        *responses, loaded = await asyncio.gather(*reports, api_loop())
+        elapsed = time.perf_counter() - start
+
+    statuses = sorted(response.status_code for response in responses)
+    print(f"/api/water idle     p50={idle['p50']}ms p95={idle['p95']}ms")
+    print(f"/api/water w/report p50={summarize(loaded)['p50']}ms p95={summarize(loaded)['p95']}ms")
+    print(f"{concurrency} concurrent /report in {elapsed:.2f}s, statuses={statuses}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main(int(sys.argv[1]) if len(sys.argv) > 1 else 8))
@@ -0,0 +1,54 @@
+"""/report 차트 한 장을 만드는 시간이 조회 기간 길이에 따라 어떻게 변하는지 측정합니다.
+
+집계 쿼리와 matplotlib 렌더링을 워커 풀 없이 같은 프로세스에서 순서대로 실행합니다.
+
+    python -m bench.report_render [기록 수]
+"""
+
+import asyncio
+import sys
+import tempfile
+import time
+from datetime import date, timedelta
+from pathlib import Path
+
+from bench.common import create_schema, seed_logs, summarize, temp_db_url
+
+DEFAULT_ROWS = 100_000  # 30분 간격이므로 약 5.7년치
+REPEAT = 5
+RANGES = {"1 week": 7, "30 days": 30, "1 year": 365, "5 years": 5 * 365}
+
+
+async def main(rows: int) -> None:
+    from app.db import close_db, init_db
+    from app.services.charts import build_water_report
+    from app.services.report_data import report_series, report_window
+
+    _, path = temp_db_url()
+    await create_schema()
+    seed_logs(path, rows)
+    await init_db(generate_schemas=False)
+    last_day = date(2020, 1, 1) + timedelta(days=5 * 365)
+    output = Path(tempfile.mkdtemp()) / "chart.png"
+    build_water_report([], str(output))  # matplotlib import 비용은 제외
+    try:
+        for name, days in RANGES.items():
+            window = report_window(last_day - timedelta(days=days - 1), last_day)
+            query, draw = [], []
+            for _ in range(REPEAT):
+                start = time.perf_counter()
+                points = await report_series("water", 1, window)
+                query.append((time.perf_counter() - start) * 1000)
+                start = time.perf_counter()
+                build_water_report(points, str(output))
+                draw.append((time.perf_counter() - start) * 1000)
+            print(
+                f"{name:>8}: {window.granularity:>5} x{window.stride} {len(points):>3} points  "
+                f"query p50={summarize(query)['p50']:>7}ms  render p50={summarize(draw)['p50']:>7}ms"
+            )
+    finally:
+        await close_db()
+
+
+if __name__ == "__main__":
+    asyncio.run(main(int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_ROWS))
@@ -0,0 +1,87 @@
+"""SQLite 튜닝 프로필별 동시 읽기/쓰기 처리량을 비교합니다.
+
+한 프로세스 안의 Tortoise 연결은 하나뿐이라 잠금 경합이 드러나지 않으므로,
+워커 프로세스 여러 개가 같은 DB 파일에 동시에 읽고 씁니다.
+
+    python -m bench.sqlite_profiles [쓰기 프로세스 수] [읽기 프로세스 수] [초]
+"""
+
+import asyncio
+import multiprocessing
+import os
+import sys
+import time
+
+from bench.common import create_schema, seed_logs, summarize, temp_db_url
+
+
+def worker(role: str, profile: str, db_url: str, duration: float, results) -> None:
+    os.environ["HEALTH_DB_PROFILE"] = profile
+    os.environ["HEALTH_DB_URL"] = db_url
+
+    async def run() -> dict:
+        from tortoise.exceptions import OperationalError
+
+        from app.db import close_db, init_db
+        from app.models.water import WaterLog
+
+        await init_db(generate_schemas=False)
+        ops, errors, samples = 0, 0, []
+        end = time.perf_counter() + duration
+        try:
+            while time.perf_counter() < end:
+                start = time.perf_counter()
+                try:
+                    if role == "write":
+                        await WaterLog.create(user_id=1, amount_ml=250)
+                    else:
+                        await WaterLog.filter(user_id=1).order_by("-logged_at").limit(50)
+                    ops += 1
+                except OperationalError:
+                    errors += 1
+                samples.append((time.perf_counter() - start) * 1000)
+        finally:
+            await close_db()
+        return {"role": role, "ops": ops, "errors": errors, "samples": samples}
+
+    results.put(asyncio.run(run()))
+
+
+async def prepare(profile: str) -> str:
+    os.environ["HEALTH_DB_PROFILE"] = profile
+    url, path = temp_db_url()
+    await create_schema()
+    seed_logs(path, 10_000)
+    return url
+
+
+def run_profile(profile: str, writers: int, readers: int, duration: float) -> None:
+    url = asyncio.run(prepare(profile))
+    ctx = multiprocessing.get_context("spawn")
+    results = ctx.Queue()
+    roles = ["write"] * writers + ["read"] * readers
+    procs = [ctx.Process(target=worker, args=(r, profile, url, duration, results)) for r in roles]
+    for proc in procs:
+        proc.start()
+    outcomes = [results.get() for _ in procs]
+    for proc in procs:
+        proc.join()
+    for role in ("write", "read"):
+        group = [o for o in outcomes if o["role"] == role]
+        ops = sum(o["ops"] for o in group)
+        errors = sum(o["errors"] for o in group)
+        stats = summarize([s for o in group for s in o["samples"]] or [0.0])
+        print(
+            f"{profile:>8} {role:>5}: {ops / duration:>8,.0f} ops/s  "
+            f"errors={errors:<5} p50={stats['p50']}ms p99={stats['p99']}ms"
+        )
+
+
+def main(writers: int, readers: int, duration: float) -> None:
+    for profile in ("default", "tuned"):
+        run_profile(profile, writers, readers, duration)
+
+
+if __name__ == "__main__":
+    args = [int(arg) for arg in sys.argv[1:]]
+    main(*(args + [4, 4, 5][len(args):]))
@@ -0,0 +1,68 @@
+"""콜드 스타트 비용을 측정합니다: app.main import 시간과 첫 /api/water 응답까지의 시간.
+
+매 회 새 인터프리터에서 측정하고, 무거운 분석 라이브러리가 웹 프로세스에
+미리 로드되면 실패합니다. 한도(ms)를 주면 첫 응답 시간 중앙값이 넘을 때도 실패합니다.
+
+    python -m bench.startup [반복 횟수] [첫 응답 한도 ms]
+"""
+
+import json
+import statistics
+import subprocess
+import sys
+
+HEAVY_MODULES = ("pandas", "matplotlib", "numpy")
+
+PROBE = """
+import asyncio, json, sys, time
+t0 = time.perf_counter()
+from app.main import app
+t1 = time.perf_counter()
+import httpx
+
+async def first_response():
+    async with app.router.lifespan_context(app):
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+            (await client.get("/api/water")).raise_for_status()
+
+asyncio.run(first_response())
+t2 = time.perf_counter()
+print(json.dumps({
+    "import_ms": (t1 - t0) * 1000,
+    "first_response_ms": (t2 - t0) * 1000,
+    "heavy": [m for m in %r if m in sys.modules],
+}))
+"""
+
+
+def probe(db_url: str) -> dict:
+    env = {"HEALTH_DB_URL": db_url, "PATH": "", "PYTHONWARNINGS": "ignore"}
+    output = subprocess.run(
+        [sys.executable, "-c", PROBE % (HEAVY_MODULES,)],
+        capture_output=True,
+        text=True,
+        check=True,
+        env=env,
+    ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def main(repeat: int, limit_ms: float | None) -> int:
+    from bench.common import temp_db_url
+
+    url, _ = temp_db_url()
+    runs = [probe(url) for _ in range(repeat)]
+    import_ms = statistics.median(run["import_ms"] for run in runs)
+    first_ms = statistics.median(run["first_response_ms"] for run in runs)
+    heavy = sorted({module for run in runs for module in run["heavy"]})
+    print(f"import app.main       median {import_ms:7.1f} ms")
+    print(f"first /api/water      median {first_ms:7.1f} ms")
+    print(f"heavy modules loaded: {heavy or 'none'}")
+    failed = bool(heavy) or (limit_ms is not None and first_ms > limit_ms)
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    args = sys.argv[1:]
+    sys.exit(main(int(args[0]) if args else 5, float(args[1]) if len(args) > 1 else None))
@@ -0,0 +1,362 @@
+"""모든 페이지/API 라우트의 지연 시간과 처리량 벤치마크.
+
+기록 수별로 새 SQLite DB를 시드하고, 앱을 ASGI로 직접 호출(네트워크 없음)해서
+라우트마다 p50/p95/p99 지연 시간과 동시 요청 처리량(req/s)을 잽니다. 결과는 JSON으로
+저장하고, 저장해 둔 기준 결과와 비교해 임계치 이상 느려진 라우트가 있으면 실패(종료
+코드 1)합니다. 4xx/5xx 응답이 나온 시나리오가 있어도 실패합니다. 어떤 시나리오도
+다루지 않는 라우트가 앱에 있으면 경고합니다.
+
+    python -m bench.suite --sizes 1000 100000 --out bench-results.json
+    python -m bench.suite --baseline bench-baseline.json --threshold 0.2
+"""
+
+import argparse
+import asyncio
+import itertools
+import json
+import os
+import platform
+import re
+import sys
+import tempfile
+import time
+from dataclasses import dataclass, field
+from datetime import date, datetime, timedelta, timezone
+
+from bench.common import app_client, create_schema, seed_logs, summarize, temp_db_url
+
+DEFAULT_SIZES = [1_000, 100_000]
+USER_ID = 1
+
+
+@dataclass
+class Scenario:
+    name: str
+    method: str
+    url: str | None = None
+    # 요청마다 URL이나 본문이 바뀌어야 하는 경우(삭제할 id, 기간 등)에 씁니다.
+    url_factory: object = None
+    kwargs: dict = field(default_factory=dict)
+    kwargs_factory: object = None
+    # 데이터를 바꾸는 시나리오는 동시 처리량 측정을 건너뜁니다.
+    mutates: bool = False
+
+    def next_url(self) -> str:
+        return self.url_factory() if self.url_factory else self.url
+
+    def next_kwargs(self) -> dict:
+        return self.kwargs_factory() if self.kwargs_factory else self.kwargs
+
+
+LOG_FORMS = {
+    "water": ({"amount_ml": 300}, {"amount_ml": 350, "logged_at": "2020-01-02T08:00"}),
+    "exercise": (
+        {"activity": "걷기", "duration_min": 30, "calories_burned": 120},
+        {"activity": "달리기", "duration_min": 40, "calories_burned": 300, "logged_at": "2020-01-02T08:00"},
+    ),
+    "sleep": (
+        {"sleep_date": "2020-01-01", "start_time": "2020-01-01T23:00", "end_time": "2020-01-02T07:00", "quality": 4},
+        {"sleep_date": "2020-01-01", "start_time": "2020-01-01T22:30", "end_time": "2020-01-02T06:30", "quality": 3},
+    ),
+    "meal": (
+        {"meal_type": "점심", "calories": 600, "note": ""},
+        {"meal_type": "저녁", "calories": 700, "note": "", "eaten_at": "2020-01-02T19:00"},
+    ),
+}
+API_ITEMS = {
+    "water": {"user_id": USER_ID, "amount_ml": 250},
+    "exercise": {"user_id": USER_ID, "activity": "걷기", "duration_min": 30, "calories_burned": 120},
+    "sleep": {
+        "user_id": USER_ID,
+        "sleep_date": "2020-01-01",
+        "start_time": "2020-01-01T23:00:00Z",
+        "end_time": "2020-01-02T07:00:00Z",
+        "quality": 4,
+    },
+    "meal": {"user_id": USER_ID, "meal_type": "간식", "calories": 200, "note": None},
+}
+# 폼 요청이 리다이렉트 대신 기록 한 줄(조각)을 받게 합니다.
+FRAGMENT_HEADERS = {"HX-Request": "true"}
+# 배치 수정 폼에서 바꿀 값 (빈 칸은 그대로)
+BATCH_FORMS = {
+    "water": {"amount_ml": "320"},
+    "exercise": {"duration_min": "35"},
+    "sleep": {"quality": "5"},
+    "meal": {"meal_type": "간식"},
+}
+API_UPDATES = {
+    "water": {"amount_ml": 333},
+    "exercise": {"duration_min": 50},
+    "sleep": {"quality": 2},
+    "meal": {"calories": 640, "note": "수정"},
+}
+
+
+def deep_cursor(kind: str) -> str:
+    """시드 중간(2020-06-01)부터 읽는 "더 보기" 커서. 10만 건 시드면 수천 건 아래입니다."""
+    from app.services.pagination import encode_cursor
+
+    if kind == "sleep":
+        return encode_cursor(date(2020, 6, 1), 2**31)
+    return encode_cursor(datetime(2020, 6, 1, tzinfo=timezone.utc), 2**31)
+
+
+def scenarios(chart_url: str | None) -> list[Scenario]:
+    """읽기 시나리오를 먼저, 데이터를 바꾸는 시나리오를 나중에 둡니다."""
+    reads = [
+        Scenario("GET /", "GET", "/"),
+        *(Scenario(f"GET /{kind}", "GET", f"/{kind}") for kind in LOG_FORMS),
+        *(Scenario(f"GET /{kind}/rows deep", "GET", f"/{kind}/rows?cursor={deep_cursor(kind)}") for kind in LOG_FORMS),
+        Scenario("GET /report", "GET", "/report"),
+        Scenario("GET /report 1y weekly", "GET", "/report?from=2020-01-01&to=2020-12-31&granularity=week"),
+        *(Scenario(f"GET /api/{kind}", "GET", f"/api/{kind}") for kind in LOG_FORMS),
+        Scenario("GET /api/water user 500", "GET", f"/api/water?user_id={USER_ID}&limit=500"),
+        *(
+            Scenario(f"GET /api/timeseries/{metric}", "GET", f"/api/timeseries/{metric}?user_id={USER_ID}&from=2020-01-01")
+            for metric in ("water", "exercise", "sleep", "meal")
+        ),
+        Scenario("GET /api/export water ndjson", "GET", f"/api/export?user_id={USER_ID}&kind=water"),
+        Scenario("GET /api/export all csv", "GET", f"/api/export?user_id={USER_ID}&format=csv"),
+        Scenario("GET /static css", "GET", "/static/css/styles.css"),
+    ]
+    if chart_url:
+        reads.append(Scenario("GET /report/charts", "GET", chart_url))
+
+    writes = []
+    for kind, (create_form, edit_form) in LOG_FORMS.items():
+        # 시드된 id를 1번부터 하나씩, 배치 삭제는 시드 열흘째부터 하루치씩 지웁니다.
+        ids = itertools.count(1)
+        days = (date(2020, 1, 10) + timedelta(days=n) for n in itertools.count())
+
+        def day_range(days=days) -> dict:
+            day = next(days).isoformat()
+            return {"from": day, "to": day}
+
+        writes += [
+            Scenario(f"POST /{kind}", "POST", f"/{kind}", kwargs={"data": create_form}, mutates=True),
+            Scenario(f"POST /{kind}/{{id}}/edit", "POST", f"/{kind}/1/edit", kwargs={"data": edit_form}, mutates=True),
+            Scenario(
+                f"POST /{kind} fragment",
+                "POST",
+                f"/{kind}",
+                kwargs={"data": create_form, "headers": FRAGMENT_HEADERS},
+                mutates=True,
+            ),
+            Scenario(
+                f"POST /{kind}/{{id}}/edit fragment",
+                "POST",
+                f"/{kind}/2/edit",
+                kwargs={"data": edit_form, "headers": FRAGMENT_HEADERS},
+                mutates=True,
+            ),
+            Scenario(
+                f"PATCH /api/{kind}/{{id}}",
+                "PATCH",
+                f"/api/{kind}/1?user_id={USER_ID}",
+                kwargs={"json": API_UPDATES[kind]},
+                mutates=True,
+            ),
+            Scenario(
+                f"POST /{kind}/{{id}}/delete",
+                "POST",
+                url_factory=lambda kind=kind, ids=ids: f"/{kind}/{next(ids)}/delete",
+                mutates=True,
+            ),
+            Scenario(
+                f"POST /{kind}/{{id}}/delete fragment",
+                "POST",
+                url_factory=lambda kind=kind, ids=ids: f"/{kind}/{next(ids)}/delete",
+                kwargs={"headers": FRAGMENT_HEADERS},
+                mutates=True,
+            ),
+            Scenario(
+                f"DELETE /api/{kind}/{{id}}",
+                "DELETE",
+                url_factory=lambda kind=kind, ids=ids: f"/api/{kind}/{next(ids)}?user_id={USER_ID}",
+                mutates=True,
+            ),
+            Scenario(
+                f"POST /{kind}/batch-edit 1 day",
+                "POST",
+                f"/{kind}/batch-edit",
+                kwargs={"data": {"from": "2020-01-02", "to": "2020-01-02", **BATCH_FORMS[kind]}},
+                mutates=True,
+            ),
+            Scenario(
+                f"POST /api/{kind}/batch-update 1 day",
+                "POST",
+                f"/api/{kind}/batch-update",
+                kwargs={
+                    "json": {"user_id": USER_ID, "from": "2020-01-03", "to": "2020-01-03", "changes": API_UPDATES[kind]}
+                },
+                mutates=True,
+            ),
+            Scenario(
+                f"POST /{kind}/batch-delete 1 day",
+                "POST",
+                f"/{kind}/batch-delete",
+                kwargs_factory=lambda day_range=day_range: {"data": day_range()},
+                mutates=True,
+            ),
+            Scenario(
+                f"POST /api/{kind}/batch-delete 1 day",
+                "POST",
+                f"/api/{kind}/batch-delete",
+                kwargs_factory=lambda day_range=day_range: {"json": {"user_id": USER_ID, **day_range()}},
+                mutates=True,
+            ),
+            Scenario(f"POST /api/{kind}", "POST", f"/api/{kind}", kwargs={"json": API_ITEMS[kind]}, mutates=True),
+            Scenario(
+                f"POST /api/{kind}/bulk x100",
+                "POST",
+                f"/api/{kind}/bulk",
+                kwargs={"json": [API_ITEMS[kind]] * 100},
+                mutates=True,
+            ),
+        ]
+    return reads + writes
+
+
+async def measure(client, scenario: Scenario, repeat: int, budget: float, concurrency: int) -> dict:
+    for _ in range(2):  # 예열
+        await client.request(scenario.method, scenario.next_url(), **scenario.next_kwargs())
+
+    samples, statuses = [], set()
+    began = time.perf_counter()
+    while len(samples) < repeat and (len(samples) < 5 or time.perf_counter() - began < budget):
+        start = time.perf_counter()
+        response = await client.request(scenario.method, scenario.next_url(), **scenario.next_kwargs())
+        samples.append((time.perf_counter() - start) * 1000)
+        statuses.add(response.status_code)
+    result = {**summarize(samples), "statuses": sorted(statuses)}
+
+    if not scenario.mutates and concurrency > 1:
+        count = len(samples)
+        remaining = iter(range(count))
+
+        async def worker() -> None:
+            for _ in remaining:
+                await client.request(scenario.method, scenario.next_url(), **scenario.next_kwargs())
+
+        start = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+        result["rps"] = round(count / (time.perf_counter() - start), 1)
+    return result
+
+
+def uncovered_routes(app, tried: list[tuple[str, str]]) -> list[str]:
+    from starlette.routing import Match
+
+    missing = []
+    for route in app.routes:
+        methods = getattr(route, "methods", None) or {"GET"}
+        for method in sorted(methods - {"HEAD"}):
+            if route.path in ("/openapi.json", "/docs", "/docs/oauth2-redirect", "/redoc"):
+                continue
+            hit = any(
+                route.matches({"type": "http", "method": m, "path": path.split("?")[0]})[0] == Match.FULL
+                for m, path in tried
+                if m == method
+            )
+            if not hit:
+                missing.append(f"{method} {route.path}")
+    return missing
+
+
+async def run_size(size: int, args) -> dict:
+    from app.main import app
+
+    _, path = temp_db_url()
+    await create_schema()
+    seed_logs(path, size, user_id=USER_ID)
+    results, tried = {}, []
+    async with app_client() as client:
+        report = await client.get("/report")
+        match = re.search(r'<img src="([^"]+)"', report.text)
+        for scenario in scenarios(match and match.group(1)):
+            if args.only and not re.search(args.only, scenario.name):
+                continue
+            result = await measure(client, scenario, args.repeat, args.budget, args.concurrency)
+            results[scenario.name] = result
+            tried.append((scenario.method, scenario.url or scenario.url_factory()))
+            print(
+                f"{size:>9,} {scenario.name:<34} p50={result['p50']:>9}ms p95={result['p95']:>9}ms "
+                f"p99={result['p99']:>9}ms rps={result.get('rps', '-'):>8} {result['statuses']}",
+                flush=True,
+            )
+    if not args.only:
+        for route in uncovered_routes(app, tried):
+            print(f"WARNING: no scenario covers {route}")
+    return results
+
+
+def compare(current: dict, baseline: dict, metric: str, threshold: float, min_delta_ms: float) -> list[str]:
+    """기준보다 threshold 비율 이상, min_delta_ms 이상 느려진 (크기, 시나리오) 목록."""
+    regressions = []
+    for size, routes in current["results"].items():
+        for name, result in routes.items():
+            base = baseline["results"].get(size, {}).get(name)
+            if base is None:
+                continue
+            before, after = base[metric], result[metric]
+            if after > before * (1 + threshold) and after - before >= min_delta_ms:
+                regressions.append(f"{size} {name}: {metric} {before}ms -> {after}ms (+{(after / before - 1) * 100:.0f}%)")
+    return regressions
+
+
+def parse_args(argv: list[str]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES, help="테이블당 기록 수")
+    parser.add_argument("--repeat", type=int, default=30, help="시나리오별 최대 요청 수")
+    parser.add_argument("--budget", type=float, default=5.0, help="시나리오별 측정 시간 한도(초, 최소 5회)")
+    parser.add_argument("--concurrency", type=int, default=8, help="처리량 측정 동시 요청 수")
+    parser.add_argument("--only", help="이름이 이 정규식에 맞는 시나리오만 실행")
+    parser.add_argument("--out", default="bench-results.json", help="결과 JSON 경로")
+    parser.add_argument("--baseline", help="비교할 기준 결과 JSON")
+    parser.add_argument("--metric", default="p50", choices=["p50", "p95", "p99", "mean"])
+    parser.add_argument("--threshold", type=float, default=0.2, help="허용하는 느려짐 비율")
+    parser.add_argument("--min-delta-ms", type=float, default=1.0, help="이보다 작은 차이는 무시")
+    return parser.parse_args(argv)
+
+
+async def main(argv: list[str]) -> int:
+    args = parse_args(argv)
+    os.environ.setdefault("HEALTH_CHART_CACHE_DIR", tempfile.mkdtemp(prefix="health-charts-"))
+    current = {
+        "meta": {
+            "created_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "repeat": args.repeat,
+            "concurrency": args.concurrency,
+        },
+        "results": {},
+    }
+    for size in args.sizes:
+        current["results"][str(size)] = await run_size(size, args)
+    errors = [
+        f"{size} {name}: {result['statuses']}"
+        for size, routes in current["results"].items()
+        for name, result in routes.items()
+        if max(result["statuses"]) >= 400
+    ]
+    for line in errors:
+        print(f"ERROR {line}")
+
+    with open(args.out, "w", encoding="utf-8") as file:
+        json.dump(current, file, ensure_ascii=False, indent=2)
+    print(f"results written to {args.out}")
+
+    if not args.baseline:
+        return 1 if errors else 0
+    with open(args.baseline, encoding="utf-8") as file:
+        baseline = json.load(file)
+    regressions = compare(current, baseline, args.metric, args.threshold, args.min_delta_ms)
+    for line in regressions:
+        print(f"REGRESSION {line}")
+    print(f"{len(regressions)} regressions against {args.baseline} (threshold {args.threshold:.0%})")
+    return 1 if regressions or errors else 0
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main(sys.argv[1:])))
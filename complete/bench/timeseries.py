@@ -0,0 +1,60 @@
+"""PNG 차트 경로와 /api/timeseries JSON 경로의 서버 비용을 비교합니다.
+
+PNG 쪽은 /report가 하는 일(집계 + matplotlib 렌더링)을 워커 풀 없이 같은 프로세스에서
+실행하고, JSON 쪽은 /api/timeseries/water 요청 전체를 잽니다. 응답 크기도 함께 봅니다.
+
+    python -m bench.timeseries [기록 수]
+"""
+
+import asyncio
+import sys
+import tempfile
+import time
+from datetime import date, timedelta
+from pathlib import Path
+
+from bench.common import app_client, create_schema, seed_logs, summarize, temp_db_url, time_requests
+
+DEFAULT_ROWS = 1_000_000  # 30분 간격이므로 약 57년치
+REPEAT = 5
+MAX_POINTS = 500
+LAST_DAY = date(2039, 12, 31)
+RANGES = {"30 days": (30, "day"), "1 year": (365, "day"), "10 years": (3652, "day"), "50 years": (18262, "week")}
+
+
+async def main(rows: int) -> None:
+    from app.services.charts import build_water_report
+    from app.services.report_data import report_series, report_window
+
+    _, path = temp_db_url()
+    await create_schema()
+    seed_logs(path, rows)
+    output = Path(tempfile.mkdtemp()) / "chart.png"
+    build_water_report([], str(output))  # matplotlib import 비용은 제외
+
+    print(f"{'range':>9} {'png p50':>10} {'png KB':>7} {'json p50':>10} {'json KB':>8} {'points':>7}")
+    async with app_client() as client:
+        for name, (days, granularity) in RANGES.items():
+            start = LAST_DAY - timedelta(days=days - 1)
+            window = report_window(start, LAST_DAY)
+            png = []
+            for _ in range(REPEAT):
+                began = time.perf_counter()
+                build_water_report(await report_series("water", 1, window), str(output))
+                png.append((time.perf_counter() - began) * 1000)
+
+            url = (
+                f"/api/timeseries/water?user_id=1&from={start}&to={LAST_DAY}"
+                f"&granularity={granularity}&max_points={MAX_POINTS}"
+            )
+            response = await client.get(url)
+            samples = await time_requests(client, "GET", url, REPEAT)
+            print(
+                f"{name:>9} {summarize(png)['p50']:>8}ms {output.stat().st_size / 1024:>7.1f} "
+                f"{summarize(samples)['p50']:>8}ms {len(response.content) / 1024:>8.1f} "
+                f"{len(response.json()['x']):>7}"
+            )
+
+
+if __name__ == "__main__":
+    asyncio.run(main(int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_ROWS))
@@ -0,0 +1,79 @@
+"""UTC가 아닌 오프셋으로 시각을 고친 기록이 UTC로 저장되는지 확인합니다.
+
+타임스탬프는 문자열로 비교하므로 오프셋이 남으면 정렬과 기간 조건이 어긋납니다.
+30분 간격으로 시드한 기록의 시각을 PATCH와 batch-update로 +09:00 시각으로 고친 뒤
+저장된 값, 목록 API의 최신순 정렬, from/to 기간 조건이 모두 실제 시각(UTC)과 맞는지
+봅니다. 틀리면 종료 코드 1.
+
+    python -m bench.update_timezone
+"""
+
+import asyncio
+import sqlite3
+import sys
+from datetime import datetime
+
+from bench.common import app_client, create_schema, seed_logs, temp_db_url
+
+USER_ID = 1
+# (id, 보낼 시각, 실제 UTC 시각) -- 시드는 2020-01-01 00:00Z부터 30분 간격
+PATCHES = [(10, "2020-01-01T10:00:00+09:00", "2020-01-01 01:00:00+00:00")]
+BATCH_UPDATES = [(12, "2020-01-01T09:50:00+09:00", "2020-01-01 00:50:00+00:00")]
+
+
+def stored_times(path) -> dict[int, str]:
+    conn = sqlite3.connect(path)
+    rows = dict(conn.execute('SELECT id, logged_at FROM "waterlog"').fetchall())
+    conn.close()
+    return rows
+
+
+async def listed_ids(client, **params) -> list[int]:
+    response = await client.get("/api/water", params={"user_id": USER_ID, "limit": 200, **params})
+    response.raise_for_status()
+    return [row["id"] for row in response.json()]
+
+
+async def main() -> int:
+    _, path = temp_db_url()
+    await create_schema()
+    seed_logs(path, 20, user_id=USER_ID)
+    failed = False
+    async with app_client() as client:
+        for log_id, sent, _ in PATCHES:
+            response = await client.patch(
+                f"/api/water/{log_id}", params={"user_id": USER_ID}, json={"logged_at": sent}
+            )
+            response.raise_for_status()
+        for log_id, sent, _ in BATCH_UPDATES:
+            body = {"user_id": USER_ID, "ids": [log_id], "changes": {"logged_at": sent}}
+            response = await client.post("/api/water/batch-update", json=body)
+            response.raise_for_status()
+
+        stored = stored_times(path)
+        for log_id, sent, expected in PATCHES + BATCH_UPDATES:
+            ok = stored[log_id] == expected
+            failed |= not ok
+            print(f"[{'ok' if ok else 'FAIL'}] id={log_id} sent {sent} stored {stored[log_id]!r}")
+
+        # 실제 시각 기준 최신순(같으면 id 내림차순)이 API 순서와 같아야 합니다.
+        actual = {log_id: datetime.fromisoformat(value) for log_id, value in stored.items()}
+        expected_order = sorted(actual, key=lambda log_id: (actual[log_id], log_id), reverse=True)
+        ok = await listed_ids(client) == expected_order
+        failed |= not ok
+        print(f"[{'ok' if ok else 'FAIL'}] newest-first order")
+
+        start, end = "2020-01-01T00:45:00Z", "2020-01-01T01:15:00Z"
+        expected_range = sorted(
+            (log_id for log_id, at in actual.items() if datetime.fromisoformat(start) <= at < datetime.fromisoformat(end)),
+            key=lambda log_id: (actual[log_id], log_id),
+            reverse=True,
+        )
+        ok = await listed_ids(client, **{"from": start, "to": end}) == expected_range
+        failed |= not ok
+        print(f"[{'ok' if ok else 'FAIL'}] from/to range {start}..{end}: ids {expected_range}")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main()))
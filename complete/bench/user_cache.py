@@ -0,0 +1,54 @@
+"""페이지 요청마다 실행되는 SQL 수를 세어 기본 사용자 캐시가 동작하는지 확인합니다.
+
+sqlite3 trace 콜백으로 실제 실행된 문장을 모두 기록합니다. 첫 요청 뒤에는
+"user" 테이블 조회가 더 이상 없어야 합니다.
+
+    python -m bench.user_cache
+"""
+
+import asyncio
+import sys
+
+from tortoise import connections
+
+from bench.common import app_client, create_schema, temp_db_url
+
+PAGES = ["/", "/water", "/exercise", "/sleep", "/meal"]
+
+
+async def trace_statements(statements: list[str]) -> None:
+    conn = connections.get("default")
+    await conn.create_connection(with_db=True)
+    raw = conn._connection
+    # sqlite3 연결은 aiosqlite 전용 스레드에서만 만질 수 있습니다.
+    await raw._execute(raw._conn.set_trace_callback, statements.append)
+
+
+async def main() -> int:
+    temp_db_url()
+    await create_schema()
+    statements: list[str] = []
+    failed = False
+    async with app_client() as client:
+        await trace_statements(statements)
+        await asyncio.gather(*(client.get("/") for _ in range(5)))
+        for url in PAGES:
+            statements.clear()
+            response = await client.get(url)
+            response.raise_for_status()
+            user_queries = [sql for sql in statements if 'FROM "user"' in sql]
+            failed |= bool(user_queries)
+            print(
+                f"[{'FAIL' if user_queries else 'ok'}] GET {url}: {len(statements)} queries, "
+                f"{len(user_queries)} user lookups"
+            )
+        user_count = await connections.get("default").execute_query_dict(
+            'SELECT COUNT(*) AS n FROM "user"'
+        )
+    failed |= user_count[0]["n"] != 1
+    print(f"users after 5 concurrent first requests: {user_count[0]['n']}")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main()))
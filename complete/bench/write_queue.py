@@ -0,0 +1,109 @@
+"""동시 단건 입력 처리량: 요청마다 트랜잭션(기본) vs write-behind 큐.
+
+설정마다 별도 프로세스를 띄워(환경 변수는 import 시점에 읽힘) CONCURRENCY개의 클라이언트가
+합계 TOTAL건을 POST합니다. lifespan이 끝난 뒤(큐 비우기 포함) DB의 행 수가 보낸 건수와
+같은지 확인하고, 배치 중 한 건이 실패해도 나머지는 저장되는지도 확인합니다.
+
+    python -m bench.write_queue
+"""
+
+import asyncio
+import json
+import os
+import sqlite3
+import subprocess
+import sys
+import time
+
+from bench.common import app_client, create_schema, seed_logs, summarize, temp_db_url
+
+TOTAL = 2_000
+CONCURRENCY = 64
+CONFIGS = [
+    ("direct, default profile", {"HEALTH_DB_PROFILE": "default"}),
+    ("write-behind, default profile", {"HEALTH_DB_PROFILE": "default", "HEALTH_WRITE_BEHIND": "1"}),
+    ("direct, tuned profile", {"HEALTH_DB_PROFILE": "tuned"}),
+    ("write-behind, tuned profile", {"HEALTH_DB_PROFILE": "tuned", "HEALTH_WRITE_BEHIND": "1"}),
+    (
+        "write-behind enqueue, form posts",
+        {"HEALTH_DB_PROFILE": "tuned", "HEALTH_WRITE_BEHIND": "1", "HEALTH_WRITE_DURABILITY": "enqueue"},
+    ),
+]
+
+
+async def check_failure_isolation() -> bool:
+    """없는 user_id 한 건이 섞여도 같은 배치의 다른 행은 저장돼야 합니다."""
+    from app.models.water import WaterLog
+    from app.services.write_queue import create_log
+
+    results = await asyncio.gather(
+        *(create_log(WaterLog, user_id=999_999 if i == 5 else 1, amount_ml=100) for i in range(20)),
+        return_exceptions=True,
+    )
+    failed = [result for result in results if isinstance(result, Exception)]
+    ids = [result.id for result in results if not isinstance(result, Exception)]
+    return len(failed) == 1 and len(set(ids)) == 19
+
+
+async def child() -> None:
+    _, path = temp_db_url()
+    await create_schema()
+    seed_logs(path, 0)
+    form = os.environ.get("HEALTH_WRITE_DURABILITY") == "enqueue"
+    samples: list[float] = []
+    remaining = iter(range(TOTAL))
+
+    async with app_client() as client:
+        isolated = await check_failure_isolation()
+        # 기본 사용자 캐시를 채워 둡니다. 비어 있으면 첫 요청들이 잠금 앞에 줄을 서서
+        # 콜드 스타트 비용이 처리량 비교에 섞입니다.
+        await client.get("/water")
+
+        async def worker() -> None:
+            for _ in remaining:
+                start = time.perf_counter()
+                if form:
+                    response = await client.post("/water", data={"amount_ml": 250})
+                else:
+                    response = await client.post("/api/water", json={"user_id": 1, "amount_ml": 250})
+                samples.append((time.perf_counter() - start) * 1000)
+                assert response.status_code in (200, 303), response.status_code
+                # 실제 서버에서는 소켓 I/O에서 양보하지만 인프로세스 호출은 DB를 기다리지 않는
+                # 요청(enqueue)이면 한 번도 양보하지 않아 다른 클라이언트를 굶깁니다.
+                await asyncio.sleep(0)
+
+        began = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(CONCURRENCY)))
+        elapsed = time.perf_counter() - began
+
+    conn = sqlite3.connect(path)
+    stored = conn.execute('SELECT COUNT(*) FROM "waterlog" WHERE amount_ml = 250').fetchone()[0]
+    conn.close()
+    print(json.dumps({"rps": round(TOTAL / elapsed), **summarize(samples), "stored": stored, "isolated": isolated}))
+
+
+def main() -> int:
+    failed = False
+    for name, env in CONFIGS:
+        output = subprocess.run(
+            [sys.executable, "-W", "ignore", "-m", "bench.write_queue", "--child"],
+            env={**os.environ, **env},
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout
+        result = json.loads(output.strip().splitlines()[-1])
+        ok = result["stored"] == TOTAL and result["isolated"]
+        failed |= not ok
+        print(
+            f"[{'ok' if ok else 'FAIL'}] {name:<34} {result['rps']:>6} req/s  p50={result['p50']}ms "
+            f"p99={result['p99']}ms  stored={result['stored']}/{TOTAL}"
+        )
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    if "--child" in sys.argv:
+        asyncio.run(child())
+    else:
+        sys.exit(main())